@@ -6,16 +6,99 @@ oleh client melalui koneksi socket TCP. File diterima dalam
 bentuk binary dan disimpan ke direktori tempat script ini dijalankan.
 
 Script ini digunakan sebagai pasangan dari modul TransferData
-pada aplikasi utama.
+pada aplikasi utama. Ukuran buffer penerimaan, SO_RCVBUF, SO_SNDBUF,
+dan TCP_NODELAY dapat diatur melalui argumen command line.
+
+Jika baris pertama diawali RANGE_PREFIX, client mengirim file melalui
+beberapa koneksi paralel. Baris tersebut berisi JSON dengan nama file,
+ukuran total, offset, panjang rentang, dan jumlah koneksi. Server
+mengalokasikan file sesuai ukuran total (os.posix_fallocate jika
+tersedia, selain itu truncate), menerima seluruh koneksi,
+lalu setiap thread menulis rentangnya langsung ke posisinya.
+
+Jika baris pertama diawali RESUME_PREFIX, file dikirim dalam mode yang
+dapat dilanjutkan. Header berisi nama, ukuran, hash SHA-256, dan
+ukuran chunk. Server membalas "OFFSET <n>" berisi jumlah byte yang
+sudah tersimpan dari unggahan sebelumnya (file .part dan state
+JSON-nya), lalu client mengirim sisa file sebagai frame
+(offset, panjang, CRC32, isi). Frame dengan panjang nol menandai
+akhir pengiriman; server membalas "BAD <daftar offset>" untuk chunk
+yang rusak atau belum diterima, atau "OK" setelah hash SHA-256 file
+cocok. Jika koneksi terputus, server menunggu client menyambung lagi.
 """
 
 import socket
 import argparse
+import errno
+import hashlib
+import json
 import os
+import stat
+import struct
+import threading
+import zlib
 
 # Folder default penyimpanan file (lokasi script berada)
 DEFAULT_SAVE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Ukuran buffer setiap penerimaan data
+RECV_CHUNK_SIZE = 256 * 1024
+
+# Awalan baris header setiap koneksi pada mode paralel
+RANGE_PREFIX = "#RANGE "
+
+# Jumlah koneksi yang boleh mengantri sebelum diterima
+LISTEN_BACKLOG = 16
+
+# Batas waktu (detik) menunggu koneksi rentang berikutnya
+RANGE_ACCEPT_TIMEOUT = 60
+
+# Awalan baris header pada mode yang dapat dilanjutkan
+RESUME_PREFIX = "#RESUME "
+
+# Akhiran file yang belum selesai diterima dan file state-nya
+PART_SUFFIX = ".part"
+STATE_SUFFIX = ".json"
+
+# Header setiap frame: offset, panjang isi, dan CRC32 isi
+FRAME_HEADER = struct.Struct(">QII")
+
+# Interval (byte) penyimpanan state unggahan ke disk
+RESUME_CHECKPOINT = 16 * 1024 * 1024
+
+# Batas waktu (detik) menunggu client menyambung kembali
+RESUME_WAIT_TIMEOUT = 300
+
+# Ukuran chunk terbesar yang diterima dari header mode resume, agar
+# client tidak dapat memaksa server mengalokasikan buffer raksasa
+MAX_RESUME_CHUNK_SIZE = 64 * 1024 * 1024
+
+# Awalan baris header pada mode folder
+TREE_PREFIX = "#TREE "
+
+# Header setiap frame mode folder: jenis, panjang path, mode, mtime, ukuran isi
+TREE_FRAME = struct.Struct(">BHIQQ")
+
+# Jenis frame mode folder
+FRAME_END = 0
+FRAME_FILE = 1
+FRAME_DIR = 2
+FRAME_LINK = 3
+
+
+def configure_socket(s, rcvbuf=None, sndbuf=None, nodelay=False):
+    """
+    Menerapkan SO_RCVBUF, SO_SNDBUF, dan TCP_NODELAY pada socket.
+    Diatur pada socket server sebelum listen sehingga diwarisi oleh
+    socket koneksi client.
+    """
+    if rcvbuf:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+    if sndbuf:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, sndbuf)
+    if nodelay:
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
 
 def recv_until_newline(conn):
     """
@@ -36,64 +119,552 @@ def recv_until_newline(conn):
     return buffer.decode("utf-8")
 
 
-def main():
+def write_at(fd, data, offset):
     """
-    Server akan listening koneksi client, menerima nama file,
-    lalu menerima isi file dalam bentuk binary hingga selesai,
-    dan menyimpannya ke folder lokal server.
+    Menulis data ke fd mulai dari offset. Memakai os.pwrite jika
+    tersedia; selain itu memakai lseek lalu write (aman karena setiap
+    thread memiliki fd sendiri).
     """
-    parser = argparse.ArgumentParser(
-        description="Simple File Receiver Server"
-    )
+    while data:
+        if hasattr(os, "pwrite"):
+            written = os.pwrite(fd, data, offset)
+        else:
+            os.lseek(fd, offset, os.SEEK_SET)
+            written = os.write(fd, data)
 
-    parser.add_argument(
-        "--host", "-H",
-        type=str,
-        default="localhost",
-        help="Host untuk server (default: localhost)"
-    )
+        data = data[written:]
+        offset += written
 
-    parser.add_argument(
-        "--port", "-P",
-        type=int,
-        default=5000,
-        help="Port untuk server (default: 5000)"
-    )
 
-    args = parser.parse_args()
+def preallocate(f, size):
+    """
+    Mengalokasikan ruang disk untuk file f sebesar size byte.
+    Memakai os.posix_fallocate jika tersedia sehingga blok benar-benar
+    dipesan di disk (disk penuh terdeteksi di awal dan file tidak
+    terfragmentasi oleh penulisan rentang paralel). Jika tidak tersedia
+    (misalnya Windows/macOS) atau tidak didukung filesystem, memakai
+    truncate yang hanya mengatur ukuran file (sparse).
+    """
+    if size and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError as e:
+            if e.errno not in (errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+
+    f.truncate(size)
+
+
+def receive_range(conn, filepath, header, chunk_size, results):
+    """
+    Menerima satu rentang byte dari conn dan menulisnya ke posisinya
+    pada filepath. Jumlah byte yang diterima dicatat ke results.
+    Dijalankan pada thread tersendiri untuk setiap koneksi.
+    """
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    offset = header["offset"]
+    remaining = header["length"]
+
+    fd = os.open(filepath, os.O_WRONLY | getattr(os, "O_BINARY", 0))
+    try:
+        while remaining:
+            size = conn.recv_into(buffer, min(chunk_size, remaining))
+            if not size:
+                break
+
+            write_at(fd, view[:size], offset)
+            offset += size
+            remaining -= size
+    finally:
+        os.close(fd)
+        conn.close()
+
+    results[header["offset"]] = header["length"] - remaining
+
+
+def receive_ranges(s, conn, header, save_dir, chunk_size):
+    """
+    Menerima file yang dikirim melalui header["count"] koneksi paralel.
+    conn adalah koneksi pertama yang header-nya sudah dibaca; koneksi
+    lainnya diterima dari socket server s. File dialokasikan lebih dulu
+    melalui preallocate (posix_fallocate, atau truncate sebagai cadangan).
+    Mengembalikan path file yang disimpan.
+    Melempar ValueError jika nama file dari client tidak aman.
+    """
+    filename = header["name"]
+    try:
+        filepath = safe_path(save_dir, filename)
+    except ValueError:
+        conn.close()
+        raise
+    total_size = header["size"]
+
+    print(f"[INFO] Nama file diterima: {filename}")
+    print(f"[INFO] Mode paralel: {header['count']} koneksi, {total_size} byte")
+    print(f"[INFO] Menyimpan ke: {filepath}")
+
+    # Mengalokasikan file sesuai ukuran total sebelum rentang ditulis
+    with open(filepath, "wb") as f:
+        preallocate(f, total_size)
+
+    expected = {header["offset"]: header["length"]}
+    results = {}
+    threads = []
+
+    def start(conn, header):
+        """
+        Memeriksa header rentang lalu menerima isinya pada thread baru.
+        """
+        if header["name"] != filename or header["size"] != total_size:
+            conn.close()
+            raise ValueError(f"Range header does not match {filename}: {header}")
+        if header["offset"] < 0 or header["offset"] + header["length"] > total_size:
+            conn.close()
+            raise ValueError(f"Range outside file size: {header}")
+
+        thread = threading.Thread(target=receive_range, args=(conn, filepath, header, chunk_size, results))
+        thread.start()
+        threads.append(thread)
+
+    start(conn, header)
+
+    # Menerima koneksi rentang lainnya
+    s.settimeout(RANGE_ACCEPT_TIMEOUT)
+    try:
+        for _ in range(header["count"] - 1):
+            conn, addr = s.accept()
+            conn.settimeout(None)
+            print(f"[CONNECTED] Client: {addr}")
+
+            line = recv_until_newline(conn).strip()
+            if not line.startswith(RANGE_PREFIX):
+                conn.close()
+                raise ValueError(f"Expected range header, got: {line}")
+
+            other = json.loads(line[len(RANGE_PREFIX):])
+            expected[other["offset"]] = other["length"]
+            start(conn, other)
+    finally:
+        for thread in threads:
+            thread.join()
+
+    # Memastikan setiap rentang diterima utuh
+    missing = [offset for offset, length in expected.items() if results.get(offset) != length]
+    if missing or sum(expected.values()) != total_size:
+        raise ConnectionError(f"Incomplete parallel transfer of {filename}: ranges at {sorted(missing)}")
+
+    return filepath
+
+
+def recv_exact(conn, view):
+    """
+    Mengisi view (memoryview) penuh dengan data dari conn.
+    Melempar ConnectionError jika koneksi terputus sebelum penuh.
+    """
+    received = 0
+    while received < len(view):
+        size = conn.recv_into(view[received:])
+        if not size:
+            raise ConnectionError("Connection closed in the middle of a frame")
+        received += size
+
+
+def load_resume_state(state_path, header):
+    """
+    Membaca jumlah byte yang sudah tersimpan dari unggahan sebelumnya.
+    Mengembalikan 0 jika state tidak ada atau milik file yang berbeda.
+    """
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return 0
+
+    same_file = all(state.get(key) == header[key] for key in ("size", "sha256", "chunk_size"))
+    return state.get("offset", 0) if same_file else 0
+
+
+def save_resume_state(state_path, header, offset):
+    """
+    Menyimpan state unggahan (identitas file dan offset) secara atomik.
+    """
+    temp_path = state_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "size": header["size"],
+            "sha256": header["sha256"],
+            "chunk_size": header["chunk_size"],
+            "offset": offset,
+        }, f)
+
+    os.replace(temp_path, state_path)
+
+
+def file_sha256(path, chunk_size):
+    """
+    Menghitung hash SHA-256 isi file.
+    """
+    digest = hashlib.sha256()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+
+    with open(path, "rb") as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                return digest.hexdigest()
+            digest.update(view[:size])
+
+
+def receive_resume_session(conn, header, filepath):
+    """
+    Menjalankan satu sesi unggahan yang dapat dilanjutkan pada conn.
+    State disimpan setiap RESUME_CHECKPOINT byte dan saat koneksi
+    terputus sehingga sesi berikutnya dapat melanjutkan dari offset
+    terakhir yang utuh.
+    Header dengan ukuran atau chunk_size tidak valid ditolak dengan
+    balasan "FAIL" sebelum buffer dialokasikan (ValueError).
+    """
+    part_path = filepath + PART_SUFFIX
+    state_path = part_path + STATE_SUFFIX
+    size = header["size"]
+    chunk_size = header["chunk_size"]
+
+    valid_size = isinstance(size, int) and size >= 0
+    valid_chunk = isinstance(chunk_size, int) and 0 < chunk_size <= MAX_RESUME_CHUNK_SIZE
+    if not (valid_size and valid_chunk):
+        conn.sendall(b"FAIL invalid header\n")
+        raise ValueError(f"Invalid resume header: size {size!r}, chunk_size {chunk_size!r}")
+
+    committed = load_resume_state(state_path, header)
+    if not committed or not os.path.exists(part_path):
+        committed = 0
+        with open(part_path, "wb") as f:
+            f.truncate(size)
+
+    print(f"[INFO] Melanjutkan dari offset {committed}/{size}")
+    conn.sendall(f"OFFSET {committed}\n".encode("utf-8"))
+
+    # Chunk yang sudah utuh setelah offset committed
+    received = set()
+    corrupted = 0
+    checkpoint = committed
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    frame_view = memoryview(bytearray(FRAME_HEADER.size))
+
+    with open(part_path, "r+b") as f:
+        try:
+            while True:
+                recv_exact(conn, frame_view)
+                offset, length, crc = FRAME_HEADER.unpack(frame_view)
+
+                # Frame kosong: client selesai mengirim
+                if length == 0:
+                    missing = [o for o in range(committed, size, chunk_size) if o not in received]
+                    if not missing:
+                        break
+                    conn.sendall(("BAD " + json.dumps(missing) + "\n").encode("utf-8"))
+                    continue
+
+                if length > chunk_size or offset % chunk_size or offset + length > size:
+                    raise ValueError(f"Invalid frame: offset {offset}, length {length}")
+
+                recv_exact(conn, view[:length])
+                if zlib.crc32(view[:length]) != crc:
+                    corrupted += 1
+                    continue
+
+                f.seek(offset)
+                f.write(view[:length])
+                received.add(offset)
+
+                while committed < size and committed in received:
+                    received.remove(committed)
+                    committed += chunk_size
+                committed = min(committed, size)
+
+                if committed - checkpoint >= RESUME_CHECKPOINT:
+                    f.flush()
+                    save_resume_state(state_path, header, committed)
+                    checkpoint = committed
+        finally:
+            f.flush()
+            save_resume_state(state_path, header, committed)
+
+    if corrupted:
+        print(f"[INFO] {corrupted} chunk rusak diterima ulang")
+
+    if file_sha256(part_path, chunk_size) != header["sha256"]:
+        conn.sendall(b"FAIL hash mismatch\n")
+        os.remove(part_path)
+        os.remove(state_path)
+        raise ValueError(f"SHA-256 mismatch for {header['name']}")
+
+    os.replace(part_path, filepath)
+    os.remove(state_path)
+    conn.sendall(b"OK\n")
 
-    HOST = args.host
-    PORT = args.port
 
+def receive_resumable(s, conn, header, save_dir):
+    """
+    Menerima file dalam mode yang dapat dilanjutkan. Jika koneksi
+    terputus, server menunggu client menyambung kembali hingga
+    RESUME_WAIT_TIMEOUT detik lalu melanjutkan dari offset terakhir.
+    Mengembalikan path file yang disimpan.
+    Melempar ValueError jika nama file dari client tidak aman.
+    """
+    filename = header["name"]
+    try:
+        filepath = safe_path(save_dir, filename)
+    except ValueError:
+        conn.sendall(b"FAIL unsafe path\n")
+        conn.close()
+        raise
+
+    print(f"[INFO] Nama file diterima: {filename}")
+    print(f"[INFO] Mode resume: {header['size']} byte, chunk {header['chunk_size']} byte")
+    print(f"[INFO] Menyimpan ke: {filepath}")
+
+    while True:
+        try:
+            receive_resume_session(conn, header, filepath)
+            return filepath
+        except (ConnectionError, socket.timeout) as e:
+            print(f"[WARNING] Koneksi terputus: {e}. Menunggu client menyambung kembali...")
+        finally:
+            conn.close()
+
+        s.settimeout(RESUME_WAIT_TIMEOUT)
+        try:
+            conn, addr = s.accept()
+        except socket.timeout:
+            raise ConnectionError(
+                f"Client did not resume {filename} within {RESUME_WAIT_TIMEOUT} seconds"
+            ) from None
+        conn.settimeout(None)
+        print(f"[CONNECTED] Client: {addr}")
+
+        line = recv_until_newline(conn).strip()
+        if not line.startswith(RESUME_PREFIX):
+            conn.close()
+            raise ValueError(f"Expected resume header, got: {line}")
+
+        header = json.loads(line[len(RESUME_PREFIX):])
+        if header["name"] != filename:
+            conn.close()
+            raise ValueError(f"Expected resume of {filename}, got: {header['name']}")
+
+
+def safe_path(save_dir, name):
+    """
+    Menggabungkan save_dir dengan path relatif dari client.
+    Melempar ValueError jika path absolut atau keluar dari save_dir.
+    """
+    normalized = os.path.normpath(name)
+    if (os.path.isabs(normalized) or os.path.splitdrive(normalized)[0]
+            or normalized == ".." or normalized.startswith(".." + os.sep)):
+        raise ValueError(f"Unsafe path from client: {name}")
+
+    return os.path.join(save_dir, normalized)
+
+
+def create_links(save_dir, links):
+    """
+    Membuat symlink yang diterima pada mode folder. Dipanggil setelah
+    seluruh file ditulis sehingga tidak ada file yang ditulis melalui
+    symlink. Target absolut atau yang keluar dari save_dir dilewati,
+    dan setiap link diperiksa ulang dengan realpath setelah semua link
+    dibuat. Mengembalikan jumlah symlink yang dibuat.
+    """
+    root = os.path.realpath(save_dir)
+    created = []
+
+    for dest, name, target in links:
+        try:
+            safe_path(save_dir, os.path.join(os.path.dirname(name), target))
+        except ValueError:
+            print(f"[WARNING] Symlink dilewati, target di luar folder: {name} -> {target}")
+            continue
+
+        try:
+            if os.path.lexists(dest):
+                os.remove(dest)
+            os.symlink(target, dest)
+        except OSError as e:
+            print(f"[WARNING] Symlink gagal dibuat: {name} -> {target} ({e})")
+            continue
+        created.append((dest, name, target))
+
+    # Rantai beberapa symlink dapat keluar dari save_dir walau setiap
+    # target terlihat aman, sehingga hasil akhirnya diperiksa ulang
+    count = 0
+    for dest, name, target in created:
+        resolved = os.path.realpath(dest)
+        if resolved != root and not resolved.startswith(root + os.sep):
+            os.remove(dest)
+            print(f"[WARNING] Symlink dihapus, mengarah ke luar folder: {name} -> {target}")
+            continue
+        count += 1
+
+    return count
+
+
+def read_exact(reader, size):
+    """
+    Membaca tepat size byte dari reader.
+    Melempar ConnectionError jika koneksi terputus sebelum lengkap.
+    """
+    data = reader.read(size)
+    if len(data) != size:
+        raise ConnectionError("Connection closed in the middle of a frame")
+    return data
+
+
+def receive_tree(conn, header, save_dir, chunk_size):
+    """
+    Menerima banyak file dan folder dari satu koneksi mode folder lalu
+    membuat ulang pohon foldernya di bawah save_dir.
+    Mengembalikan jumlah file yang diterima.
+    """
+    print(f"[INFO] Mode folder: {header['files']} file, {header['bytes']} byte")
+    print(f"[INFO] Menyimpan ke: {save_dir}")
+
+    # Frame kecil dibaca dari buffer, bukan satu recv per frame
+    reader = conn.makefile("rb", buffering=chunk_size)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    created = set()
+    directories = []
+    links = []
+    files = 0
+
+    try:
+        while True:
+            kind, name_size, mode, mtime, size = TREE_FRAME.unpack(read_exact(reader, TREE_FRAME.size))
+            if kind == FRAME_END:
+                break
+
+            name = read_exact(reader, name_size).decode("utf-8")
+            dest = safe_path(save_dir, name)
+
+            if kind == FRAME_DIR:
+                os.makedirs(dest, exist_ok=True)
+                created.add(dest)
+                directories.append((dest, mode, mtime))
+                continue
+
+            if kind not in (FRAME_FILE, FRAME_LINK):
+                raise ValueError(f"Unknown frame type: {kind}")
+
+            parent = os.path.dirname(dest)
+            if parent not in created:
+                os.makedirs(parent, exist_ok=True)
+                created.add(parent)
+
+            # Symlink dibuat terakhir, setelah seluruh file ditulis
+            if kind == FRAME_LINK:
+                links.append((dest, name, read_exact(reader, size).decode("utf-8")))
+                continue
+
+            with open(dest, "wb") as f:
+                remaining = size
+                while remaining:
+                    received = reader.readinto(view[:min(chunk_size, remaining)])
+                    if not received:
+                        raise ConnectionError("Connection closed in the middle of a file")
+                    f.write(view[:received])
+                    remaining -= received
+
+            os.chmod(dest, stat.S_IMODE(mode))
+            os.utime(dest, (mtime, mtime))
+            files += 1
+
+        if links:
+            print(f"[INFO] {create_links(save_dir, links)} dari {len(links)} symlink dibuat")
+
+        # Atribut folder dipulihkan terakhir karena penulisan file mengubahnya
+        for dest, mode, mtime in sorted(directories, reverse=True):
+            os.chmod(dest, stat.S_IMODE(mode))
+            os.utime(dest, (mtime, mtime))
+
+        conn.sendall(f"OK {files}\n".encode("utf-8"))
+    finally:
+        reader.close()
+
+    return files
+
+
+def receive_file(host="localhost", port=5000, save_dir=DEFAULT_SAVE_DIR,
+                 chunk_size=RECV_CHUNK_SIZE, rcvbuf=None, sndbuf=None, nodelay=False):
+    """
+    Server akan listening koneksi client, menerima nama file,
+    lalu menerima isi file dalam bentuk binary hingga selesai,
+    dan menyimpannya ke folder save_dir.
+
+    Fungsi ini dapat dipanggil langsung dari script lain
+    (contoh: perintah serve pada cli.py).
+    Mengembalikan path file yang disimpan (save_dir pada mode folder).
+    """
     print("=== File Receiver Server ===")
-    print(f"Host        : {HOST}")
-    print(f"Port        : {PORT}")
-    print(f"Save Folder : {DEFAULT_SAVE_DIR}")
+    print(f"Host        : {host}")
+    print(f"Port        : {port}")
+    print(f"Save Folder : {save_dir}")
     print("\nMenunggu client...\n")
 
     # Setup socket server
     s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    s.bind((HOST, PORT))
-    s.listen(1)
+    configure_socket(s, rcvbuf, sndbuf, nodelay)
+    s.bind((host, port))
+    s.listen(LISTEN_BACKLOG)
 
     # Menerima koneksi client
     conn, addr = s.accept()
     print(f"[CONNECTED] Client: {addr}")
 
-    # Menerima nama file secara aman
+    # Menerima nama file (atau header rentang) secara aman
     filename = recv_until_newline(conn).strip()
-    filepath = os.path.join(DEFAULT_SAVE_DIR, filename)
+
+    if filename.startswith(TREE_PREFIX):
+        try:
+            files = receive_tree(conn, json.loads(filename[len(TREE_PREFIX):]), save_dir, chunk_size)
+        finally:
+            conn.close()
+            s.close()
+
+        print(f"\n[SUCCESS] {files} file diterima dan disimpan di: {save_dir}")
+        print("[SERVER CLOSED] Server dimatikan.")
+        return save_dir
+
+    if filename.startswith(RANGE_PREFIX) or filename.startswith(RESUME_PREFIX):
+        try:
+            if filename.startswith(RANGE_PREFIX):
+                filepath = receive_ranges(s, conn, json.loads(filename[len(RANGE_PREFIX):]), save_dir, chunk_size)
+            else:
+                filepath = receive_resumable(s, conn, json.loads(filename[len(RESUME_PREFIX):]), save_dir)
+        finally:
+            s.close()
+
+        print(f"\n[SUCCESS] File diterima dan disimpan sebagai: {filepath}")
+        print("[SERVER CLOSED] Server dimatikan.")
+        return filepath
+
+    filepath = os.path.join(save_dir, filename)
 
     print(f"[INFO] Nama file diterima: {filename}")
     print(f"[INFO] Menyimpan ke: {filepath}")
 
-    # Menerima isi file dalam bentuk binary
+    # Menerima isi file dalam bentuk binary melalui satu buffer
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
     with open(filepath, "wb") as f:
         while True:
-            data = conn.recv(4096)
-            if not data:
+            size = conn.recv_into(buffer)
+            if not size:
                 break
-            f.write(data)
+            f.write(view[:size])
 
     print(f"\n[SUCCESS] File diterima dan disimpan sebagai: {filepath}")
 
@@ -102,6 +673,70 @@ def main():
     s.close()
     print("[SERVER CLOSED] Server dimatikan.")
 
+    return filepath
+
+
+def main():
+    """
+    Membaca argumen command line lalu menjalankan server penerima.
+    """
+    parser = argparse.ArgumentParser(
+        description="Simple File Receiver Server"
+    )
+
+    parser.add_argument(
+        "--host", "-H",
+        type=str,
+        default="localhost",
+        help="Host untuk server (default: localhost)"
+    )
+
+    parser.add_argument(
+        "--port", "-P",
+        type=int,
+        default=5000,
+        help="Port untuk server (default: 5000)"
+    )
+
+    parser.add_argument(
+        "--dir", "-D",
+        type=str,
+        default=DEFAULT_SAVE_DIR,
+        help="Folder penyimpanan file (default: lokasi script)"
+    )
+
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=RECV_CHUNK_SIZE,
+        help="Ukuran buffer penerimaan dalam byte (default: 256 KiB)"
+    )
+
+    parser.add_argument(
+        "--rcvbuf",
+        type=int,
+        help="Ukuran SO_RCVBUF dalam byte (default: bawaan sistem)"
+    )
+
+    parser.add_argument(
+        "--sndbuf",
+        type=int,
+        help="Ukuran SO_SNDBUF dalam byte (default: bawaan sistem)"
+    )
+
+    parser.add_argument(
+        "--nodelay",
+        action="store_true",
+        help="Aktifkan TCP_NODELAY"
+    )
+
+    args = parser.parse_args()
+
+    receive_file(
+        args.host, args.port, args.dir,
+        chunk_size=args.chunk_size, rcvbuf=args.rcvbuf, sndbuf=args.sndbuf, nodelay=args.nodelay
+    )
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,120 @@
+"""
+Helper AdaptiveCompress.
+
+Helper ini menentukan level kompresi secara adaptif untuk setiap
+entri (file). Sebagian kecil isi file diambil sebagai sampel lalu
+dikompresi dengan zlib level 1 untuk memperkirakan rasio kompresi.
+Berdasarkan rasio tersebut dipilih salah satu keputusan berikut:
+
+- store : data disimpan tanpa kompresi (contoh: JPEG, MP4, .gz)
+- fast  : data sulit dikompresi, gunakan preset tercepat
+- full  : data mudah dikompresi, gunakan level yang diminta pengguna
+- small : file terlalu kecil untuk disampel, gunakan level yang diminta
+"""
+
+import os
+import zlib
+
+# Ukuran total sampel yang diambil dari setiap file (64 KiB)
+SAMPLE_SIZE = 64 * 1024
+
+# File di bawah ukuran ini tidak disampel (overhead sampel lebih besar)
+SMALL_FILE_SIZE = 4 * 1024
+
+# Rasio (ukuran terkompresi / ukuran asli) minimum untuk keputusan store
+STORE_RATIO = 0.95
+
+# Rasio minimum untuk keputusan fast
+FAST_RATIO = 0.80
+
+# Ekstensi file yang hampir pasti sudah terkompresi
+INCOMPRESSIBLE_EXTENSIONS = {
+    ".7z", ".avi", ".bz2", ".docx", ".flac", ".gif", ".gz", ".heic",
+    ".jpeg", ".jpg", ".m4a", ".mkv", ".mov", ".mp3", ".mp4", ".ogg",
+    ".png", ".pptx", ".rar", ".tgz", ".webm", ".webp", ".xlsx", ".xz",
+    ".zip", ".zst", ".zz",
+}
+
+
+def estimate_ratio(sample):
+    """
+    Memperkirakan rasio kompresi sebuah sampel data.
+
+    Mengembalikan nilai antara 0 dan sekitar 1; semakin mendekati 1
+    berarti data semakin sulit dikompresi.
+    """
+    if not sample:
+        return 0.0
+
+    return len(zlib.compress(sample, 1)) / len(sample)
+
+
+def sample_file(path, sample_size=SAMPLE_SIZE):
+    """
+    Mengambil sampel dari bagian awal, tengah, dan akhir file.
+
+    File yang lebih kecil dari sample_size dibaca seluruhnya.
+    """
+    size = os.path.getsize(path)
+
+    with open(path, "rb") as f:
+        if size <= sample_size:
+            return f.read()
+
+        part = sample_size // 3
+        sample = bytearray()
+        for offset in (0, (size - part) // 2, size - part):
+            f.seek(offset)
+            sample += f.read(part)
+
+        return bytes(sample)
+
+
+class AdaptivePolicy:
+    """
+    Kebijakan pemilihan level kompresi adaptif untuk satu codec.
+    """
+
+    def __init__(self, codec, level, store_ratio=STORE_RATIO, fast_ratio=FAST_RATIO):
+        """
+        Parameter:
+        - codec       : objek Codec dari CodecRegistry
+        - level       : level kompresi yang diminta pengguna
+        - store_ratio : ambang rasio untuk menyimpan tanpa kompresi
+        - fast_ratio  : ambang rasio untuk menggunakan preset fast
+        """
+        self.codec = codec
+        self.level = level
+        self.store_ratio = store_ratio
+        self.fast_ratio = fast_ratio
+
+    def choose(self, ratio):
+        """
+        Memilih level berdasarkan rasio hasil estimasi.
+        Mengembalikan tuple (level, keputusan).
+        """
+        if ratio >= self.store_ratio:
+            if self.codec.store_level is not None:
+                return self.codec.store_level, "store"
+            return self.codec.level("fast"), "fast"
+
+        if ratio >= self.fast_ratio:
+            return min(self.level, self.codec.level("fast")), "fast"
+
+        return self.level, "full"
+
+    def choose_for_file(self, path):
+        """
+        Memilih level untuk satu file berdasarkan ekstensi dan sampel isi.
+        Mengembalikan tuple (level, keputusan, rasio).
+        """
+        if os.path.splitext(path)[1].lower() in INCOMPRESSIBLE_EXTENSIONS:
+            level, decision = self.choose(1.0)
+            return level, decision, 1.0
+
+        if os.path.getsize(path) < SMALL_FILE_SIZE:
+            return self.level, "small", 0.0
+
+        ratio = estimate_ratio(sample_file(path))
+        level, decision = self.choose(ratio)
+        return level, decision, ratio
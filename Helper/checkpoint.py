@@ -0,0 +1,107 @@
+"""
+Helper Checkpoint.
+
+Helper ini menyimpan titik pemulihan (checkpoint) untuk kompresi file
+besar ke file JSON di samping file hasil kompresi
+(<file hasil>.checkpoint.json). Checkpoint mencatat offset masukan dan
+offset keluaran tepat di batas member terkompresi yang sudah di-flush
+ke disk, sehingga proses yang terhenti (dibatalkan, error, atau
+aplikasi mati) dapat dilanjutkan dari titik tersebut.
+"""
+
+import json
+import os
+
+# Versi format file checkpoint
+CHECKPOINT_VERSION = 1
+
+# Akhiran nama file checkpoint di samping file hasil kompresi
+CHECKPOINT_SUFFIX = ".checkpoint.json"
+
+# Jarak (byte masukan) antar checkpoint
+CHECKPOINT_INTERVAL = 64 * 1024 * 1024
+
+# File yang lebih kecil dari ini cukup diulang dari awal
+RESUME_MIN_SIZE = 64 * 1024 * 1024
+
+
+def checkpoint_path(dest):
+    """
+    Mengembalikan path file checkpoint untuk file hasil kompresi dest.
+    """
+    return dest + CHECKPOINT_SUFFIX
+
+
+def checkpoint_state(source, size, codec, compresslevel, block_size):
+    """
+    Membuat identitas pekerjaan kompresi. Checkpoint hanya dipakai
+    ulang jika sumber (path, ukuran, waktu modifikasi) dan pengaturan
+    kompresi masih sama persis.
+    """
+    return {
+        "source": os.path.abspath(source),
+        "size": size,
+        "mtime_ns": os.stat(source).st_mtime_ns,
+        "codec": codec.name,
+        "level": compresslevel,
+        "block_size": block_size,
+    }
+
+
+def load_checkpoint(dest, state):
+    """
+    Membaca checkpoint untuk dest. Mengembalikan tuple
+    (offset masukan, offset keluaran) jika checkpoint cocok dengan
+    state dan file hasil masih memuat data hingga offset keluaran,
+    atau None jika proses harus dimulai dari awal.
+    """
+    path = checkpoint_path(dest)
+    if not os.path.exists(path) or not os.path.exists(dest):
+        return None
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if checkpoint.get("version") != CHECKPOINT_VERSION or checkpoint.get("state") != state:
+        return None
+
+    input_offset = checkpoint["input_offset"]
+    output_offset = checkpoint["output_offset"]
+    if os.path.getsize(dest) < output_offset or input_offset > state["size"]:
+        return None
+
+    return input_offset, output_offset
+
+
+def save_checkpoint(dest, state, input_offset, output_offset):
+    """
+    Menyimpan checkpoint secara atomik (tulis ke file sementara lalu
+    os.replace) sehingga file checkpoint tidak pernah setengah jadi.
+    """
+    path = checkpoint_path(dest)
+    temp_path = path + ".tmp"
+
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "version": CHECKPOINT_VERSION,
+                "state": state,
+                "input_offset": input_offset,
+                "output_offset": output_offset,
+            },
+            f
+        )
+
+    os.replace(temp_path, path)
+
+
+def clear_checkpoint(dest):
+    """
+    Menghapus checkpoint setelah kompresi selesai.
+    """
+    path = checkpoint_path(dest)
+    if os.path.exists(path):
+        os.remove(path)
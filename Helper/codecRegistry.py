@@ -0,0 +1,276 @@
+"""
+Helper CodecRegistry.
+
+Helper ini menyediakan registry codec kompresi yang digunakan oleh
+seluruh modul aplikasi. Setiap codec mendeklarasikan ekstensi file,
+fungsi pembuat stream kompresi dan dekompresi, preset kecepatan/rasio,
+serta fungsi kompresi per blok apabila hasilnya dapat digabungkan
+(multi-stream) sehingga dapat dipakai oleh mesin kompresi paralel.
+
+Codec yang tersedia:
+- gzip : .gz  (default, kompatibel dengan tool gzip)
+- bz2  : .bz2 (rasio lebih baik, lebih lambat)
+- lzma : .xz  (rasio terbaik, cocok untuk arsip dingin)
+- zlib : .zz  (stream zlib mentah tanpa header gzip, paling ringan)
+- gzip-seekable : .gz (gzip per blok dengan indeks offset sehingga
+  rentang byte mana pun dapat dibaca tanpa mendekompresi seluruh file)
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import zlib
+
+from Helper.parallelCompress import ParallelBlockWriter
+from Helper.seekableGzip import compress_seekable_block
+
+# Nama codec dan preset default aplikasi
+DEFAULT_CODEC = "gzip"
+DEFAULT_PRESET = "best"
+
+# Urutan preset yang ditampilkan pada GUI
+PRESET_NAMES = ["fast", "balanced", "best"]
+
+# Ukuran potongan data terkompresi yang dibaca oleh ZlibReader
+ZLIB_READ_SIZE = 64 * 1024
+
+
+class ZlibWriter:
+    """
+    Objek file-like (hanya tulis) untuk stream zlib mentah.
+    """
+
+    def __init__(self, fileobj, level):
+        self.fileobj = fileobj
+        self.closed = False
+        self._position = 0
+        self._compressor = zlib.compressobj(level)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, data):
+        """
+        Mengompresi data dan menuliskan hasilnya ke file tujuan.
+        """
+        out = self._compressor.compress(data)
+        if out:
+            self.fileobj.write(out)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        """
+        Mengembalikan jumlah byte mentah yang sudah ditulis.
+        """
+        return self._position
+
+    def flush(self):
+        self.fileobj.flush()
+
+    def close(self):
+        """
+        Menuliskan sisa data terkompresi dan menutup stream zlib.
+        """
+        if self.closed:
+            return
+        self.fileobj.write(self._compressor.flush())
+        self.fileobj.flush()
+        self.closed = True
+
+
+class ZlibReader(io.RawIOBase):
+    """
+    Objek file-like (hanya baca) untuk stream zlib mentah.
+
+    Ukuran hasil dekompresi setiap pemanggilan dibatasi oleh ukuran
+    buffer pembaca sehingga memori tetap terbatas.
+    """
+
+    def __init__(self, fileobj):
+        super().__init__()
+        self.fileobj = fileobj
+        self._decompressor = zlib.decompressobj()
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        """
+        Mengisi buffer dengan data hasil dekompresi.
+        Mengembalikan 0 ketika akhir stream zlib tercapai.
+        """
+        while not self._decompressor.eof:
+            chunk = self._decompressor.unconsumed_tail or self.fileobj.read(ZLIB_READ_SIZE)
+            if not chunk:
+                raise EOFError(
+                    "Compressed file ended before the end-of-stream marker was reached"
+                )
+
+            data = self._decompressor.decompress(chunk, len(buffer))
+            if data:
+                buffer[:len(data)] = data
+                return len(data)
+
+        return 0
+
+
+class Codec:
+    """
+    Deskripsi satu codec kompresi di dalam registry.
+    """
+
+    def __init__(self, name, extension, writer_factory, reader_factory, presets,
+                 block_compressor=None, store_level=None, seekable=False):
+        """
+        Parameter:
+        - name             : nama codec yang ditampilkan pada GUI
+        - extension        : ekstensi file hasil kompresi (contoh: ".gz")
+        - writer_factory   : fungsi (fileobj, level) -> stream kompresi
+        - reader_factory   : fungsi (fileobj) -> stream dekompresi
+        - presets          : dict nama preset -> level kompresi
+        - block_compressor : fungsi (data, level) -> bytes yang hasilnya
+                             aman digabungkan, atau None jika tidak didukung
+        - store_level      : level yang menyimpan data tanpa kompresi,
+                             atau None jika codec tidak memilikinya
+        - seekable         : True jika hasil selalu ditulis per blok dan
+                             dapat dibaca acak melalui Helper.seekableGzip
+        """
+        self.name = name
+        self.extension = extension
+        self.writer_factory = writer_factory
+        self.reader_factory = reader_factory
+        self.presets = presets
+        self.block_compressor = block_compressor
+        self.store_level = store_level
+        self.seekable = seekable
+
+    def level(self, preset=DEFAULT_PRESET):
+        """
+        Mengembalikan level kompresi untuk nama preset tertentu.
+        """
+        if preset not in self.presets:
+            raise ValueError(f"Unknown preset for {self.name}: {preset}")
+        return self.presets[preset]
+
+    def open_writer(self, fileobj, level):
+        """
+        Membuka stream kompresi di atas objek file biner.
+        """
+        return self.writer_factory(fileobj, level)
+
+    def open_reader(self, fileobj):
+        """
+        Membuka stream dekompresi di atas objek file biner.
+        """
+        return self.reader_factory(fileobj)
+
+    @property
+    def supports_blocks(self):
+        """
+        True jika codec dapat dikompresi per blok secara paralel.
+        """
+        return self.block_compressor is not None
+
+
+CODECS = {
+    "gzip": Codec(
+        "gzip",
+        ".gz",
+        lambda f, level: gzip.GzipFile(fileobj=f, mode="wb", compresslevel=level),
+        lambda f: gzip.GzipFile(fileobj=f, mode="rb"),
+        {"fast": 1, "balanced": 6, "best": 9},
+        lambda data, level: gzip.compress(data, compresslevel=level, mtime=0),
+        store_level=0,
+    ),
+    "bz2": Codec(
+        "bz2",
+        ".bz2",
+        lambda f, level: bz2.BZ2File(f, mode="wb", compresslevel=level),
+        lambda f: bz2.BZ2File(f, mode="rb"),
+        {"fast": 1, "balanced": 6, "best": 9},
+        lambda data, level: bz2.compress(data, compresslevel=level),
+    ),
+    "lzma": Codec(
+        "lzma",
+        ".xz",
+        lambda f, level: lzma.LZMAFile(f, mode="wb", preset=level),
+        lambda f: lzma.LZMAFile(f, mode="rb"),
+        {"fast": 0, "balanced": 6, "best": 9},
+        lambda data, level: lzma.compress(data, preset=level),
+    ),
+    "zlib": Codec(
+        "zlib",
+        ".zz",
+        lambda f, level: ZlibWriter(f, level),
+        lambda f: io.BufferedReader(ZlibReader(f)),
+        {"fast": 1, "balanced": 6, "best": 9},
+        store_level=0,
+    ),
+    # Diletakkan setelah gzip agar file .gz dikenali sebagai gzip biasa;
+    # kedua format dibaca dengan reader gzip yang sama
+    "gzip-seekable": Codec(
+        "gzip-seekable",
+        ".gz",
+        lambda f, level: ParallelBlockWriter(f, compress_seekable_block, workers=1, compresslevel=level),
+        lambda f: gzip.GzipFile(fileobj=f, mode="rb"),
+        {"fast": 1, "balanced": 6, "best": 9},
+        compress_seekable_block,
+        store_level=0,
+        seekable=True,
+    ),
+}
+
+
+def get_codec(name=DEFAULT_CODEC):
+    """
+    Mengambil codec berdasarkan nama. Objek Codec dikembalikan apa adanya.
+    """
+    if isinstance(name, Codec):
+        return name
+
+    if name not in CODECS:
+        raise ValueError(f"Unknown codec: {name}")
+
+    return CODECS[name]
+
+
+def codec_for_path(path):
+    """
+    Menentukan codec berdasarkan ekstensi file.
+    Mengembalikan None jika file tidak dikenali sebagai file terkompresi.
+    """
+    lower = str(path).lower()
+    for codec in CODECS.values():
+        if lower.endswith(codec.extension):
+            return codec
+
+    return None
+
+
+def is_tar_archive(path):
+    """
+    Mengecek apakah path merupakan arsip TAR terkompresi
+    (contoh: .tar.gz, .tar.bz2, .tar.xz, .tar.zz).
+    """
+    codec = codec_for_path(path)
+    if codec is None:
+        return False
+
+    return str(path).lower().endswith(".tar" + codec.extension)
+
+
+def strip_extension(path):
+    """
+    Menghapus ekstensi codec (dan .tar untuk arsip) dari nama file.
+    """
+    codec = codec_for_path(path)
+    if codec is None:
+        return path
+
+    suffix = ".tar" + codec.extension if is_tar_archive(path) else codec.extension
+    return path[:-len(suffix)]
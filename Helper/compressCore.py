@@ -0,0 +1,302 @@
+"""
+Helper CompressCore.
+
+Helper ini berisi mesin kompresi yang dipakai oleh halaman GUI
+Compress maupun CLI. Seluruh fungsi bebas dari CustomTkinter
+sehingga dapat dijalankan pada mesin tanpa layar (cron, batch node)
+dan diimpor dengan cepat dari proses lain.
+"""
+
+import os
+
+from Helper.codecRegistry import DEFAULT_CODEC, DEFAULT_PRESET, get_codec
+from Helper.dedupStore import DEDUP_STORE_NAME, DedupStore
+from Helper.incrementalArchive import compress_incremental
+from Helper.indexedArchive import INDEXED_EXTENSION, create_indexed_archive
+from Helper.logCreate import LogCreate
+from Helper.seekableGzip import write_index
+from Helper.streamCompress import DEFAULT_BLOCK_SIZE, compress_stream_file, compress_stream_folder
+
+# Pilihan format arsip untuk sumber berupa folder
+FOLDER_FORMATS = ["tar", "indexed", "incremental", "dedup"]
+
+
+def log_adaptive_decision(path, decision, level, ratio):
+    """
+    Mencatat keputusan mode adaptif ke log agar ambang batas
+    (threshold) dapat disesuaikan berdasarkan data nyata.
+    """
+    LogCreate(
+        "CompressModule",
+        f"Adaptive: {path} ratio={ratio:.3f} → {decision} (level {level})"
+    )
+
+
+def log_seekable_index(path, codec):
+    """
+    Menulis indeks blok sidecar untuk hasil codec seekable
+    sehingga rentang byte dapat dibaca tanpa dekompresi penuh.
+    """
+    if not codec.seekable:
+        return
+
+    index = write_index(path)
+    LogCreate(
+        "CompressModule",
+        f"Random-access index written: {path} ({len(index['blocks'])} blocks)"
+    )
+
+
+def compress_file(source, output, block_size=DEFAULT_BLOCK_SIZE, workers=1,
+                  codec=DEFAULT_CODEC, preset=DEFAULT_PRESET, adaptive=False, progress=None,
+                  use_mmap=True):
+    """
+    Mengompresi satu file menggunakan codec yang dipilih
+    dan mengembalikan path file hasil kompresi.
+
+    File dibaca per blok berukuran block_size sehingga memori
+    yang digunakan tetap konstan berapa pun ukuran file sumber.
+    Jika workers lebih dari satu, blok dikompresi secara paralel.
+    Pada mode adaptive, level dipilih berdasarkan sampel isi file.
+    File besar dikompresi dengan checkpoint sehingga proses yang
+    terhenti dilanjutkan dari checkpoint terakhir saat dijalankan ulang.
+    File di disk lokal dibaca melalui mmap kecuali use_mmap bernilai False.
+    File hasil kompresi akan disimpan dengan ekstensi codec
+    (contoh: .gz) pada folder output yang ditentukan.
+    """
+    codec = get_codec(codec)
+    filename = os.path.basename(source)
+    dest = os.path.join(output, filename + codec.extension)
+
+    LogCreate(
+        "CompressModule",
+        f"Compressing file: {source} → {dest} "
+        f"(codec {codec.name}/{preset}, block size {block_size} bytes, workers {workers})"
+    )
+
+    # Mengompresi file sumber secara streaming per blok
+    total = compress_stream_file(
+        source,
+        dest,
+        block_size=block_size,
+        compresslevel=codec.level(preset),
+        workers=workers,
+        codec=codec,
+        adaptive=adaptive,
+        on_decision=log_adaptive_decision,
+        progress=progress,
+        on_resume=lambda offset: LogCreate(
+            "CompressModule", f"Resuming from checkpoint: {dest} at input offset {offset}"
+        ),
+        use_mmap=use_mmap
+    )
+
+    log_seekable_index(dest, codec)
+    LogCreate("CompressModule", f"File compression completed: {dest} ({total} bytes read)")
+    return dest
+
+
+def compress_indexed_folder(source, output, workers=1, codec=DEFAULT_CODEC,
+                            preset=DEFAULT_PRESET, adaptive=False, progress=None):
+    """
+    Mengompresi folder ke format Indexed Archive (.iarc).
+
+    Setiap file dikompresi terpisah oleh worker pool dan indeks
+    pusat ditulis di akhir arsip, sehingga arsip dapat dilihat
+    isinya seketika dan diekstrak secara paralel.
+    """
+    codec = get_codec(codec)
+    folder_name = os.path.basename(source)
+    archive_path = os.path.join(output, folder_name + INDEXED_EXTENSION)
+
+    LogCreate(
+        "CompressModule",
+        f"Creating indexed archive: {source} → {archive_path} "
+        f"(codec {codec.name}/{preset}, workers {workers})"
+    )
+
+    count = create_indexed_archive(
+        source,
+        archive_path,
+        arcname=folder_name,
+        codec=codec,
+        compresslevel=codec.level(preset),
+        workers=workers,
+        adaptive=adaptive,
+        on_decision=log_adaptive_decision,
+        progress=progress
+    )
+
+    LogCreate(
+        "CompressModule",
+        f"Indexed archive completed: {archive_path} ({count} entries)",
+        level="SUCCESS"
+    )
+    return archive_path
+
+
+def compress_incremental_folder(source, output, block_size=DEFAULT_BLOCK_SIZE, workers=1,
+                                codec=DEFAULT_CODEC, preset=DEFAULT_PRESET, adaptive=False,
+                                progress=None):
+    """
+    Mengompresi folder secara inkremental.
+
+    Proses pertama membuat arsip dasar dan manifest, proses
+    berikutnya hanya membuat arsip delta berisi file baru atau
+    berubah beserta tombstone untuk file yang dihapus.
+    Pada mode adaptive, level dipilih ulang untuk setiap file
+    yang diarsipkan.
+    """
+    codec = get_codec(codec)
+
+    LogCreate(
+        "CompressModule",
+        f"Incremental compression: {source} → {output} "
+        f"(codec {codec.name}/{preset}, workers {workers})"
+    )
+
+    if adaptive and not codec.supports_blocks:
+        LogCreate(
+            "CompressModule",
+            f"Adaptive mode needs a block codec; {codec.name} uses a fixed level"
+        )
+
+    result = compress_incremental(
+        source,
+        output,
+        codec=codec,
+        compresslevel=codec.level(preset),
+        workers=workers,
+        block_size=block_size,
+        adaptive=adaptive,
+        on_decision=log_adaptive_decision,
+        progress=progress
+    )
+
+    if result["archive"] is None:
+        LogCreate("CompressModule", f"No changes since last archive: {source}", level="SUCCESS")
+        return result
+
+    LogCreate(
+        "CompressModule",
+        f"Incremental {result['kind']} archive completed: {result['archive']} "
+        f"({result['changed']} changed, {result['tombstones']} deleted)",
+        level="SUCCESS"
+    )
+    return result
+
+
+def compress_dedup_folder(source, output, preset=DEFAULT_PRESET, progress=None):
+    """
+    Menyimpan snapshot folder ke dedup store di folder output.
+
+    File dipotong menjadi chunk berbasis isi dan hanya chunk yang
+    belum ada di store yang disimpan (terkompresi zlib), sehingga
+    file duplikat atau versi yang mirip tidak disimpan ulang.
+    """
+    store_root = os.path.join(output, DEDUP_STORE_NAME)
+
+    LogCreate(
+        "CompressModule",
+        f"Dedup backup: {source} → {store_root} (preset {preset})"
+    )
+
+    store = DedupStore(store_root, compresslevel=get_codec("zlib").level(preset))
+    stats = store.backup(source, progress=progress)
+
+    LogCreate(
+        "CompressModule",
+        f"Dedup snapshot completed: {stats['snapshot']} "
+        f"({stats['logical_bytes']} bytes, {stats['chunks']} chunks, "
+        f"{stats['new_bytes']} new bytes, {stats['stored_bytes']} bytes stored, "
+        f"dedup ratio {stats['dedup_ratio']:.2f}x, {stats['mb_per_s']:.1f} MB/s)",
+        level="SUCCESS"
+    )
+    return stats
+
+
+def compress_folder(source, output, block_size=DEFAULT_BLOCK_SIZE, workers=1,
+                    codec=DEFAULT_CODEC, preset=DEFAULT_PRESET, adaptive=False, progress=None,
+                    use_mmap=True):
+    """
+    Mengompresi folder ke arsip TAR terkompresi dalam satu kali jalan.
+
+    Isi folder dikemas ke format TAR untuk menjaga struktur folder,
+    namun stream TAR langsung dikompresi tanpa membuat file
+    .tar sementara, sehingga hanya byte terkompresi yang ditulis
+    ke disk dan memori tetap terbatas pada ukuran blok.
+    Jika workers lebih dari satu, stream TAR dikompresi secara paralel.
+    Pada mode adaptive, level dipilih ulang untuk setiap file
+    (atau disimpan tanpa kompresi jika data sulit dikompresi).
+    """
+    codec = get_codec(codec)
+    folder_name = os.path.basename(source)
+    archive_path = os.path.join(output, folder_name + ".tar" + codec.extension)
+
+    LogCreate(
+        "CompressModule",
+        f"Streaming TAR archive: {source} → {archive_path} "
+        f"(codec {codec.name}/{preset}, workers {workers})"
+    )
+
+    if adaptive and not codec.supports_blocks:
+        LogCreate(
+            "CompressModule",
+            f"Adaptive mode needs a block codec; {codec.name} uses a fixed level"
+        )
+
+    # Mengemas dan mengompresi folder secara streaming
+    compress_stream_folder(
+        source,
+        archive_path,
+        arcname=folder_name,
+        block_size=block_size,
+        compresslevel=codec.level(preset),
+        workers=workers,
+        codec=codec,
+        adaptive=adaptive,
+        on_decision=log_adaptive_decision,
+        progress=progress,
+        use_mmap=use_mmap
+    )
+
+    log_seekable_index(archive_path, codec)
+    LogCreate(
+        "CompressModule",
+        f"Folder compression completed: {archive_path}",
+        level="SUCCESS"
+    )
+    return archive_path
+
+
+def compress_source(source, output, mode=None, archive_format="tar", options=None, progress=None):
+    """
+    Mengompresi satu sumber sesuai mode (File/Folder)
+    dan format arsip folder yang dipilih. Jika mode kosong,
+    mode ditentukan otomatis dari jenis sumber. Progres dilaporkan
+    ke progress (ProgressReporter) jika diisi.
+    Mengembalikan hasil dari fungsi kompresi yang dijalankan.
+    """
+    source = os.path.normpath(source)
+    options = dict(options or {})
+    if mode is None:
+        mode = "Folder" if os.path.isdir(source) else "File"
+
+    if mode == "File":
+        return compress_file(source, output, progress=progress, **options)
+
+    if archive_format == "indexed":
+        options.pop("block_size", None)
+        options.pop("use_mmap", None)
+        return compress_indexed_folder(source, output, progress=progress, **options)
+
+    if archive_format == "incremental":
+        options.pop("use_mmap", None)
+        return compress_incremental_folder(source, output, progress=progress, **options)
+
+    if archive_format == "dedup":
+        return compress_dedup_folder(
+            source, output, preset=options.get("preset", DEFAULT_PRESET), progress=progress
+        )
+
+    return compress_folder(source, output, progress=progress, **options)
@@ -0,0 +1,358 @@
+"""
+Helper DecompressCore.
+
+Helper ini berisi mesin dekompresi yang dipakai oleh halaman GUI
+Decompress maupun CLI, tanpa ketergantungan pada CustomTkinter.
+Jenis arsip ditentukan dari nama file: manifest inkremental,
+snapshot dedup, Indexed Archive (.iarc), arsip TAR terkompresi,
+atau file tunggal terkompresi.
+
+Seluruh jalur dekompresi bersifat streaming dengan buffer berukuran
+tetap (chunk_size), sehingga memori tetap terbatas berapa pun ukuran
+hasil dekompresi. File gzip multi-member didekompresi paralel per
+segmen jika workers lebih dari satu.
+"""
+
+import os
+import tarfile
+from contextlib import contextmanager
+
+from Helper.codecRegistry import codec_for_path, is_tar_archive, strip_extension
+from Helper.dedupStore import is_snapshot, restore_snapshot
+from Helper.incrementalArchive import is_manifest, restore_incremental
+from Helper.indexedArchive import (
+    INDEXED_EXTENSION,
+    extract_indexed_archive,
+    is_indexed_archive,
+    read_index,
+)
+from Helper.logCreate import LogCreate
+from Helper.parallelDecompress import ParallelGzipReader
+from Helper.parallelExtract import extract_parallel
+from Helper.progressReporter import ProgressReader
+from Helper.streamCompress import DEFAULT_BLOCK_SIZE, copy_stream
+from Helper.tarIndex import extract_tar_members, load_tar_index, select_members
+from Helper.verifyArchive import (
+    compare_hashes,
+    hash_list_path,
+    load_hash_list,
+    verify_archive,
+    write_hash_list,
+)
+
+# Batas byte yang dibaca read_head (contoh: untuk penampil log)
+VIEW_LIMIT = 8 * 1024 * 1024
+
+
+def list_contents(source, progress=None):
+    """
+    Mengembalikan daftar isi arsip sebagai baris teks
+    (jenis, ukuran, nama). Indexed Archive dibaca langsung dari
+    indeks pusat di akhir file, sedangkan arsip TAR terkompresi dibaca
+    dari indeks member yang di-cache di samping arsip (dibangun sekali
+    pada pemanggilan pertama) sehingga daftar isi tampil seketika.
+    """
+    if is_indexed_archive(source):
+        entries = read_index(source)
+    elif is_tar_archive(source):
+        entries = load_tar_index(source, progress=progress)
+    else:
+        raise ValueError(f"Listing is supported for TAR and {INDEXED_EXTENSION} archives")
+
+    LogCreate("DecompressModule", f"Listed {len(entries)} entries: {source}")
+
+    return [
+        f"{entry['type']:<8} {entry.get('size', 0):>14}  {entry['name']}"
+        for entry in entries
+    ]
+
+
+def extract_selected(source, output, patterns, workers=1, progress=None, chunk_size=DEFAULT_BLOCK_SIZE):
+    """
+    Mengekstrak hanya member arsip yang cocok dengan patterns (nama
+    persis, pola glob, atau nama folder) dari Indexed Archive maupun
+    arsip TAR terkompresi. Member TAR diekstrak ke folder yang sama
+    dengan decompress_folder. Mengembalikan jumlah member yang diekstrak.
+    """
+    if is_indexed_archive(source):
+        entries = select_members(read_index(source), patterns)
+        dest = output
+    elif is_tar_archive(source):
+        entries = select_members(load_tar_index(source, progress=progress), patterns)
+        dest = os.path.join(output, strip_extension(os.path.basename(source)))
+    else:
+        raise ValueError(f"Selective extraction is supported for TAR and {INDEXED_EXTENSION} archives")
+
+    if not entries:
+        raise ValueError(f"No archive members match: {', '.join(patterns)}")
+
+    names = [entry["name"] for entry in entries]
+    LogCreate(
+        "DecompressModule",
+        f"Extracting {len(names)} selected members: {source} → {dest}"
+    )
+
+    if is_indexed_archive(source):
+        count = extract_indexed_archive(source, dest, workers=workers, members=names, progress=progress)
+    else:
+        count = extract_tar_members(source, dest, names, progress=progress, chunk_size=chunk_size)
+
+    LogCreate(
+        "DecompressModule",
+        f"Selected members extracted: {count} entries",
+        level="SUCCESS"
+    )
+    return count
+
+
+def track(raw_in, progress):
+    """
+    Membungkus file sumber dengan ProgressReader sehingga byte
+    terkompresi yang dibaca dilaporkan ke progress.
+    Mengembalikan raw_in apa adanya jika progress kosong.
+    """
+    if progress is None:
+        return raw_in
+
+    progress.add_total(os.fstat(raw_in.fileno()).st_size)
+    return ProgressReader(raw_in, progress)
+
+
+@contextmanager
+def open_decompressed(source, codec, workers=1, progress=None):
+    """
+    Membuka source sebagai stream data hasil dekompresi. File gzip
+    dibaca oleh ParallelGzipReader jika workers lebih dari satu,
+    selain itu dibaca dengan reader streaming milik codec.
+    """
+    if workers > 1 and codec.name == "gzip":
+        with ParallelGzipReader(source, workers, progress=progress) as reader:
+            yield reader
+        return
+
+    with open(source, "rb") as raw_in, codec.open_reader(track(raw_in, progress)) as reader:
+        yield reader
+
+
+def decompress_file(source, output, workers=1, progress=None, chunk_size=DEFAULT_BLOCK_SIZE):
+    """
+    Mendekompresi satu file terkompresi (contoh: .gz)
+    dan mengembalikannya ke bentuk file asli.
+
+    Data didekompresi dan ditulis per potongan chunk_size byte dengan
+    satu buffer yang dipakai ulang, sehingga file yang mengembang
+    menjadi puluhan GB tetap dapat diproses dengan memori kecil.
+    File gzip multi-member didekompresi paralel oleh workers proses.
+    """
+    codec = codec_for_path(source)
+    if codec is None:
+        raise ValueError(f"Unsupported compressed file: {source}")
+
+    filename = os.path.basename(source)
+    dest = os.path.join(output, strip_extension(filename))
+
+    LogCreate(
+        "DecompressModule",
+        f"Decompressing single file ({codec.name}): {source} → {dest} "
+        f"(chunk size {chunk_size} bytes, workers {workers})"
+    )
+
+    # Mendekompresi isi file per potongan ke file output
+    with open_decompressed(source, codec, workers, progress) as reader:
+        with open(dest, "wb") as dest_file:
+            total = copy_stream(reader, dest_file, chunk_size)
+
+    LogCreate(
+        "DecompressModule",
+        f"File decompression completed: {dest} ({total} bytes written)",
+        level="SUCCESS"
+    )
+    return dest
+
+
+def read_head(source, limit=VIEW_LIMIT, chunk_size=DEFAULT_BLOCK_SIZE):
+    """
+    Membaca paling banyak limit byte pertama dari file biasa maupun
+    file terkompresi (ditentukan dari ekstensi) per potongan
+    chunk_size byte. Mengembalikan tuple (data, terpotong) dengan
+    terpotong bernilai True jika file masih memiliki data lanjutan.
+    """
+    codec = codec_for_path(source)
+
+    with open(source, "rb") as raw_in:
+        reader = raw_in if codec is None else codec.open_reader(raw_in)
+        with reader:
+            data = bytearray()
+            while len(data) < limit:
+                chunk = reader.read(min(chunk_size, limit - len(data)))
+                if not chunk:
+                    return bytes(data), False
+                data += chunk
+
+            return bytes(data), bool(reader.read(1))
+
+
+def decompress_folder(source, output, workers=1, progress=None, chunk_size=DEFAULT_BLOCK_SIZE):
+    """
+    Mendekompresi arsip TAR terkompresi (contoh: .tar.gz)
+    dan mengekstraknya menjadi folder pada direktori tujuan.
+    Isi setiap file disalin per potongan chunk_size byte.
+    Arsip .tar.gz multi-member didekompresi paralel oleh workers proses,
+    dan jika workers lebih dari satu, file ditulis oleh workers thread
+    penulis sehingga arsip berisi banyak file kecil diekstrak lebih cepat.
+    """
+    codec = codec_for_path(source)
+    folder_name = os.path.basename(source)
+    tar_path = os.path.join(output, strip_extension(folder_name))
+
+    LogCreate(
+        "DecompressModule",
+        f"Extracting TAR ({codec.name}): {source} → {tar_path} (workers {workers})"
+    )
+
+    # Mengekstrak arsip TAR secara streaming ke folder tujuan
+    with open_decompressed(source, codec, workers, progress) as reader:
+        with tarfile.open(fileobj=reader, mode="r|", copybufsize=chunk_size) as tar:
+            if workers > 1:
+                extract_parallel(tar, tar_path, workers, chunk_size=chunk_size)
+            else:
+                tar.extractall(path=tar_path)
+
+    LogCreate(
+        "DecompressModule",
+        f"Folder extracted successfully: {tar_path}",
+        level="SUCCESS"
+    )
+    return tar_path
+
+
+def decompress_indexed(source, output, workers=1, progress=None):
+    """
+    Mengekstrak Indexed Archive (.iarc) ke folder tujuan.
+    Setiap entri didekompresi secara paralel oleh worker pool.
+    """
+    LogCreate(
+        "DecompressModule",
+        f"Extracting indexed archive: {source} → {output} (workers {workers})"
+    )
+
+    count = extract_indexed_archive(source, output, workers=workers, progress=progress)
+
+    LogCreate(
+        "DecompressModule",
+        f"Indexed archive extracted: {count} entries",
+        level="SUCCESS"
+    )
+    return count
+
+
+def decompress_incremental(source, output, progress=None):
+    """
+    Membangun ulang kondisi folder terbaru dari manifest inkremental,
+    yaitu arsip dasar lalu seluruh arsip delta secara berurutan.
+    """
+    LogCreate(
+        "DecompressModule",
+        f"Restoring incremental archive: {source} → {output}"
+    )
+
+    count = restore_incremental(source, output, progress=progress)
+
+    LogCreate(
+        "DecompressModule",
+        f"Incremental restore completed: {count} archives applied",
+        level="SUCCESS"
+    )
+    return count
+
+
+def decompress_snapshot(source, output, progress=None):
+    """
+    Memulihkan folder dari snapshot dedup store dengan menyusun
+    ulang setiap file dari chunk yang dirujuk snapshot.
+    """
+    LogCreate(
+        "DecompressModule",
+        f"Restoring dedup snapshot: {source} → {output}"
+    )
+
+    count = restore_snapshot(source, output, progress=progress)
+
+    LogCreate(
+        "DecompressModule",
+        f"Dedup restore completed: {count} entries restored",
+        level="SUCCESS"
+    )
+    return count
+
+
+def verify_source(source, workers=1, progress=None, chunk_size=DEFAULT_BLOCK_SIZE,
+                  hash_list=None, save_hashes=False):
+    """
+    Memeriksa keutuhan arsip tanpa menulis hasil dekompresi ke disk.
+
+    Hash SHA-256 setiap file dibandingkan dengan hash_list (format
+    sha256sum atau manifest inkremental); jika hash_list kosong,
+    sidecar <arsip>.sha256 dipakai apabila ada. Jika save_hashes
+    bernilai True, hash hasil verifikasi disimpan ke sidecar tersebut.
+    Mengembalikan hasil verifikasi dalam bentuk dict.
+    """
+    if hash_list is None and os.path.exists(hash_list_path(source)) and not save_hashes:
+        hash_list = hash_list_path(source)
+
+    LogCreate(
+        "DecompressModule",
+        f"Verifying archive: {source} (workers {workers}"
+        + (f", hash list {hash_list})" if hash_list else ")")
+    )
+
+    result = verify_archive(
+        source, workers=workers, progress=progress, chunk_size=chunk_size,
+        compute_hashes=hash_list is not None or save_hashes
+    )
+
+    if hash_list is not None:
+        problems = compare_hashes(result["hashes"], load_hash_list(hash_list))
+        if problems:
+            raise ValueError(
+                f"{len(problems)} entries do not match {hash_list}: {'; '.join(problems[:10])}"
+            )
+
+    if save_hashes:
+        write_hash_list(hash_list_path(source), result["hashes"])
+
+    LogCreate(
+        "DecompressModule",
+        f"Archive verified: {source} ({result['entries']} entries, {result['bytes']} bytes)",
+        level="SUCCESS"
+    )
+    return result
+
+
+def decompress_source(source, output, workers=1, progress=None, chunk_size=DEFAULT_BLOCK_SIZE):
+    """
+    Menentukan jenis file terkompresi lalu menjalankan
+    proses dekompresi yang sesuai untuk satu sumber.
+    Progres dilaporkan ke progress (ProgressReporter) jika diisi.
+    chunk_size menentukan ukuran buffer dekompresi file tunggal dan TAR,
+    sedangkan workers juga dipakai untuk dekompresi gzip paralel.
+    Mengembalikan hasil dari fungsi dekompresi yang dijalankan.
+    """
+    if is_manifest(source):
+        LogCreate("DecompressModule", "Mode: Incremental Restore")
+        return decompress_incremental(source, output, progress=progress)
+
+    if is_snapshot(source):
+        LogCreate("DecompressModule", "Mode: Dedup Snapshot Restore")
+        return decompress_snapshot(source, output, progress=progress)
+
+    if is_indexed_archive(source):
+        LogCreate("DecompressModule", "Mode: Indexed Archive Decompression")
+        return decompress_indexed(source, output, workers=workers, progress=progress)
+
+    if is_tar_archive(source):
+        LogCreate("DecompressModule", "Mode: TAR Folder Decompression")
+        return decompress_folder(source, output, workers=workers, progress=progress, chunk_size=chunk_size)
+
+    LogCreate("DecompressModule", "Mode: Single File Decompression")
+    return decompress_file(source, output, workers=workers, progress=progress, chunk_size=chunk_size)
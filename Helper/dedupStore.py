@@ -0,0 +1,380 @@
+"""
+Helper DedupStore.
+
+Helper ini menyediakan penyimpanan cadangan folder dengan deduplikasi
+berbasis content-defined chunking (CDC). Setiap file dipotong menjadi
+chunk menggunakan rolling hash (Gear hash, seperti FastCDC), sehingga
+batas chunk mengikuti isi data dan tidak bergeser ketika sebagian
+kecil file berubah. Setiap chunk unik disimpan terkompresi satu kali
+berdasarkan hash SHA-256, dan setiap snapshot hanya berupa resep
+(daftar referensi chunk) berukuran kecil.
+
+Struktur folder store:
+    <store>/chunks/<2 karakter awal hash>/<hash sha256>
+    <store>/snapshots/<nama folder>-YYYYmmdd-HHMMSS.snapshot.json
+"""
+
+import hashlib
+import json
+import os
+import stat
+import time
+import zlib
+from datetime import datetime
+
+from Helper.indexedArchive import iter_tree, safe_join
+from Helper.jobQueue import source_size
+
+# Nama folder store default di dalam folder output
+DEDUP_STORE_NAME = "dedup-store"
+
+# Akhiran nama file snapshot (resep)
+SNAPSHOT_SUFFIX = ".snapshot.json"
+
+# Ukuran chunk minimum, rata-rata, dan maksimum
+MIN_CHUNK_SIZE = 16 * 1024
+AVG_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 256 * 1024
+
+# Ukuran pembacaan file saat proses chunking
+READ_SIZE = 1024 * 1024
+
+# Lebar rolling hash (bit). Bit ke-j hash bergantung pada j + 1 byte
+# terakhir, sehingga jendela hash paling lebar HASH_BITS byte
+HASH_BITS = 64
+
+# Tabel Gear: 256 bilangan HASH_BITS-bit yang deterministik (diturunkan
+# dari SHA-256) agar batas chunk selalu sama di setiap proses dan versi Python
+GEAR = [
+    int.from_bytes(hashlib.sha256(bytes([value])).digest()[:HASH_BITS // 8], "little")
+    for value in range(256)
+]
+
+# Tabel translate per kelompok bit Gear: GEAR_TABLES[m] memetakan
+# setiap byte ke satu byte yang bit ke-r-nya adalah bit ke-(8r + m)
+# nilai Gear byte tersebut, untuk perhitungan hash secara massal
+GEAR_TABLES = [
+    bytes(sum(((GEAR[value] >> (8 * lane_bit + group)) & 1) << lane_bit for lane_bit in range(8))
+          for value in range(256))
+    for group in range(8)
+]
+
+# Panjang potongan data yang dipindai sekaligus saat mencari batas chunk
+SCAN_SIZE = 32 * 1024
+
+
+def chunk_masks(avg_size):
+    """
+    Membuat pasangan mask untuk normalized chunking: mask yang lebih
+    ketat sebelum ukuran rata-rata dan lebih longgar sesudahnya,
+    sehingga ukuran chunk lebih terkonsentrasi di sekitar rata-rata.
+    Mask diletakkan pada bit teratas hash karena bit tersebut
+    bergantung pada jendela byte terpanjang (seperti FastCDC).
+    """
+    bits = max(1, avg_size.bit_length() - 1)
+    strict = ((1 << (bits + 1)) - 1) << (HASH_BITS - bits - 1)
+    loose = ((1 << (bits - 1)) - 1) << (HASH_BITS - bits + 1)
+    return strict, loose
+
+
+def find_boundary(data, start, stop, mask):
+    """
+    Mencari posisi pertama p di antara start dan stop yang nilai Gear
+    hash-nya memenuhi hash & mask == 0, dengan hash dihitung per byte
+    sebagai h = ((h << 1) ^ GEAR[byte]) dipotong ke HASH_BITS bit
+    (jendela HASH_BITS byte terakhir hingga p).
+    Mengembalikan p + 1, atau 0 jika tidak ada.
+
+    Hash tidak dihitung dengan loop per byte. Bit ke-j hash pada posisi
+    i sama dengan bit ke-(j - 1) pada posisi i - 1 di-XOR bit ke-j nilai
+    Gear byte ke-i. Setiap posisi diwakili satu byte (lane) di dalam
+    integer Python, dan kelompok ke-m menyimpan bit ke-(8r + m) pada bit
+    ke-r lane, sehingga satu geseran 8 bit dan satu XOR menghitung
+    delapan bit hash untuk seluruh potongan sekaligus di C. Delapan
+    putaran atas delapan kelompok melengkapi seluruh 64 bit hash.
+    """
+    begin = max(0, start - HASH_BITS + 1)
+    segment = bytes(data[begin:stop])
+    ones = int.from_bytes(b"\x01" * len(segment), "little")
+    keep = ones * 0x7F
+    planes = [int.from_bytes(segment.translate(table), "little") for table in GEAR_TABLES]
+
+    groups = [0] * 8
+    for _ in range(HASH_BITS // 8):
+        for group in range(8):
+            if group:
+                previous = groups[group - 1]
+            else:
+                # Bit ke-(8r - 1) berada di kelompok 7 pada bit lane r - 1
+                previous = (groups[7] & keep) << 1
+            groups[group] = (previous << 8) ^ planes[group]
+
+    # Lane bernilai nol jika seluruh bit hash yang dipilih mask bernilai nol
+    selected = 0
+    for group in range(8):
+        lane_mask = sum(((mask >> (8 * lane_bit + group)) & 1) << lane_bit for lane_bit in range(8))
+        if lane_mask:
+            selected |= groups[group] & (ones * lane_mask)
+
+    found = selected.to_bytes(len(segment), "little").find(0, start - begin)
+    return begin + found + 1 if found >= 0 else 0
+
+
+def cut_point(data, min_size=MIN_CHUNK_SIZE, avg_size=AVG_CHUNK_SIZE, max_size=MAX_CHUNK_SIZE):
+    """
+    Mencari batas chunk pertama di dalam data menggunakan Gear hash.
+
+    Byte sebelum min_size tidak diperiksa (lompatan seperti FastCDC)
+    karena tidak mungkin menjadi batas chunk. Data dipindai per
+    SCAN_SIZE byte agar pencarian berhenti tidak jauh setelah batas
+    ditemukan.
+    Mengembalikan panjang chunk pertama.
+    """
+    size = len(data)
+    if size <= min_size:
+        return size
+
+    mask_strict, mask_loose = chunk_masks(avg_size)
+    middle = min(size, avg_size)
+    end = min(size, max_size)
+
+    offset = min_size
+    while offset < end:
+        mask, limit = (mask_strict, middle) if offset < middle else (mask_loose, end)
+        stop = min(limit, offset + SCAN_SIZE)
+        found = find_boundary(data, offset, stop, mask)
+        if found:
+            return found
+        offset = stop
+
+    return end
+
+
+def iter_chunks(fileobj, min_size=MIN_CHUNK_SIZE, avg_size=AVG_CHUNK_SIZE, max_size=MAX_CHUNK_SIZE):
+    """
+    Memotong isi stream menjadi chunk berbasis isi.
+    Buffer yang ditahan tidak pernah melebihi max_size + READ_SIZE.
+    """
+    buffer = bytearray()
+    eof = False
+
+    while True:
+        while not eof and len(buffer) < max_size:
+            data = fileobj.read(READ_SIZE)
+            if not data:
+                eof = True
+            buffer += data
+
+        if not buffer:
+            return
+
+        cut = cut_point(buffer, min_size, avg_size, max_size)
+        yield bytes(buffer[:cut])
+        del buffer[:cut]
+
+
+def is_snapshot(path):
+    """
+    Mengecek apakah path merupakan file snapshot dedup.
+    """
+    return str(path).endswith(SNAPSHOT_SUFFIX)
+
+
+class DedupStore:
+    """
+    Penyimpanan chunk unik beserta snapshot (resep) folder.
+    """
+
+    def __init__(self, root, compresslevel=6):
+        """
+        Parameter:
+        - root          : folder store
+        - compresslevel : level zlib untuk chunk yang baru disimpan
+        """
+        self.root = root
+        self.compresslevel = compresslevel
+        self.chunk_dir = os.path.join(root, "chunks")
+        self.snapshot_dir = os.path.join(root, "snapshots")
+        os.makedirs(self.chunk_dir, exist_ok=True)
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+
+    def chunk_path(self, digest):
+        """
+        Mengembalikan path file untuk satu chunk berdasarkan hash-nya.
+        """
+        return os.path.join(self.chunk_dir, digest[:2], digest)
+
+    def put_chunk(self, chunk):
+        """
+        Menyimpan chunk jika belum ada di store.
+        Mengembalikan tuple (hash, ukuran tersimpan); ukuran tersimpan
+        bernilai 0 jika chunk sudah ada sebelumnya (duplikat).
+        """
+        digest = hashlib.sha256(chunk).hexdigest()
+        path = self.chunk_path(digest)
+        if os.path.exists(path):
+            return digest, 0
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = zlib.compress(chunk, self.compresslevel)
+
+        # Ditulis ke file sementara dulu agar chunk tidak pernah setengah jadi
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+        return digest, len(data)
+
+    def get_chunk(self, digest):
+        """
+        Membaca dan mendekompresi satu chunk, lalu memverifikasi hash-nya.
+        """
+        with open(self.chunk_path(digest), "rb") as f:
+            chunk = zlib.decompress(f.read())
+
+        if hashlib.sha256(chunk).hexdigest() != digest:
+            raise ValueError(f"Chunk is corrupt: {digest}")
+
+        return chunk
+
+    def backup(self, source, progress=None):
+        """
+        Menyimpan snapshot folder ke store. Jika progress diisi,
+        byte setiap chunk dilaporkan ke progress.
+
+        Mengembalikan dict statistik: path snapshot, byte logis,
+        byte chunk baru, byte tersimpan (terkompresi), rasio dedup
+        (byte logis dibagi byte chunk unik yang dirujuk snapshot),
+        lama proses, dan throughput ingest (MB/s).
+        """
+        started = time.perf_counter()
+        folder_name = os.path.basename(os.path.normpath(source))
+
+        entries = []
+        logical = 0
+        new_raw = 0
+        stored = 0
+        chunk_count = 0
+        unique = {}
+
+        if progress is not None:
+            progress.add_total(source_size(source))
+
+        for path, name in iter_tree(source, folder_name):
+            info = os.lstat(path)
+            entry = {
+                "name": name,
+                "mode": stat.S_IMODE(info.st_mode),
+                "mtime": info.st_mtime,
+            }
+
+            if stat.S_ISDIR(info.st_mode):
+                entry["type"] = "dir"
+            elif stat.S_ISLNK(info.st_mode):
+                entry["type"] = "symlink"
+                entry["linkname"] = os.readlink(path)
+            elif stat.S_ISREG(info.st_mode):
+                entry["type"] = "file"
+                entry["chunks"] = []
+                entry["size"] = 0
+
+                with open(path, "rb") as f:
+                    for chunk in iter_chunks(f):
+                        digest, written = self.put_chunk(chunk)
+                        entry["chunks"].append(digest)
+                        entry["size"] += len(chunk)
+                        chunk_count += 1
+                        unique[digest] = len(chunk)
+                        if progress is not None:
+                            progress.advance(len(chunk))
+                        if written:
+                            new_raw += len(chunk)
+                            stored += written
+
+                logical += entry["size"]
+            else:
+                continue
+
+            entries.append(entry)
+
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        snapshot_path = os.path.join(self.snapshot_dir, f"{folder_name}-{timestamp}{SNAPSHOT_SUFFIX}")
+        counter = 1
+        while os.path.exists(snapshot_path):
+            counter += 1
+            snapshot_path = os.path.join(
+                self.snapshot_dir, f"{folder_name}-{timestamp}-{counter}{SNAPSHOT_SUFFIX}"
+            )
+
+        elapsed = time.perf_counter() - started
+        unique_bytes = sum(unique.values())
+        stats = {
+            "snapshot": snapshot_path,
+            "logical_bytes": logical,
+            "new_bytes": new_raw,
+            "stored_bytes": stored,
+            "chunks": chunk_count,
+            "dedup_ratio": logical / unique_bytes if unique_bytes else 1.0,
+            "elapsed": elapsed,
+            "mb_per_s": logical / 1048576 / elapsed if elapsed > 0 else 0.0,
+        }
+
+        with open(snapshot_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": 1,
+                "root": folder_name,
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "stats": {key: value for key, value in stats.items() if key != "snapshot"},
+                "entries": entries,
+            }, f)
+
+        return stats
+
+
+def restore_snapshot(snapshot_path, output, progress=None):
+    """
+    Memulihkan folder dari file snapshot ke folder output.
+    Lokasi store ditentukan dari posisi file snapshot di dalam store.
+    Jika progress diisi, byte asli yang ditulis dilaporkan ke progress.
+    Mengembalikan jumlah entri yang dipulihkan.
+    """
+    with open(snapshot_path, "r", encoding="utf-8") as f:
+        snapshot = json.load(f)
+
+    store_root = os.path.dirname(os.path.dirname(os.path.abspath(snapshot_path)))
+    store = DedupStore(store_root)
+    entries = snapshot["entries"]
+
+    if progress is not None:
+        progress.add_total(sum(entry.get("size", 0) for entry in entries))
+
+    os.makedirs(output, exist_ok=True)
+    for entry in entries:
+        dest = safe_join(output, entry["name"])
+
+        if entry["type"] == "dir":
+            os.makedirs(dest, exist_ok=True)
+        elif entry["type"] == "symlink":
+            if os.path.lexists(dest):
+                os.remove(dest)
+            os.symlink(entry["linkname"], dest)
+        else:
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            with open(dest, "wb") as out:
+                for digest in entry["chunks"]:
+                    chunk = store.get_chunk(digest)
+                    out.write(chunk)
+                    if progress is not None:
+                        progress.advance(len(chunk))
+            os.chmod(dest, entry["mode"])
+            os.utime(dest, (entry["mtime"], entry["mtime"]))
+
+    # Waktu folder dipulihkan terakhir karena penulisan file mengubahnya
+    for entry in reversed(entries):
+        if entry["type"] == "dir":
+            dest = safe_join(output, entry["name"])
+            os.chmod(dest, entry["mode"])
+            os.utime(dest, (entry["mtime"], entry["mtime"]))
+
+    return len(entries)
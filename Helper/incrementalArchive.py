@@ -0,0 +1,327 @@
+"""
+Helper IncrementalArchive.
+
+Helper ini menyediakan kompresi folder secara inkremental. Pada
+proses pertama dibuat arsip dasar (base) beserta manifest yang
+berisi path, ukuran, waktu modifikasi (mtime), dan hash SHA-256
+setiap file. Proses berikutnya hanya membuat arsip delta yang berisi
+file baru atau berubah, ditambah daftar tombstone untuk file yang
+sudah dihapus.
+
+Kondisi folder terbaru dapat dibangun ulang dari arsip dasar lalu
+menerapkan setiap arsip delta secara berurutan.
+
+Nama file yang dihasilkan pada folder output:
+- <folder>.manifest.json
+- <folder>.tar.gz                      (arsip dasar)
+- <folder>.delta-YYYYmmdd-HHMMSS.tar.gz (arsip delta)
+"""
+
+import hashlib
+import io
+import json
+import os
+import shutil
+import stat
+import tarfile
+from datetime import datetime
+
+from Helper.adaptiveCompress import AdaptivePolicy
+from Helper.codecRegistry import DEFAULT_CODEC, codec_for_path, get_codec
+from Helper.indexedArchive import iter_tree, safe_join
+from Helper.progressReporter import ProgressReader
+from Helper.streamCompress import DEFAULT_BLOCK_SIZE, open_writer
+
+# Akhiran nama file manifest
+MANIFEST_SUFFIX = ".manifest.json"
+
+# Nama member khusus di dalam arsip delta yang berisi daftar tombstone.
+# Berada di luar folder root sehingga tidak bentrok dengan file asli.
+TOMBSTONE_MEMBER = ".tombstones.json"
+
+# Ukuran buffer pembacaan file saat menghitung hash
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class HashingReader:
+    """
+    Objek file-like (hanya baca) yang menghitung hash SHA-256 dari
+    data yang dibaca, sehingga hash dapat dihitung sambil file
+    ditulis ke arsip tanpa membaca file dua kali.
+    """
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.hash = hashlib.sha256()
+
+    def read(self, size=-1):
+        data = self.fileobj.read(size)
+        self.hash.update(data)
+        return data
+
+    def hexdigest(self):
+        return self.hash.hexdigest()
+
+
+def manifest_path(output, folder_name):
+    """
+    Mengembalikan path file manifest untuk sebuah folder.
+    """
+    return os.path.join(output, folder_name + MANIFEST_SUFFIX)
+
+
+def is_manifest(path):
+    """
+    Mengecek apakah path merupakan file manifest inkremental.
+    """
+    return str(path).endswith(MANIFEST_SUFFIX)
+
+
+def hash_file(path):
+    """
+    Menghitung hash SHA-256 isi sebuah file.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(HASH_BLOCK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def load_manifest(path):
+    """
+    Membaca manifest dari file JSON.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(path, manifest):
+    """
+    Menyimpan manifest secara atomik (tulis ke file sementara lalu
+    rename) agar manifest tidak rusak jika proses terhenti.
+    """
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(temp_path, path)
+
+
+def describe_entry(path, info):
+    """
+    Membuat data manifest untuk satu entri (tanpa hash).
+    """
+    if stat.S_ISDIR(info.st_mode):
+        return {"type": "dir"}
+
+    if stat.S_ISLNK(info.st_mode):
+        return {"type": "symlink", "linkname": os.readlink(path)}
+
+    return {"type": "file", "size": info.st_size, "mtime": info.st_mtime}
+
+
+def compress_incremental(source, output, codec=DEFAULT_CODEC, compresslevel=9, workers=1,
+                         block_size=DEFAULT_BLOCK_SIZE, adaptive=False, on_decision=None, progress=None):
+    """
+    Mengompresi folder secara inkremental.
+
+    Jika manifest belum ada, dibuat arsip dasar berisi seluruh folder.
+    Jika sudah ada, dibuat arsip delta berisi file baru atau berubah
+    beserta tombstone untuk entri yang dihapus. File dengan ukuran dan
+    mtime yang sama dianggap tidak berubah tanpa dibaca ulang; file
+    yang mtime-nya berubah dibandingkan melalui hash isinya.
+    Jika adaptive bernilai True dan codec mendukung kompresi per blok,
+    level kompresi dipilih ulang untuk setiap file yang diarsipkan dan
+    dilaporkan melalui callback on_decision(path, keputusan, level, rasio).
+    Jika progress diisi, file yang tidak berubah langsung dihitung
+    selesai dan byte file yang diarsipkan dilaporkan saat dibaca.
+
+    Mengembalikan dict berisi path arsip (None jika tidak ada
+    perubahan), jenis arsip, jumlah entri berubah, dan jumlah tombstone.
+    """
+    codec = get_codec(codec)
+    folder_name = os.path.basename(os.path.normpath(source))
+    manifest_file = manifest_path(output, folder_name)
+
+    previous = load_manifest(manifest_file) if os.path.exists(manifest_file) else None
+    old_entries = previous["entries"] if previous else {}
+
+    # Menelusuri folder dan menentukan entri yang berubah
+    entries = {}
+    changed = []
+    tombstones = []
+    for path, name in iter_tree(source, folder_name):
+        info = os.lstat(path)
+        if not (stat.S_ISDIR(info.st_mode) or stat.S_ISLNK(info.st_mode) or stat.S_ISREG(info.st_mode)):
+            continue
+
+        entry = describe_entry(path, info)
+        old = old_entries.get(name)
+        entries[name] = entry
+
+        if old is not None and old["type"] != entry["type"]:
+            # Jenis entri berubah (misal file menjadi folder): hapus dulu
+            tombstones.append(name)
+            old = None
+
+        if entry["type"] == "file":
+            if progress is not None:
+                progress.add_total(entry["size"])
+
+            if old is not None and old["size"] == entry["size"] and old["mtime"] == entry["mtime"]:
+                entry["sha256"] = old["sha256"]
+                if progress is not None:
+                    progress.advance(entry["size"])
+                continue
+
+            if old is not None and old["size"] == entry["size"]:
+                entry["sha256"] = hash_file(path)
+                if entry["sha256"] == old["sha256"]:
+                    if progress is not None:
+                        progress.advance(entry["size"])
+                    continue
+
+        elif old is not None and old == entry:
+            continue
+
+        changed.append((path, name))
+
+    tombstones += sorted(name for name in old_entries if name not in entries)
+
+    if previous is not None and not changed and not tombstones:
+        return {"archive": None, "kind": "delta", "changed": 0, "tombstones": 0}
+
+    # Menentukan nama arsip dasar atau delta
+    if previous is None:
+        kind = "base"
+        archive_name = folder_name + ".tar" + codec.extension
+    else:
+        kind = "delta"
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        archive_name = f"{folder_name}.delta-{timestamp}.tar{codec.extension}"
+
+        # Mencegah nama bentrok jika dua delta dibuat pada detik yang sama
+        counter = 1
+        while os.path.exists(os.path.join(output, archive_name)):
+            counter += 1
+            archive_name = f"{folder_name}.delta-{timestamp}-{counter}.tar{codec.extension}"
+
+    archive_path = os.path.join(output, archive_name)
+    adaptive = adaptive and codec.supports_blocks
+    policy = AdaptivePolicy(codec, compresslevel) if adaptive else None
+
+    with open(archive_path, "wb") as raw_out:
+        with open_writer(raw_out, codec, compresslevel, workers, block_size, blocks=adaptive) as writer:
+            with tarfile.open(fileobj=writer, mode="w", copybufsize=block_size) as tar:
+                if kind == "delta":
+                    data = json.dumps(tombstones).encode("utf-8")
+                    info = tarfile.TarInfo(TOMBSTONE_MEMBER)
+                    info.size = len(data)
+                    tar.addfile(info, io.BytesIO(data))
+
+                for path, name in changed:
+                    tarinfo = tar.gettarinfo(path, arcname=name)
+                    if not tarinfo.isreg():
+                        tar.addfile(tarinfo)
+                        continue
+
+                    # Level writer diganti sebelum header dan isi file ditulis
+                    if policy is not None:
+                        level, decision, ratio = policy.choose_for_file(path)
+                        writer.set_level(level)
+                        if on_decision is not None:
+                            on_decision(name, decision, level, ratio)
+
+                    with open(path, "rb") as f:
+                        reader = HashingReader(f)
+                        if progress is None:
+                            tar.addfile(tarinfo, reader)
+                        else:
+                            tar.addfile(tarinfo, ProgressReader(reader, progress))
+                        entries[name]["sha256"] = reader.hexdigest()
+
+    archives = previous["archives"] if previous else []
+    archives.append({
+        "file": archive_name,
+        "kind": kind,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "changed": len(changed),
+        "tombstones": len(tombstones),
+    })
+
+    save_manifest(manifest_file, {
+        "version": 1,
+        "root": folder_name,
+        "archives": archives,
+        "entries": entries,
+    })
+
+    return {
+        "archive": archive_path,
+        "kind": kind,
+        "changed": len(changed),
+        "tombstones": len(tombstones),
+    }
+
+
+def remove_path(path):
+    """
+    Menghapus file, symlink, atau folder (beserta isinya) jika ada.
+    """
+    if os.path.islink(path) or os.path.isfile(path):
+        os.remove(path)
+    elif os.path.isdir(path):
+        shutil.rmtree(path)
+
+
+def apply_archive(archive_path, output, progress=None):
+    """
+    Mengekstrak satu arsip dasar atau delta ke folder output.
+    Tombstone di dalam arsip delta diterapkan sebelum entri lain
+    diekstrak. Jika progress diisi, byte arsip (terkompresi) yang
+    dibaca dilaporkan ke progress.
+    Mengembalikan jumlah tombstone yang diterapkan.
+    """
+    codec = codec_for_path(archive_path)
+    applied = 0
+
+    with open(archive_path, "rb") as raw_in:
+        source = raw_in if progress is None else ProgressReader(raw_in, progress)
+        with codec.open_reader(source) as reader, tarfile.open(fileobj=reader, mode="r|") as tar:
+            for member in tar:
+                if member.name == TOMBSTONE_MEMBER:
+                    tombstones = json.loads(tar.extractfile(member).read().decode("utf-8"))
+                    for name in tombstones:
+                        remove_path(safe_join(output, name))
+                    applied += len(tombstones)
+                    continue
+
+                safe_join(output, member.name)
+                tar.extract(member, path=output)
+
+    return applied
+
+
+def restore_incremental(manifest_file, output, progress=None):
+    """
+    Membangun ulang kondisi folder terbaru dari arsip dasar dan
+    seluruh arsip delta yang tercatat di manifest, sesuai urutan.
+    Jika progress diisi, total progres adalah ukuran seluruh arsip.
+    Mengembalikan jumlah arsip yang diterapkan.
+    """
+    manifest = load_manifest(manifest_file)
+    archive_dir = os.path.dirname(os.path.abspath(manifest_file))
+    archive_paths = [os.path.join(archive_dir, archive["file"]) for archive in manifest["archives"]]
+
+    if progress is not None:
+        progress.add_total(sum(os.path.getsize(path) for path in archive_paths))
+
+    os.makedirs(output, exist_ok=True)
+    for archive_path in archive_paths:
+        apply_archive(archive_path, output, progress)
+
+    return len(manifest["archives"])
@@ -0,0 +1,353 @@
+"""
+Helper IndexedArchive.
+
+Helper ini menyediakan format arsip alternatif selain .tar.gz yang
+disebut Indexed Archive (.iarc). Setiap file di dalam arsip
+dikompresi secara terpisah, lalu sebuah indeks pusat disimpan di
+akhir arsip. Dengan format ini:
+
+- daftar isi arsip dapat dibaca seketika tanpa dekompresi data,
+- satu file dapat diekstrak tanpa mendekompresi file sebelumnya,
+- kompresi dan ekstraksi dapat dikerjakan paralel oleh worker pool.
+
+Struktur file:
+    MAGIC | data entri 1 | data entri 2 | ... | indeks (JSON + zlib) | trailer
+
+Trailer berukuran tetap berisi offset indeks, panjang indeks, dan MAGIC.
+"""
+
+import json
+import os
+import shutil
+import stat
+import struct
+import tempfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from Helper.adaptiveCompress import AdaptivePolicy
+from Helper.codecRegistry import DEFAULT_CODEC, get_codec
+from Helper.jobQueue import source_size
+
+# Ekstensi dan penanda format arsip
+INDEXED_EXTENSION = ".iarc"
+MAGIC = b"IARCHV01"
+
+# Trailer: offset indeks (Q), panjang indeks (Q), MAGIC (8s)
+TRAILER = struct.Struct("<QQ8s")
+
+# Nama codec khusus untuk entri yang disimpan tanpa kompresi
+STORE_CODEC = "store"
+
+# Ukuran maksimal hasil kompresi satu entri yang ditahan di memori
+# sebelum dipindahkan ke file sementara di disk
+SPOOL_LIMIT = 8 * 1024 * 1024
+
+# Ukuran buffer baca/tulis isi entri
+COPY_SIZE = 1024 * 1024
+
+
+class SliceReader:
+    """
+    Objek file-like (hanya baca) yang membatasi pembacaan pada
+    rentang byte tertentu dari sebuah file.
+    """
+
+    def __init__(self, fileobj, offset, length):
+        self.fileobj = fileobj
+        self.remaining = length
+        self.fileobj.seek(offset)
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        """
+        Membaca maksimal size byte tanpa melewati batas rentang.
+        """
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+
+        data = self.fileobj.read(size)
+        self.remaining -= len(data)
+        return data
+
+
+def is_indexed_archive(path):
+    """
+    Mengecek apakah path merupakan Indexed Archive berdasarkan ekstensi.
+    """
+    return str(path).lower().endswith(INDEXED_EXTENSION)
+
+
+def safe_join(root, name):
+    """
+    Menggabungkan nama entri dengan folder tujuan dan menolak nama
+    yang keluar dari folder tujuan (path absolut atau '..').
+    """
+    root = os.path.abspath(root)
+    target = os.path.abspath(os.path.join(root, name))
+    if os.path.isabs(name) or os.path.commonpath([root, target]) != root:
+        raise ValueError(f"Unsafe entry path in archive: {name}")
+
+    return target
+
+
+def iter_tree(source, arcname):
+    """
+    Menelusuri folder secara depth-first dengan urutan nama terurut,
+    sama seperti urutan yang digunakan tarfile.add.
+    Menghasilkan pasangan (path sumber, nama entri).
+    """
+    yield source, arcname
+
+    if os.path.isdir(source) and not os.path.islink(source):
+        for name in sorted(os.listdir(source)):
+            yield from iter_tree(os.path.join(source, name), arcname + "/" + name)
+
+
+def compress_entry(path, codec, level, block_size=COPY_SIZE, progress=None):
+    """
+    Mengompresi satu file ke file sementara (spooled) dan
+    menghitung CRC32 isi aslinya. Jika progress diisi, byte yang
+    dibaca dilaporkan ke progress.
+
+    Mengembalikan tuple (spool, ukuran asli, crc32). File sementara
+    hanya ditulis ke disk jika hasilnya melebihi SPOOL_LIMIT.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_LIMIT)
+    size = 0
+    crc = 0
+
+    try:
+        with open(path, "rb") as src:
+            if codec is None:
+                writer = spool
+            else:
+                writer = codec.open_writer(spool, level)
+
+            while True:
+                chunk = src.read(block_size)
+                if not chunk:
+                    break
+
+                crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+                writer.write(chunk)
+                if progress is not None:
+                    progress.advance(len(chunk))
+
+            if writer is not spool:
+                writer.close()
+
+        spool.seek(0)
+        return spool, size, crc
+
+    except BaseException:
+        spool.close()
+        raise
+
+
+def create_indexed_archive(source, dest, arcname=None, codec=DEFAULT_CODEC, compresslevel=9,
+                           workers=1, adaptive=False, on_decision=None, progress=None):
+    """
+    Membuat Indexed Archive dari sebuah folder.
+
+    File dikompresi oleh worker pool secara paralel, sedangkan thread
+    utama menuliskan hasilnya ke arsip sesuai urutan penelusuran.
+    Jumlah entri yang sedang diproses dibatasi dua kali jumlah worker
+    sehingga penggunaan memori tetap terbatas. Jika progress diisi,
+    setiap worker melaporkan byte yang dibaca ke progress.
+
+    Mengembalikan jumlah entri yang ditulis ke arsip.
+    """
+    codec = get_codec(codec)
+    policy = AdaptivePolicy(codec, compresslevel) if adaptive else None
+    arcname = arcname or os.path.basename(os.path.normpath(source))
+    workers = max(1, workers or 1)
+
+    if progress is not None:
+        progress.add_total(source_size(source))
+
+    entries = []
+    pending = deque()
+
+    with open(dest, "wb") as archive, ThreadPoolExecutor(max_workers=workers) as executor:
+        archive.write(MAGIC)
+
+        def write_result(entry, future):
+            """
+            Menyalin hasil kompresi satu entri ke arsip dan
+            melengkapi data entri untuk indeks.
+            """
+            spool, size, crc = future.result()
+            with spool:
+                entry["offset"] = archive.tell()
+                shutil.copyfileobj(spool, archive, COPY_SIZE)
+                entry["length"] = archive.tell() - entry["offset"]
+
+            entry["size"] = size
+            entry["crc32"] = crc
+
+        for path, name in iter_tree(source, arcname):
+            info = os.lstat(path)
+            entry = {
+                "name": name,
+                "mode": stat.S_IMODE(info.st_mode),
+                "mtime": info.st_mtime,
+            }
+            entries.append(entry)
+
+            if stat.S_ISDIR(info.st_mode):
+                entry["type"] = "dir"
+                continue
+
+            if stat.S_ISLNK(info.st_mode):
+                entry["type"] = "symlink"
+                entry["linkname"] = os.readlink(path)
+                continue
+
+            if not stat.S_ISREG(info.st_mode):
+                # Socket, FIFO, dan device tidak disertakan ke dalam arsip
+                entries.pop()
+                continue
+
+            entry["type"] = "file"
+            level = compresslevel
+            if policy is not None:
+                level, decision, ratio = policy.choose_for_file(path)
+                if on_decision is not None:
+                    on_decision(name, decision, level, ratio)
+
+            # Keputusan store disimpan mentah tanpa header codec
+            entry_codec = codec
+            if policy is not None and level == codec.store_level:
+                entry_codec = None
+
+            entry["codec"] = entry_codec.name if entry_codec is not None else STORE_CODEC
+            future = executor.submit(compress_entry, path, entry_codec, level, COPY_SIZE, progress)
+            pending.append((entry, future))
+
+            while len(pending) >= workers * 2:
+                write_result(*pending.popleft())
+
+        while pending:
+            write_result(*pending.popleft())
+
+        # Menulis indeks pusat dan trailer di akhir arsip
+        index_offset = archive.tell()
+        index_data = zlib.compress(json.dumps({"entries": entries}).encode("utf-8"), 9)
+        archive.write(index_data)
+        archive.write(TRAILER.pack(index_offset, len(index_data), MAGIC))
+
+    return len(entries)
+
+
+def read_index(path):
+    """
+    Membaca indeks pusat dari akhir arsip tanpa mendekompresi data
+    entri. Mengembalikan daftar entri (dict).
+    """
+    with open(path, "rb") as archive:
+        if archive.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not an indexed archive: {path}")
+
+        archive.seek(-TRAILER.size, os.SEEK_END)
+        index_offset, index_length, magic = TRAILER.unpack(archive.read(TRAILER.size))
+        if magic != MAGIC:
+            raise ValueError(f"Indexed archive trailer is corrupt: {path}")
+
+        archive.seek(index_offset)
+        index = json.loads(zlib.decompress(archive.read(index_length)).decode("utf-8"))
+
+    return index["entries"]
+
+
+def open_entry(archive, entry):
+    """
+    Membuka stream baca isi asli satu entri dari objek file arsip.
+    """
+    reader = SliceReader(archive, entry["offset"], entry["length"])
+    if entry["codec"] == STORE_CODEC:
+        return reader
+
+    return get_codec(entry["codec"]).open_reader(reader)
+
+
+def extract_entry(path, entry, dest, progress=None):
+    """
+    Mengekstrak satu entri file ke dest dan memverifikasi CRC32.
+    Setiap pemanggilan membuka handle arsip sendiri sehingga aman
+    dijalankan paralel dari beberapa thread.
+    """
+    crc = 0
+    with open(path, "rb") as archive, open(dest, "wb") as out:
+        reader = open_entry(archive, entry)
+        while True:
+            chunk = reader.read(COPY_SIZE)
+            if not chunk:
+                break
+
+            crc = zlib.crc32(chunk, crc)
+            out.write(chunk)
+            if progress is not None:
+                progress.advance(len(chunk))
+
+    if crc != entry["crc32"]:
+        raise ValueError(f"CRC mismatch for entry: {entry['name']}")
+
+    os.chmod(dest, entry["mode"])
+    os.utime(dest, (entry["mtime"], entry["mtime"]))
+
+
+def extract_indexed_archive(path, output, workers=1, members=None, progress=None):
+    """
+    Mengekstrak Indexed Archive ke folder output secara paralel.
+
+    Folder dibuat terlebih dahulu, kemudian file diekstrak oleh worker
+    pool, lalu symlink dibuat dan waktu modifikasi folder dipulihkan.
+    Jika members diisi, hanya entri dengan nama tersebut yang diekstrak.
+    Jika progress diisi, byte asli yang ditulis dilaporkan ke progress.
+    Mengembalikan jumlah entri yang diekstrak.
+    """
+    entries = read_index(path)
+    if members is not None:
+        wanted = set(members)
+        entries = [entry for entry in entries if entry["name"] in wanted]
+
+    os.makedirs(output, exist_ok=True)
+
+    for entry in entries:
+        if entry["type"] == "dir":
+            os.makedirs(safe_join(output, entry["name"]), exist_ok=True)
+
+    files = [entry for entry in entries if entry["type"] == "file"]
+    if progress is not None:
+        progress.add_total(sum(entry["size"] for entry in files))
+
+    with ThreadPoolExecutor(max_workers=max(1, workers or 1)) as executor:
+        futures = []
+        for entry in files:
+            dest = safe_join(output, entry["name"])
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            futures.append(executor.submit(extract_entry, path, entry, dest, progress))
+
+        for future in futures:
+            future.result()
+
+    for entry in entries:
+        if entry["type"] == "symlink":
+            dest = safe_join(output, entry["name"])
+            if os.path.lexists(dest):
+                os.remove(dest)
+            os.symlink(entry["linkname"], dest)
+
+    # Waktu folder dipulihkan terakhir karena penulisan file mengubahnya
+    for entry in reversed(entries):
+        if entry["type"] == "dir":
+            dest = safe_join(output, entry["name"])
+            os.chmod(dest, entry["mode"])
+            os.utime(dest, (entry["mtime"], entry["mtime"]))
+
+    return len(entries)
@@ -0,0 +1,228 @@
+"""
+Helper JobQueue.
+
+Helper ini menyediakan antrian pekerjaan (job queue) untuk menjalankan
+banyak proses kompresi atau dekompresi sekaligus menggunakan worker
+pool dengan ukuran tetap. Setiap job memiliki status sendiri dan di
+akhir proses dihasilkan ringkasan throughput total.
+
+Antrian dapat dibatalkan melalui cancel(): job yang belum berjalan
+ditandai cancelled tanpa dijalankan, sedangkan job yang sedang
+berjalan berhenti jika fungsinya melempar JobCancelled.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from Helper.progressReporter import JobCancelled
+
+# Status yang dapat dimiliki sebuah job
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+def source_size(path):
+    """
+    Menghitung ukuran sumber dalam byte. Untuk folder, ukuran adalah
+    jumlah ukuran seluruh file di dalamnya.
+    """
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            file_path = os.path.join(root, name)
+            if not os.path.islink(file_path):
+                total += os.path.getsize(file_path)
+
+    return total
+
+
+def load_source_list(path):
+    """
+    Membaca daftar sumber dari file teks (satu path per baris).
+    Baris kosong dan baris yang diawali '#' diabaikan.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return [
+            line.strip()
+            for line in f
+            if line.strip() and not line.strip().startswith("#")
+        ]
+
+
+class Job:
+    """
+    Satu pekerjaan di dalam antrian beserta status dan statistiknya.
+    """
+
+    def __init__(self, job_id, source, func):
+        """
+        Parameter:
+        - job_id : nomor urut job di dalam antrian
+        - source : path sumber yang diproses
+        - func   : fungsi func(source) yang menjalankan pekerjaan
+        """
+        self.job_id = job_id
+        self.source = source
+        self.func = func
+        self.status = QUEUED
+        self.error = None
+        self.size = 0
+        self.started = None
+        self.finished = None
+
+    @property
+    def elapsed(self):
+        """
+        Lama eksekusi job dalam detik.
+        """
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    def describe(self):
+        """
+        Mengembalikan satu baris teks status job untuk ditampilkan.
+        """
+        line = f"[{self.job_id:>3}] {self.status:<8} {self.source}"
+        if self.status == DONE:
+            line += f" ({self.size / 1048576:.1f} MB, {self.elapsed:.1f}s)"
+        elif self.status == FAILED:
+            line += f" ({self.error})"
+        return line
+
+
+class JobQueue:
+    """
+    Antrian job yang dijalankan oleh worker pool berukuran tetap.
+    """
+
+    def __init__(self, workers=1, on_update=None):
+        """
+        Parameter:
+        - workers   : jumlah job yang berjalan bersamaan
+        - on_update : callback on_update(job) setiap status job berubah
+        """
+        self.workers = max(1, workers or 1)
+        self.on_update = on_update
+        self.jobs = []
+        self.started = None
+        self.finished = None
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+
+    def add(self, source, func):
+        """
+        Menambahkan satu job ke antrian dan mengembalikan objek Job.
+        """
+        job = Job(len(self.jobs) + 1, source, func)
+        self.jobs.append(job)
+        return job
+
+    def cancel(self):
+        """
+        Membatalkan antrian: job yang belum berjalan tidak akan dijalankan.
+        """
+        self._cancel_event.set()
+
+    def run(self):
+        """
+        Menjalankan seluruh job dan menunggu hingga semuanya selesai.
+        Error pada satu job tidak menghentikan job lainnya.
+        Mengembalikan ringkasan dari summary().
+        """
+        self.started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for job in self.jobs:
+                executor.submit(self._run_job, job)
+
+        self.finished = time.perf_counter()
+        return self.summary()
+
+    def _run_job(self, job):
+        """
+        Menjalankan satu job dan memperbarui statusnya.
+        """
+        if self._cancel_event.is_set():
+            self._update(job, CANCELLED)
+            return
+
+        job.started = time.perf_counter()
+        self._update(job, RUNNING)
+
+        try:
+            job.size = source_size(job.source)
+            job.func(job.source)
+            job.finished = time.perf_counter()
+            self._update(job, DONE)
+
+        except JobCancelled:
+            job.finished = time.perf_counter()
+            self._update(job, CANCELLED)
+
+        except Exception as e:
+            job.finished = time.perf_counter()
+            job.error = str(e)
+            self._update(job, FAILED)
+
+    def _update(self, job, status):
+        """
+        Mengganti status job lalu memanggil callback on_update.
+        """
+        with self._lock:
+            job.status = status
+
+        if self.on_update is not None:
+            self.on_update(job)
+
+    def summary(self):
+        """
+        Mengembalikan ringkasan antrian dalam bentuk dict:
+        jumlah job, job berhasil, job gagal, job dibatalkan, total byte,
+        lama eksekusi, dan throughput rata-rata (MB/s).
+        """
+        done = [job for job in self.jobs if job.status == DONE]
+        failed = [job for job in self.jobs if job.status == FAILED]
+        cancelled = [job for job in self.jobs if job.status == CANCELLED]
+        total_bytes = sum(job.size for job in done)
+        elapsed = (self.finished or time.perf_counter()) - (self.started or time.perf_counter())
+
+        return {
+            "jobs": len(self.jobs),
+            "done": len(done),
+            "failed": len(failed),
+            "cancelled": len(cancelled),
+            "bytes": total_bytes,
+            "elapsed": elapsed,
+            "mb_per_s": total_bytes / 1048576 / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def status_text(self):
+        """
+        Mengembalikan status seluruh job sebagai teks multi-baris.
+        """
+        with self._lock:
+            return "\n".join(job.describe() for job in self.jobs)
+
+
+def format_summary(summary):
+    """
+    Mengubah ringkasan antrian menjadi satu baris teks.
+    """
+    text = f"{summary['done']}/{summary['jobs']} jobs done, {summary['failed']} failed, "
+    if summary["cancelled"]:
+        text += f"{summary['cancelled']} cancelled, "
+
+    return (
+        text
+        + f"{summary['bytes'] / 1048576:.1f} MB in {summary['elapsed']:.1f}s "
+        f"({summary['mb_per_s']:.1f} MB/s)"
+    )
@@ -0,0 +1,204 @@
+"""
+Helper MappedInput.
+
+Helper ini menyediakan jalur baca tanpa salinan (zero-copy) untuk
+file sumber di disk lokal. File dipetakan ke memori dengan mmap lalu
+diserahkan ke kompresor sebagai potongan memoryview, sehingga data
+tidak perlu disalin ke buffer bytes Python terlebih dahulu.
+
+Pipe, file kosong, dan file di network mount (NFS, SMB/CIFS, SSHFS,
+dan sejenisnya) tetap dibaca dengan buffer biasa, karena mmap pada
+sistem file jaringan dapat gagal (SIGBUS) jika file berubah di server.
+"""
+
+import mmap
+import os
+import stat
+import tarfile
+from contextlib import contextmanager
+
+# File lebih kecil dari ini dibaca biasa (biaya mmap lebih besar)
+MMAP_MIN_SIZE = 1024 * 1024
+
+# Halaman yang sudah dilewati sejauh ini dilepas dari memori proses
+RELEASE_INTERVAL = 16 * 1024 * 1024
+
+# Jenis sistem file jaringan yang tidak dipetakan ke memori
+NETWORK_FILESYSTEMS = {
+    "9p", "afs", "ceph", "cifs", "davfs", "fuse.davfs2", "fuse.glusterfs", "fuse.rclone",
+    "fuse.s3fs", "fuse.sshfs", "glusterfs", "ncpfs", "nfs", "nfs4", "smb3", "smbfs", "sshfs",
+}
+
+
+def is_local_path(path):
+    """
+    Mengecek apakah path berada di sistem file lokal. Di Linux jenis
+    sistem file dibaca dari /proc/self/mounts, sedangkan di Windows
+    path UNC (\\\\server\\share) dianggap network mount.
+    """
+    path = os.path.realpath(path)
+    if path.startswith("\\\\"):
+        return False
+
+    try:
+        with open("/proc/self/mounts", "r", encoding="utf-8", errors="replace") as f:
+            mounts = [line.split() for line in f]
+    except OSError:
+        return True
+
+    # Mount point terpanjang yang memuat path menentukan sistem filenya
+    best_point, best_type = "", ""
+    for fields in mounts:
+        if len(fields) < 3:
+            continue
+
+        point = fields[1].replace("\\040", " ")
+        inside = path == point or path.startswith(point.rstrip("/") + "/")
+        if inside and len(point) > len(best_point):
+            best_point, best_type = point, fields[2]
+
+    return best_type not in NETWORK_FILESYSTEMS
+
+
+def map_file(fileobj, min_size=MMAP_MIN_SIZE):
+    """
+    Memetakan file yang sudah dibuka ke memori (hanya baca).
+    Mengembalikan objek mmap, atau None jika file harus dibaca biasa
+    (bukan file reguler, lebih kecil dari min_size, atau mmap gagal).
+    """
+    try:
+        info = os.fstat(fileobj.fileno())
+    except (AttributeError, OSError, ValueError):
+        return None
+
+    if not stat.S_ISREG(info.st_mode) or info.st_size == 0 or info.st_size < min_size:
+        return None
+
+    try:
+        mapping = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, OverflowError):
+        return None
+
+    if hasattr(mapping, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+        mapping.madvise(mmap.MADV_SEQUENTIAL)
+
+    return mapping
+
+
+def close_mapping(mapping):
+    """
+    Menutup mmap. Jika masih ada memoryview yang merujuknya (misalnya
+    setelah error di tengah kompresi), penutupan diserahkan ke
+    garbage collector agar error aslinya tidak tertutupi.
+    """
+    try:
+        mapping.close()
+    except BufferError:
+        pass
+
+
+@contextmanager
+def mapped_file(fileobj, enabled=True):
+    """
+    Context manager yang menghasilkan mmap atas fileobj, atau None
+    jika enabled bernilai False, file berada di network mount, atau
+    file tidak dapat dipetakan.
+    """
+    name = getattr(fileobj, "name", None)
+    mapping = None
+    if enabled and isinstance(name, str) and is_local_path(name):
+        mapping = map_file(fileobj)
+
+    try:
+        yield mapping
+    finally:
+        if mapping is not None:
+            close_mapping(mapping)
+
+
+def read_blocks(fileobj, block_size, mapping=None, start=0):
+    """
+    Menghasilkan isi file per blok sebagai memoryview mulai dari
+    offset start. Dengan mapping, setiap blok adalah potongan mmap
+    tanpa salinan dan halaman yang sudah jauh dilewati dilepas dari
+    memori proses. Tanpa mapping, satu buffer dipakai ulang dengan
+    readinto, sehingga blok hanya valid sampai blok berikutnya dibaca.
+    """
+    if block_size <= 0:
+        raise ValueError("block_size must be greater than zero")
+
+    if mapping is None:
+        fileobj.seek(start)
+        buffer = bytearray(block_size)
+        view = memoryview(buffer)
+
+        while True:
+            size = fileobj.readinto(buffer)
+            if not size:
+                return
+            yield view[:size]
+
+    view = memoryview(mapping)
+    can_release = hasattr(mapping, "madvise") and hasattr(mmap, "MADV_DONTNEED")
+    released = start - start % mmap.PAGESIZE
+
+    try:
+        for offset in range(start, len(mapping), block_size):
+            yield view[offset:offset + block_size]
+
+            # Halaman file tetap ada di page cache; yang dilepas hanya
+            # pemetaannya sehingga RSS tetap kecil untuk file sangat besar
+            if can_release and offset - released >= 2 * RELEASE_INTERVAL:
+                end = (offset - RELEASE_INTERVAL) // mmap.PAGESIZE * mmap.PAGESIZE
+                mapping.madvise(mmap.MADV_DONTNEED, released, end - released)
+                released = end
+    finally:
+        view.release()
+
+
+class MappedReader:
+    """
+    Objek file-like (hanya baca) di atas mmap yang mengembalikan
+    potongan memoryview tanpa menyalin data.
+    """
+
+    def __init__(self, mapping):
+        self.view = memoryview(mapping)
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        end = len(self.view) if size is None or size < 0 else min(len(self.view), self.position + size)
+        data = self.view[self.position:end]
+        self.position = end
+        return data
+
+    def release(self):
+        self.view.release()
+
+
+class MappedTarFile(tarfile.TarFile):
+    """
+    TarFile yang membaca isi file besar di disk lokal melalui mmap,
+    sehingga tahap TAR tidak menyalin isi file ke buffer bytes.
+    Atribut use_mmap dapat dimatikan untuk membandingkan jalur baca.
+    """
+
+    use_mmap = True
+
+    def addfile(self, tarinfo, fileobj=None):
+        mapping = None
+        if self.use_mmap and fileobj is not None and tarinfo.size >= MMAP_MIN_SIZE:
+            mapping = map_file(fileobj)
+
+        if mapping is None:
+            return super().addfile(tarinfo, fileobj)
+
+        reader = MappedReader(mapping)
+        try:
+            return super().addfile(tarinfo, reader)
+        finally:
+            reader.release()
+            close_mapping(mapping)
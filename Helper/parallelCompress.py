@@ -0,0 +1,284 @@
+"""
+Helper ParallelCompress.
+
+Helper ini menyediakan mesin kompresi gzip paralel (mirip pigz).
+Data masukan dipotong menjadi blok berukuran tetap, setiap blok
+dikompresi sebagai member gzip independen oleh thread pool, lalu
+hasilnya ditulis berurutan. Gabungan beberapa member gzip tetap
+merupakan stream gzip standar yang dapat dibaca oleh modul gzip,
+tarfile, maupun tool gzip pada umumnya.
+
+Thread pool digunakan karena zlib melepaskan GIL selama proses
+kompresi, sehingga beberapa blok benar-benar dikompresi bersamaan.
+Hal yang sama berlaku untuk codec bz2 dan lzma, sehingga
+ParallelBlockWriter dapat dipakai oleh setiap codec yang hasil
+kompresi per bloknya aman digabungkan.
+"""
+
+import gzip
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Ukuran blok default setiap member gzip (1 MiB)
+PARALLEL_BLOCK_SIZE = 1024 * 1024
+
+# Pilihan jumlah worker yang ditampilkan pada GUI
+WORKER_CHOICES = ["Auto", "1", "2", "4", "8", "16", "32"]
+
+
+def default_workers():
+    """
+    Mengembalikan jumlah worker default, yaitu jumlah core CPU.
+    """
+    return os.cpu_count() or 1
+
+
+def parse_workers(value):
+    """
+    Mengubah pilihan worker dari GUI menjadi bilangan bulat.
+    Nilai "Auto" atau kosong berarti menggunakan semua core CPU.
+    """
+    if not value or str(value).strip().lower() == "auto":
+        return default_workers()
+
+    workers = int(value)
+    if workers <= 0:
+        raise ValueError("workers must be greater than zero")
+
+    return workers
+
+
+def compress_block(block, compresslevel):
+    """
+    Mengompresi satu blok data menjadi satu member gzip lengkap.
+    """
+    return gzip.compress(block, compresslevel=compresslevel, mtime=0)
+
+
+class ParallelBlockWriter:
+    """
+    Objek file-like (hanya tulis) yang mengompresi data secara paralel.
+
+    Data yang ditulis dikumpulkan hingga mencapai block_size, lalu
+    diserahkan ke thread pool. Jumlah blok yang sedang diproses
+    dibatasi dua kali jumlah worker sehingga memori tetap terbatas
+    dan urutan hasil tetap sama dengan urutan data masukan.
+    """
+
+    def __init__(self, fileobj, compress_func, workers=None, block_size=PARALLEL_BLOCK_SIZE, compresslevel=9):
+        """
+        Parameter:
+        - fileobj       : objek file biner tujuan hasil kompresi
+        - compress_func : fungsi (data, level) -> bytes untuk satu blok
+        - workers       : jumlah thread kompresi (default: jumlah core)
+        - block_size    : ukuran data mentah setiap blok
+        - compresslevel : level kompresi yang diteruskan ke compress_func
+        """
+        if block_size <= 0:
+            raise ValueError("block_size must be greater than zero")
+
+        self.fileobj = fileobj
+        self.compress_func = compress_func
+        self.workers = workers or default_workers()
+        self.block_size = block_size
+        self.compresslevel = compresslevel
+
+        # Statistik jumlah byte masuk (mentah) dan keluar (terkompresi)
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+        self.closed = False
+        self._buffer = bytearray()
+        self._pending = deque()
+        self._max_pending = self.workers * 2
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, data):
+        """
+        Menambahkan data ke buffer dan mengirim setiap blok penuh
+        ke thread pool. Mengembalikan jumlah byte yang diterima.
+
+        Setiap byte disalin tepat satu kali: sisa buffer dilengkapi lalu
+        diserahkan apa adanya, sedangkan blok penuh lainnya disalin
+        langsung dari data tanpa melewati buffer.
+        """
+        if self.closed:
+            raise ValueError("write to closed ParallelBlockWriter")
+
+        view = memoryview(data)
+
+        if self._buffer:
+            head = min(len(view), self.block_size - len(self._buffer))
+            self._buffer += view[:head]
+            view = view[head:]
+            if len(self._buffer) >= self.block_size:
+                self._submit_buffer()
+
+        while len(view) >= self.block_size:
+            self._submit(bytes(view[:self.block_size]))
+            view = view[self.block_size:]
+
+        if len(view):
+            self._buffer += view
+
+        return len(data)
+
+    def write_stable(self, data):
+        """
+        Seperti write, tetapi untuk data yang isinya tidak berubah
+        selama writer masih terbuka (contoh: memoryview dari mmap).
+        Blok penuh diserahkan ke thread pool langsung sebagai potongan
+        data tanpa disalin ke buffer internal.
+        """
+        if self.closed:
+            raise ValueError("write to closed ParallelBlockWriter")
+
+        view = memoryview(data)
+
+        # Melengkapi sisa buffer terlebih dahulu agar urutan data tetap
+        if self._buffer:
+            head = min(len(view), self.block_size - len(self._buffer))
+            self._buffer += view[:head]
+            view = view[head:]
+            if len(self._buffer) >= self.block_size:
+                self._submit_buffer()
+
+        while len(view) >= self.block_size:
+            self._submit(view[:self.block_size])
+            view = view[self.block_size:]
+
+        if len(view):
+            self._buffer += view
+
+        return len(data)
+
+    def tell(self):
+        """
+        Mengembalikan jumlah byte mentah yang sudah ditulis ke writer.
+        """
+        return self.bytes_in + len(self._buffer)
+
+    def set_level(self, compresslevel):
+        """
+        Mengganti level kompresi untuk data yang ditulis berikutnya.
+
+        Sisa buffer ditutup sebagai blok tersendiri dengan level lama
+        sehingga setiap blok hanya berisi data dengan satu level.
+        """
+        if compresslevel == self.compresslevel:
+            return
+
+        if self._buffer:
+            self._submit_buffer()
+
+        self.compresslevel = compresslevel
+
+    def flush(self):
+        """
+        Disediakan agar kompatibel dengan antarmuka file. Blok yang
+        belum penuh tetap ditahan sampai writer ditutup.
+        """
+        self.fileobj.flush()
+
+    def sync(self):
+        """
+        Menutup sisa buffer sebagai blok tersendiri, menunggu semua
+        blok selesai ditulis, lalu mem-flush file tujuan. Setelah sync,
+        file tujuan berakhir tepat di batas member sehingga posisinya
+        aman dicatat sebagai checkpoint.
+        Mengembalikan jumlah byte mentah yang sudah ditulis.
+        """
+        if self._buffer:
+            self._submit_buffer()
+
+        while self._pending:
+            self._write_result(self._pending.popleft().result())
+
+        self.fileobj.flush()
+        return self.bytes_in
+
+    def close(self):
+        """
+        Mengompresi sisa buffer, menunggu semua blok selesai,
+        lalu menuliskan hasilnya ke file tujuan.
+        """
+        if self.closed:
+            return
+
+        try:
+            # Input kosong tetap menghasilkan satu member yang valid
+            if self._buffer or self.bytes_in == 0:
+                self._submit_buffer()
+
+            while self._pending:
+                self._write_result(self._pending.popleft().result())
+
+            self.fileobj.flush()
+        finally:
+            self.closed = True
+            self._executor.shutdown(wait=True)
+
+    def abort(self):
+        """
+        Membatalkan blok yang belum diproses tanpa menulis sisa data.
+        Digunakan ketika terjadi error di tengah proses kompresi.
+        """
+        self.closed = True
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=True)
+
+    def _submit_buffer(self):
+        """
+        Menyerahkan buffer internal ke thread pool sebagai satu blok
+        tanpa disalin ulang, lalu menggantinya dengan buffer baru.
+        """
+        block = self._buffer
+        self._buffer = bytearray()
+        self._submit(block)
+
+    def _submit(self, block):
+        """
+        Mengirim satu blok ke thread pool dan menuliskan hasil blok
+        tertua apabila jumlah blok dalam antrian sudah penuh.
+        """
+        self.bytes_in += len(block)
+        self._pending.append(
+            self._executor.submit(self.compress_func, block, self.compresslevel)
+        )
+
+        while len(self._pending) >= self._max_pending:
+            self._write_result(self._pending.popleft().result())
+
+    def _write_result(self, member):
+        """
+        Menuliskan satu blok hasil kompresi ke file tujuan.
+        """
+        self.fileobj.write(member)
+        self.bytes_out += len(member)
+
+
+class ParallelGzipWriter(ParallelBlockWriter):
+    """
+    ParallelBlockWriter yang menghasilkan gabungan member gzip.
+    """
+
+    def __init__(self, fileobj, workers=None, block_size=PARALLEL_BLOCK_SIZE, compresslevel=9):
+        super().__init__(
+            fileobj,
+            compress_block,
+            workers=workers,
+            block_size=block_size,
+            compresslevel=compresslevel
+        )
@@ -0,0 +1,350 @@
+"""
+Helper ParallelDecompress.
+
+Helper ini menyediakan dekompresi gzip paralel untuk file yang terdiri
+dari banyak member independen, misalnya hasil kompresi paralel, codec
+gzip-seekable, maupun gabungan beberapa file .gz. Batas member dibaca
+dari header seekable gzip jika tersedia, atau ditemukan dengan memindai
+header gzip. Member yang berdekatan digabung menjadi satu segmen,
+setiap segmen didekompresi oleh process pool, lalu hasilnya
+dikembalikan sesuai urutan aslinya.
+
+Pemindaian header hanya menghasilkan kandidat batas member, sehingga
+setiap segmen diverifikasi: member di dalamnya harus berakhir tepat di
+akhir segmen dan lolos pemeriksaan CRC. Jika verifikasi gagal (contoh:
+pola header muncul kebetulan di dalam data terkompresi) atau member
+terlalu besar, sisa file dibaca dengan jalur streaming biasa mulai dari
+batas member terakhir yang sudah pasti. File dengan satu member
+langsung memakai jalur streaming.
+"""
+
+import gzip
+import os
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+
+from Helper.progressReporter import ProgressReader
+from Helper.seekableGzip import is_seekable_gzip, scan_blocks
+
+# Target ukuran data mentah setiap segmen yang dikirim ke worker
+SEGMENT_SIZE = 8 * 1024 * 1024
+
+# Member yang lebih besar dari ini dibaca dengan jalur streaming
+MAX_MEMBER_SIZE = 64 * 1024 * 1024
+
+# Ukuran potongan file yang dibaca saat memindai header member
+SCAN_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Magic header gzip (ID1 ID2 CM) dan ukuran member gzip terkecil
+GZIP_MAGIC = b"\x1f\x8b\x08"
+MIN_MEMBER_SIZE = 18
+
+# Byte akhir potongan yang disertakan pada pemindaian potongan berikutnya
+SCAN_TAIL_SIZE = 16
+
+
+def is_member_header(data, position):
+    """
+    Mengecek apakah data pada position tampak seperti awal member gzip:
+    magic dan metode deflate, bit FLG cadangan kosong, serta nilai XFL
+    dan OS yang valid.
+    """
+    flags, xfl, os_id = data[position + 3], data[position + 8], data[position + 9]
+    return not flags & 0xE0 and xfl in (0, 2, 4) and (os_id <= 13 or os_id == 255)
+
+
+def scan_members(path):
+    """
+    Memindai file gzip dan menghasilkan kandidat member sebagai tuple
+    (offset awal, offset akhir, ukuran mentah). Ukuran mentah diambil
+    dari field ISIZE di trailer member (modulo 2^32).
+    """
+    file_size = os.path.getsize(path)
+    previous = 0
+    tail = b""
+    tail_offset = 0
+
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(SCAN_CHUNK_SIZE)
+            if not chunk:
+                break
+
+            data = tail + chunk
+            position = data.find(GZIP_MAGIC, len(tail) - 9 if tail else 1)
+            while 0 <= position <= len(data) - 10:
+                offset = tail_offset + position
+                if offset - previous >= MIN_MEMBER_SIZE and is_member_header(data, position):
+                    yield previous, offset, struct.unpack("<I", data[position - 4:position])[0]
+                    previous = offset
+
+                position = data.find(GZIP_MAGIC, position + 1)
+
+            # Ekor potongan disimpan agar header di batas potongan tetap
+            # terbaca bersama ISIZE member sebelumnya
+            tail_offset += len(data) - SCAN_TAIL_SIZE
+            tail = data[-SCAN_TAIL_SIZE:]
+
+        f.seek(max(0, file_size - 4))
+        yield previous, file_size, struct.unpack("<I", f.read(4).rjust(4, b"\0"))[0]
+
+
+def indexed_members(path):
+    """
+    Menghasilkan member file seekable gzip dari header bloknya,
+    dengan format yang sama seperti scan_members. Header dibaca
+    langsung dari file sehingga tidak ada sidecar yang ditulis.
+    """
+    for offset, member_size, _, raw_size in scan_blocks(path):
+        yield offset, offset + member_size, raw_size
+
+
+def group_segments(members):
+    """
+    Menggabungkan member berurutan menjadi segmen (offset awal,
+    offset akhir) dengan data mentah sekitar SEGMENT_SIZE. Member yang
+    terlalu besar menghasilkan segmen (offset awal, None) sebagai tanda
+    bahwa sisa file harus dibaca dengan jalur streaming.
+    """
+    start = end = None
+    size = 0
+
+    for member_start, member_end, raw_size in members:
+        if raw_size > MAX_MEMBER_SIZE or member_end - member_start > MAX_MEMBER_SIZE:
+            if start is not None:
+                yield start, end
+            yield member_start, None
+            return
+
+        if start is None:
+            start = member_start
+        end = member_end
+        size += raw_size
+
+        if size >= SEGMENT_SIZE:
+            yield start, end
+            start, size = None, 0
+
+    if start is not None:
+        yield start, end
+
+
+def inflate_segment(path, start, end):
+    """
+    Mendekompresi satu segmen (satu atau lebih member gzip utuh).
+    Dijalankan di proses worker. Mengembalikan data mentah, atau None
+    jika segmen tidak berakhir tepat di batas member, rusak, atau
+    mengembang melebihi batas memori segmen.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    parts = []
+    size = 0
+    limit = SEGMENT_SIZE + MAX_MEMBER_SIZE
+
+    try:
+        while data:
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            part = decompressor.decompress(data, limit - size)
+            if not decompressor.eof:
+                return None
+
+            parts.append(part)
+            size += len(part)
+            data = decompressor.unused_data
+    except zlib.error:
+        return None
+
+    return b"".join(parts)
+
+
+class ParallelGzipReader:
+    """
+    Objek file-like (hanya baca) yang mengembalikan isi file gzip
+    multi-member secara berurutan, sementara segmen berikutnya
+    didekompresi paralel oleh process pool. Jumlah segmen yang sedang
+    diproses dibatasi dua kali jumlah worker sehingga memori tetap
+    terbatas.
+    """
+
+    def __init__(self, path, workers, progress=None):
+        """
+        Parameter:
+        - path     : path file gzip sumber
+        - workers  : jumlah proses dekompresi
+        - progress : ProgressReporter untuk byte terkompresi (opsional)
+        """
+        self.path = path
+        self.workers = workers
+        self.progress = progress
+
+        # Jumlah segmen yang didekompresi paralel
+        self.segments = 0
+
+        self.closed = False
+        self._executor = None
+        self._raw = None
+        self._stream = None
+        self._chunk = b""
+        self._position = 0
+        self._chunks = self._iter_chunks()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        """
+        Membaca paling banyak size byte (seluruh sisa data jika size
+        negatif atau None).
+        """
+        parts = []
+        remaining = -1 if size is None or size < 0 else size
+
+        while remaining:
+            if self._position >= len(self._chunk) and not self._next_chunk():
+                break
+
+            end = len(self._chunk) if remaining < 0 else min(len(self._chunk), self._position + remaining)
+            parts.append(self._chunk[self._position:end])
+            if remaining > 0:
+                remaining -= end - self._position
+            self._position = end
+
+        return b"".join(parts)
+
+    def readinto(self, buffer):
+        """
+        Mengisi buffer dari segmen yang sedang dibaca.
+        Mengembalikan jumlah byte yang diisi (0 di akhir data).
+        """
+        if self._position >= len(self._chunk) and not self._next_chunk():
+            return 0
+
+        size = min(len(buffer), len(self._chunk) - self._position)
+        memoryview(buffer)[:size] = self._chunk[self._position:self._position + size]
+        self._position += size
+        return size
+
+    def close(self):
+        """
+        Menghentikan process pool dan menutup file sumber.
+        """
+        if self.closed:
+            return
+
+        self.closed = True
+        self._chunks.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        if self._stream is not None:
+            self._stream.close()
+        if self._raw is not None:
+            self._raw.close()
+
+    def _next_chunk(self):
+        """
+        Mengambil potongan data berikutnya. Mengembalikan False
+        jika seluruh data sudah dibaca.
+        """
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._chunk, self._position = b"", 0
+            return False
+
+        self._chunk, self._position = memoryview(chunk), 0
+        return True
+
+    def _iter_chunks(self):
+        """
+        Menghasilkan data mentah per segmen sesuai urutan file,
+        lalu beralih ke jalur streaming jika diperlukan.
+        """
+        if self.progress is not None:
+            self.progress.add_total(os.path.getsize(self.path))
+
+        members = indexed_members(self.path) if is_seekable_gzip(self.path) else scan_members(self.path)
+        segments = group_segments(members)
+
+        # File satu member tidak perlu process pool
+        first = next(segments, None)
+        second = next(segments, None)
+        if first is None or second is None or first[1] is None:
+            yield from self._stream_from(0)
+            return
+
+        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        pending = deque()
+        fallback = None
+
+        for start, end in chain((first, second), segments):
+            if end is None:
+                fallback = start
+                break
+
+            pending.append((start, end, self._executor.submit(inflate_segment, self.path, start, end)))
+            if len(pending) < self.workers * 2:
+                continue
+
+            start, data = self._collect(pending)
+            if data is None:
+                fallback = start
+                break
+            yield data
+        else:
+            while pending:
+                start, data = self._collect(pending)
+                if data is None:
+                    fallback = start
+                    break
+                yield data
+
+        if fallback is not None:
+            yield from self._stream_from(fallback)
+
+    def _collect(self, pending):
+        """
+        Menunggu segmen tertua selesai. Mengembalikan tuple
+        (offset awal, data mentah atau None jika verifikasi gagal).
+        Segmen lain dibatalkan apabila verifikasi gagal.
+        """
+        start, end, future = pending.popleft()
+        data = future.result()
+
+        if data is None:
+            for _, _, other in pending:
+                other.cancel()
+            pending.clear()
+            return start, None
+
+        self.segments += 1
+        if self.progress is not None:
+            self.progress.advance(end - start)
+        return start, data
+
+    def _stream_from(self, offset):
+        """
+        Mendekompresi sisa file mulai dari offset (batas member)
+        dengan jalur streaming biasa.
+        """
+        self._raw = open(self.path, "rb")
+        self._raw.seek(offset)
+
+        raw_in = self._raw if self.progress is None else ProgressReader(self._raw, self.progress)
+        self._stream = gzip.GzipFile(fileobj=raw_in, mode="rb")
+
+        while True:
+            chunk = self._stream.read(SEGMENT_SIZE)
+            if not chunk:
+                return
+            yield chunk
@@ -0,0 +1,158 @@
+"""
+Helper ParallelExtract.
+
+Helper ini menyediakan ekstraksi arsip TAR dengan penulis paralel.
+Satu thread membaca stream TAR yang sudah didekompresi secara
+berurutan, sedangkan thread pool membuat file, menulis isinya, lalu
+memulihkan hak akses dan waktu modifikasinya. Untuk arsip berisi
+ratusan ribu file kecil, waktu ekstraksi didominasi syscall metadata
+per file (open, write, close, chmod, utime) yang dapat berjalan
+bersamaan karena syscall tersebut melepaskan GIL.
+
+Isi file yang sedang menunggu ditulis dibatasi MAX_IN_FLIGHT byte.
+File besar ditulis langsung oleh thread pembaca secara streaming, dan
+member selain file dan folder (symlink, hardlink, dan sejenisnya)
+diekstrak oleh tarfile setelah seluruh penulisan tertunda selesai.
+"""
+
+import os
+import tarfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from Helper.indexedArchive import safe_join
+from Helper.streamCompress import copy_stream
+
+# File lebih besar dari ini ditulis langsung oleh thread pembaca
+SMALL_FILE_LIMIT = 1024 * 1024
+
+# Batas total isi file yang ditahan di memori menunggu ditulis
+MAX_IN_FLIGHT = 64 * 1024 * 1024
+
+# Jumlah penulisan tertunda per worker sebelum hasilnya diperiksa
+PENDING_PER_WORKER = 64
+
+
+class ByteBudget:
+    """
+    Pembatas jumlah byte yang sedang ditahan di memori.
+    acquire() menunggu hingga byte yang dilepas cukup.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.used = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, size):
+        with self._condition:
+            # Satu file tetap boleh lewat walaupun melebihi batas
+            while self.used and self.used + size > self.limit:
+                self._condition.wait()
+            self.used += size
+
+    def release(self, size):
+        with self._condition:
+            self.used -= size
+            self._condition.notify_all()
+
+
+def apply_attributes(dest, member):
+    """
+    Memulihkan hak akses dan waktu modifikasi member pada dest.
+    """
+    os.chmod(dest, member.mode)
+    os.utime(dest, (member.mtime, member.mtime))
+
+
+def write_member(dest, data, member):
+    """
+    Menulis isi satu file kecil beserta metadatanya.
+    Dijalankan oleh thread penulis.
+    """
+    with open(dest, "wb") as f:
+        f.write(data)
+
+    apply_attributes(dest, member)
+
+
+def collect_finished(pending, wait=False):
+    """
+    Menghapus penulisan yang sudah selesai dari pending dan melempar
+    ulang error-nya. Jika wait bernilai True, seluruh penulisan
+    ditunggu hingga selesai.
+    """
+    for dest, future in list(pending.items()):
+        if wait or future.done():
+            future.result()
+            del pending[dest]
+
+
+def extract_parallel(tar, output, workers, chunk_size=tarfile.RECORDSIZE, max_in_flight=MAX_IN_FLIGHT):
+    """
+    Mengekstrak seluruh member dari tar (dibuka dengan mode "r|")
+    ke folder output menggunakan workers thread penulis.
+    Mengembalikan jumlah member yang diekstrak.
+    """
+    budget = ByteBudget(max_in_flight)
+    pending = {}
+    created = set()
+    directories = []
+    count = 0
+
+    os.makedirs(output, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            for member in tar:
+                dest = safe_join(output, member.name)
+                count += 1
+
+                if member.isdir():
+                    os.makedirs(dest, exist_ok=True)
+                    created.add(dest)
+                    directories.append((dest, member))
+                    continue
+
+                if not member.isfile():
+                    # Target hardlink dapat berupa file yang belum ditulis
+                    collect_finished(pending, wait=True)
+                    tar.extract(member, path=output)
+                    continue
+
+                parent = os.path.dirname(dest)
+                if parent not in created:
+                    os.makedirs(parent, exist_ok=True)
+                    created.add(parent)
+
+                # Nama yang muncul dua kali ditulis sesuai urutan arsip
+                if dest in pending:
+                    pending.pop(dest).result()
+
+                if member.size > SMALL_FILE_LIMIT:
+                    with tar.extractfile(member) as src, open(dest, "wb") as dst:
+                        copy_stream(src, dst, chunk_size)
+                    apply_attributes(dest, member)
+                    continue
+
+                data = tar.extractfile(member).read()
+                budget.acquire(len(data))
+                future = executor.submit(write_member, dest, data, member)
+                future.add_done_callback(lambda _, size=len(data): budget.release(size))
+                pending[dest] = future
+
+                if len(pending) >= workers * PENDING_PER_WORKER:
+                    collect_finished(pending)
+
+            collect_finished(pending, wait=True)
+
+        except BaseException:
+            for future in pending.values():
+                future.cancel()
+            raise
+
+    # Atribut folder dipulihkan terakhir karena penulisan file mengubahnya
+    for dest, member in sorted(directories, key=lambda item: item[1].name, reverse=True):
+        apply_attributes(dest, member)
+
+    return count
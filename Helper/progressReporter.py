@@ -0,0 +1,211 @@
+"""
+Helper ProgressReporter.
+
+Helper ini menyediakan pelaporan progres bersama untuk proses
+kompresi, dekompresi, dan transfer: jumlah byte selesai, total byte,
+kecepatan saat ini (MB/s), dan perkiraan sisa waktu (ETA).
+
+Thread pekerja hanya mengirim pesan kecil ke antrian thread-safe
+(tanpa lock maupun perhitungan apa pun), sedangkan GUI membaca dan
+menggabungkan pesan tersebut secara berkala melalui poll() sehingga
+loop utama pemrosesan data tidak diperlambat.
+
+ProgressReporter juga menjadi titik pembatalan kooperatif: setelah
+cancel() dipanggil (misalnya dari tombol Cancel pada GUI), pemanggilan
+advance() berikutnya oleh mesin kompresi/dekompresi melempar
+JobCancelled sehingga proses berhenti di titik laporan terdekat.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+
+# Interval polling progres oleh GUI (milidetik)
+POLL_INTERVAL_MS = 250
+
+# Rentang waktu (detik) untuk menghitung kecepatan saat ini
+RATE_WINDOW = 3.0
+
+# Jenis pesan di dalam antrian progres
+_ADVANCE = 0
+_TOTAL = 1
+_RESET = 2
+
+
+class JobCancelled(Exception):
+    """
+    Dilempar oleh ProgressReporter.advance() setelah proses dibatalkan.
+    """
+
+
+class ProgressReporter:
+    """
+    Titik pelaporan progres yang aman dipakai dari banyak thread.
+    """
+
+    def __init__(self, total=0, label=""):
+        """
+        Parameter:
+        - total : total byte yang akan diproses (0 jika belum diketahui)
+        - label : nama tahap yang sedang berjalan (contoh: "Sending")
+        """
+        self.queue = queue.SimpleQueue()
+        self.total = total
+        self.done = 0
+        self.label = label
+        self.started = time.perf_counter()
+        self.samples = deque([(self.started, 0)])
+        self.cancel_event = threading.Event()
+
+    # Dipanggil dari thread pekerja
+
+    def advance(self, size):
+        """
+        Melaporkan bahwa size byte telah selesai diproses.
+        Melempar JobCancelled jika proses sudah dibatalkan.
+        """
+        if self.cancel_event.is_set():
+            raise JobCancelled("Job cancelled")
+
+        self.queue.put((_ADVANCE, size))
+
+    def add_total(self, size):
+        """
+        Menambah total byte yang akan diproses.
+        """
+        self.queue.put((_TOTAL, size))
+
+    def reset(self, total=0, label=""):
+        """
+        Memulai tahap baru (contoh: dari kompresi ke pengiriman)
+        dengan total dan label baru.
+        """
+        self.queue.put((_RESET, (total, label)))
+
+    # Dipanggil dari thread GUI
+
+    def cancel(self):
+        """
+        Meminta proses berhenti pada laporan progres berikutnya.
+        """
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        """
+        True jika cancel() sudah dipanggil.
+        """
+        return self.cancel_event.is_set()
+
+    def poll(self):
+        """
+        Menggabungkan seluruh pesan yang tertunda lalu mengembalikan
+        kondisi progres terbaru dalam bentuk dict: label, done, total,
+        fraction, mb_per_s, eta (detik atau None), dan elapsed.
+        """
+        while True:
+            try:
+                kind, value = self.queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == _ADVANCE:
+                self.done += value
+            elif kind == _TOTAL:
+                self.total += value
+            else:
+                self.total, self.label = value
+                self.done = 0
+                self.started = time.perf_counter()
+                self.samples = deque([(self.started, 0)])
+
+        now = time.perf_counter()
+        self.samples.append((now, self.done))
+        while len(self.samples) > 2 and now - self.samples[0][0] > RATE_WINDOW:
+            self.samples.popleft()
+
+        first_time, first_done = self.samples[0]
+        rate = (self.done - first_done) / (now - first_time) if now > first_time else 0.0
+
+        fraction = min(1.0, self.done / self.total) if self.total else 0.0
+        eta = None
+        if self.total and rate > 0:
+            eta = max(0.0, (self.total - self.done) / rate)
+
+        return {
+            "label": self.label,
+            "done": self.done,
+            "total": self.total,
+            "fraction": fraction,
+            "mb_per_s": rate / 1048576,
+            "eta": eta,
+            "elapsed": now - self.started,
+        }
+
+
+class ProgressReader:
+    """
+    Objek file-like (hanya baca) yang melaporkan jumlah byte yang
+    dibaca dari fileobj ke ProgressReporter.
+    """
+
+    def __init__(self, fileobj, progress):
+        self.fileobj = fileobj
+        self.progress = progress
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        data = self.fileobj.read(size)
+        self.progress.advance(len(data))
+        return data
+
+    def readinto(self, buffer):
+        size = self.fileobj.readinto(buffer)
+        if size:
+            self.progress.advance(size)
+        return size
+
+
+class ProgressWriter:
+    """
+    Objek file-like (hanya tulis) yang melaporkan jumlah byte yang
+    ditulis ke fileobj ke ProgressReporter.
+    """
+
+    def __init__(self, fileobj, progress):
+        self.fileobj = fileobj
+        self.progress = progress
+
+    def write(self, data):
+        self.progress.advance(len(data))
+        return self.fileobj.write(data)
+
+    def tell(self):
+        return self.fileobj.tell()
+
+
+def format_duration(seconds):
+    """
+    Mengubah jumlah detik menjadi teks H:MM:SS.
+    """
+    seconds = int(seconds)
+    return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def format_progress(snapshot):
+    """
+    Mengubah hasil poll() menjadi teks progres dua baris.
+    """
+    done = snapshot["done"] / 1048576
+    line = f"{snapshot['label']}: {done:.1f}" if snapshot["label"] else f"{done:.1f}"
+
+    if snapshot["total"]:
+        line += f" / {snapshot['total'] / 1048576:.1f} MB ({snapshot['fraction'] * 100:.0f}%)"
+    else:
+        line += " MB"
+
+    eta = "--:--" if snapshot["eta"] is None else format_duration(snapshot["eta"])
+    return f"{line}\n{snapshot['mb_per_s']:.1f} MB/s, ETA {eta}"
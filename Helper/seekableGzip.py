@@ -0,0 +1,299 @@
+"""
+Helper SeekableGzip.
+
+Helper ini menyediakan format gzip yang dapat diakses acak (mirip
+BGZF): data dipotong menjadi blok berukuran tetap dan setiap blok
+dikompresi sebagai member gzip independen. Header setiap member memuat
+subfield FEXTRA "SG" berisi ukuran member terkompresi dan ukuran data
+mentahnya, sehingga batas blok dapat ditemukan hanya dengan membaca
+header. Gabungan member tetap merupakan stream gzip standar yang dapat
+dibaca gzip, zcat, maupun modul gzip Python.
+
+Indeks offset blok disimpan di file sidecar <file>.gzi (JSON) beserta
+ukuran dan mtime file terkompresi. Jika sidecar hilang atau salah
+satunya sudah tidak sesuai, indeks dibangun ulang dengan memindai
+header member. read_range() mengembalikan rentang byte mana
+pun dengan hanya mendekompresi blok yang dicakup rentang tersebut,
+sedangkan SeekableGzipReader menyediakan objek file dengan seek() di
+atas format yang sama (contoh: untuk membaca member arsip TAR secara
+acak).
+"""
+
+import json
+import os
+import struct
+import zlib
+from bisect import bisect_right
+
+# Versi format file indeks (versi 2 menambahkan mtime_ns)
+INDEX_VERSION = 2
+
+# Akhiran file indeks sidecar
+INDEX_SUFFIX = ".gzi"
+
+# Header gzip dengan FEXTRA: ID1 ID2 CM FLG MTIME XFL OS XLEN,
+# lalu subfield SI1 SI2 SLEN, ukuran member, dan ukuran data mentah
+HEADER_FORMAT = "<BBBBIBBH2sHII"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+SUBFIELD_ID = b"SG"
+FEXTRA = 4
+
+# Ukuran trailer gzip (CRC32 dan ISIZE)
+TRAILER_SIZE = 8
+
+
+def compress_seekable_block(data, compresslevel):
+    """
+    Mengompresi satu blok menjadi member gzip lengkap yang headernya
+    memuat ukuran member dan ukuran data mentah blok tersebut.
+    """
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+    body = compressor.compress(data) + compressor.flush()
+    member_size = HEADER_SIZE + len(body) + TRAILER_SIZE
+
+    header = struct.pack(
+        HEADER_FORMAT,
+        0x1F, 0x8B, 8, FEXTRA, 0, 0, 255,
+        HEADER_SIZE - 12,
+        SUBFIELD_ID, 8, member_size, len(data)
+    )
+    trailer = struct.pack("<II", zlib.crc32(data), len(data) & 0xFFFFFFFF)
+    return header + body + trailer
+
+
+def index_path(path):
+    """
+    Mengembalikan path file indeks sidecar untuk file path.
+    """
+    return path + INDEX_SUFFIX
+
+
+def parse_header(header):
+    """
+    Membaca header member. Mengembalikan tuple
+    (ukuran member, ukuran data mentah), atau None jika header bukan
+    header member seekable gzip.
+    """
+    if len(header) < HEADER_SIZE:
+        return None
+
+    id1, id2, method, flags, _, _, _, xlen, subfield, slen, member_size, raw_size = struct.unpack(
+        HEADER_FORMAT, header[:HEADER_SIZE]
+    )
+    if (id1, id2, method) != (0x1F, 0x8B, 8) or not flags & FEXTRA:
+        return None
+    if xlen != HEADER_SIZE - 12 or subfield != SUBFIELD_ID or slen != 8:
+        return None
+
+    return member_size, raw_size
+
+
+def is_seekable_gzip(path):
+    """
+    Mengecek apakah member pertama file path memiliki header seekable gzip.
+    """
+    try:
+        with open(path, "rb") as f:
+            return parse_header(f.read(HEADER_SIZE)) is not None
+    except OSError:
+        return False
+
+
+def scan_blocks(path):
+    """
+    Memindai header seluruh member tanpa mendekompresi data.
+    Mengembalikan daftar blok [offset, ukuran member, offset mentah,
+    ukuran mentah].
+    """
+    blocks = []
+    offset = 0
+    raw_offset = 0
+    file_size = os.path.getsize(path)
+
+    with open(path, "rb") as f:
+        while offset < file_size:
+            f.seek(offset)
+            parsed = parse_header(f.read(HEADER_SIZE))
+            if parsed is None:
+                raise ValueError(f"Not a seekable gzip file (bad member at offset {offset}): {path}")
+
+            member_size, raw_size = parsed
+            blocks.append([offset, member_size, raw_offset, raw_size])
+            offset += member_size
+            raw_offset += raw_size
+
+    if offset != file_size:
+        raise ValueError(f"Truncated seekable gzip file: {path}")
+
+    return blocks
+
+
+def build_index(path):
+    """
+    Membangun indeks blok dari header member.
+    Ukuran dan mtime diambil sebelum pemindaian sehingga perubahan
+    file selama pemindaian membuat indeks dianggap usang.
+    Mengembalikan indeks dalam bentuk dict.
+    """
+    info = os.stat(path)
+    blocks = scan_blocks(path)
+    return {
+        "version": INDEX_VERSION,
+        "compressed_size": info.st_size,
+        "mtime_ns": info.st_mtime_ns,
+        "size": blocks[-1][2] + blocks[-1][3] if blocks else 0,
+        "blocks": blocks,
+    }
+
+
+def write_index(path):
+    """
+    Membangun indeks blok lalu menyimpannya ke file sidecar.
+    Ditulis ke file sementara lalu dipindahkan secara atomik
+    (os.replace) sehingga sidecar tidak pernah setengah jadi.
+    Mengembalikan indeks dalam bentuk dict.
+    """
+    index = build_index(path)
+    sidecar = index_path(path)
+    temp_path = sidecar + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+
+    os.replace(temp_path, sidecar)
+    return index
+
+
+def load_index(path):
+    """
+    Membaca indeks dari file sidecar. Indeks dibangun ulang (dan
+    disimpan jika memungkinkan) bila sidecar tidak ada atau ukuran
+    maupun mtime file sudah berubah.
+    """
+    sidecar = index_path(path)
+    if os.path.exists(sidecar):
+        try:
+            with open(sidecar, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            info = os.stat(path)
+            if (index.get("version") == INDEX_VERSION
+                    and index.get("compressed_size") == info.st_size
+                    and index.get("mtime_ns") == info.st_mtime_ns):
+                return index
+        except (OSError, ValueError):
+            pass
+
+    try:
+        return write_index(path)
+    except OSError:
+        # Folder hanya-baca: indeks tetap dipakai tanpa disimpan
+        return build_index(path)
+
+
+def read_block(f, block):
+    """
+    Membaca dan mendekompresi satu blok dari file f yang sudah terbuka.
+    """
+    offset, member_size, _, raw_size = block
+    f.seek(offset)
+    member = f.read(member_size)
+
+    data = zlib.decompress(member[HEADER_SIZE:-TRAILER_SIZE], -zlib.MAX_WBITS)
+    crc, _ = struct.unpack("<II", member[-TRAILER_SIZE:])
+    if len(data) != raw_size or zlib.crc32(data) != crc:
+        raise ValueError(f"Corrupted block at offset {offset}")
+
+    return data
+
+
+def read_range(path, start, length, index=None):
+    """
+    Mengembalikan length byte data asli mulai dari offset start.
+    Hanya blok yang dicakup rentang tersebut yang dibaca dan
+    didekompresi. Rentang yang melewati akhir data dipotong.
+    """
+    if start < 0 or length < 0:
+        raise ValueError("start and length must not be negative")
+
+    if index is None:
+        index = load_index(path)
+
+    blocks = index["blocks"]
+    end = min(start + length, index["size"])
+    if start >= end:
+        return b""
+
+    position = bisect_right([block[2] for block in blocks], start) - 1
+    parts = []
+
+    with open(path, "rb") as f:
+        while position < len(blocks) and blocks[position][2] < end:
+            block = blocks[position]
+            data = read_block(f, block)
+            parts.append(data[max(0, start - block[2]):end - block[2]])
+            position += 1
+
+    return b"".join(parts)
+
+
+class SeekableGzipReader:
+    """
+    Objek file-like (hanya baca) dengan seek() di atas file seekable
+    gzip. Hanya blok yang dicakup posisi baca yang didekompresi, dan
+    blok terakhir disimpan agar pembacaan berurutan tidak mengulang
+    dekompresi blok yang sama.
+    """
+
+    def __init__(self, path, index=None):
+        self.index = index if index is not None else load_index(path)
+        self.fileobj = open(path, "rb")
+        self.position = 0
+        self._starts = [block[2] for block in self.index["blocks"]]
+        self._block = None
+        self._data = b""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self.position
+        elif whence == os.SEEK_END:
+            offset += self.index["size"]
+
+        if offset < 0:
+            raise ValueError("negative seek position")
+
+        self.position = offset
+        return self.position
+
+    def read(self, size=-1):
+        end = self.index["size"] if size is None or size < 0 else min(self.position + size, self.index["size"])
+        parts = []
+
+        while self.position < end:
+            number = bisect_right(self._starts, self.position) - 1
+            if number != self._block:
+                self._data = read_block(self.fileobj, self.index["blocks"][number])
+                self._block = number
+
+            skip = self.position - self._starts[number]
+            part = self._data[skip:skip + end - self.position]
+            parts.append(part)
+            self.position += len(part)
+
+        return b"".join(parts)
+
+    def close(self):
+        self.fileobj.close()
@@ -0,0 +1,291 @@
+"""
+Helper StreamCompress.
+
+Helper ini menyediakan mesin kompresi berbasis stream yang membaca
+data sumber per blok dengan ukuran tetap menggunakan satu buffer
+yang dipakai ulang. Dengan cara ini penggunaan memori tetap konstan
+berapa pun ukuran file atau folder yang dikompresi.
+
+Codec kompresi diambil dari CodecRegistry. Jika jumlah worker lebih
+dari satu dan codec mendukung kompresi per blok, kompresi dijalankan
+oleh ParallelBlockWriter sehingga beberapa core CPU dapat digunakan.
+
+Kompresi file besar dengan codec per blok mencatat checkpoint secara
+berkala (lihat Helper.checkpoint), sehingga proses yang terhenti dapat
+dilanjutkan dari batas member terakhir yang sudah tersimpan.
+
+File sumber di disk lokal dibaca melalui mmap (lihat Helper.mappedInput)
+dan diteruskan ke kompresor sebagai memoryview tanpa salinan; pipe dan
+network mount tetap dibaca dengan buffer biasa.
+"""
+
+import os
+from Helper.adaptiveCompress import AdaptivePolicy
+from Helper.checkpoint import (
+    CHECKPOINT_INTERVAL,
+    RESUME_MIN_SIZE,
+    checkpoint_state,
+    clear_checkpoint,
+    load_checkpoint,
+    save_checkpoint,
+)
+from Helper.codecRegistry import DEFAULT_CODEC, get_codec
+from Helper.jobQueue import source_size
+from Helper.mappedInput import MappedTarFile, is_local_path, mapped_file, read_blocks
+from Helper.parallelCompress import ParallelBlockWriter
+from Helper.progressReporter import ProgressWriter
+
+# Ukuran blok default untuk membaca data sumber (1 MiB)
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+
+# Pilihan ukuran blok yang ditampilkan pada GUI (label -> byte)
+BLOCK_SIZE_CHOICES = {
+    "256 KB": 256 * 1024,
+    "1 MB": 1024 * 1024,
+    "4 MB": 4 * 1024 * 1024,
+    "16 MB": 16 * 1024 * 1024,
+}
+
+
+def copy_stream(src, dst, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Menyalin isi stream sumber ke stream tujuan per blok.
+
+    Buffer berukuran block_size dialokasikan sekali saja lalu diisi
+    ulang dengan readinto, sehingga tidak ada objek bytes baru yang
+    dibuat pada setiap iterasi. Mengembalikan jumlah byte yang disalin.
+    """
+    if block_size <= 0:
+        raise ValueError("block_size must be greater than zero")
+
+    buffer = bytearray(block_size)
+    view = memoryview(buffer)
+    total = 0
+
+    while True:
+        size = src.readinto(buffer)
+        if not size:
+            break
+
+        dst.write(view[:size])
+        total += size
+
+    return total
+
+
+def copy_blocks(blocks, dst, stable=False, progress=None):
+    """
+    Menulis setiap blok dari read_blocks ke stream tujuan dan
+    melaporkannya ke progress jika diisi.
+
+    Jika stable bernilai True (blok berasal dari mmap) dan tujuan
+    adalah ParallelBlockWriter, blok penuh diserahkan ke worker tanpa
+    disalin. Mengembalikan jumlah byte yang disalin.
+    """
+    write = getattr(dst, "write_stable", dst.write) if stable else dst.write
+    total = 0
+
+    for block in blocks:
+        write(block)
+        total += len(block)
+        if progress is not None:
+            progress.advance(len(block))
+
+    return total
+
+
+def open_writer(raw_out, codec=DEFAULT_CODEC, compresslevel=9, workers=1,
+                block_size=DEFAULT_BLOCK_SIZE, blocks=False):
+    """
+    Membuka writer kompresi di atas objek file biner raw_out.
+
+    Dengan satu worker (atau codec yang tidak mendukung kompresi per
+    blok) digunakan stream kompresi biasa dari codec, sedangkan lebih
+    dari satu worker menggunakan ParallelBlockWriter yang menghasilkan
+    gabungan stream berukuran block_size. Parameter blocks memaksa
+    penggunaan ParallelBlockWriter meskipun hanya ada satu worker,
+    misalnya agar level kompresi dapat diganti per entri. Codec
+    seekable selalu ditulis per blok agar dapat dibaca acak.
+    """
+    codec = get_codec(codec)
+
+    if codec.supports_blocks and (blocks or codec.seekable or (workers and workers > 1)):
+        return ParallelBlockWriter(
+            raw_out,
+            codec.block_compressor,
+            workers=workers or 1,
+            block_size=block_size,
+            compresslevel=compresslevel
+        )
+
+    return codec.open_writer(raw_out, compresslevel)
+
+
+def compress_stream_file(source, dest, block_size=DEFAULT_BLOCK_SIZE, compresslevel=9, workers=1,
+                         codec=DEFAULT_CODEC, adaptive=False, on_decision=None, progress=None,
+                         resumable=True, on_resume=None, use_mmap=True):
+    """
+    Mengompresi satu file menggunakan codec tertentu secara streaming.
+
+    Data dibaca dan dikompresi blok demi blok sehingga puncak
+    penggunaan memori hanya sebesar satu blok (atau beberapa blok
+    per worker pada mode paralel), bukan sebesar file.
+
+    Jika adaptive bernilai True, level kompresi dipilih berdasarkan
+    sampel isi file dan keputusan dilaporkan melalui callback
+    on_decision(path, keputusan, level, rasio).
+    Jika progress (ProgressReporter) diisi, byte sumber yang dibaca
+    dilaporkan ke progress.
+    Jika resumable bernilai True, file minimal RESUME_MIN_SIZE byte
+    dengan codec per blok dikompresi dengan checkpoint (lihat
+    compress_resumable_file); offset lanjutan dilaporkan melalui
+    callback on_resume(offset).
+    Jika use_mmap bernilai True, file di disk lokal dibaca melalui
+    mmap tanpa salinan; jika False selalu dibaca dengan buffer biasa.
+    Mengembalikan jumlah byte sumber yang diproses.
+    """
+    codec = get_codec(codec)
+
+    if adaptive:
+        policy = AdaptivePolicy(codec, compresslevel)
+        compresslevel, decision, ratio = policy.choose_for_file(source)
+        if on_decision is not None:
+            on_decision(source, decision, compresslevel, ratio)
+
+    if resumable and codec.supports_blocks and os.path.getsize(source) >= RESUME_MIN_SIZE:
+        return compress_resumable_file(
+            source, dest, block_size, compresslevel, workers, codec, progress, on_resume, use_mmap
+        )
+
+    with open(source, "rb") as src, open(dest, "wb") as raw_out, mapped_file(src, use_mmap) as mapping:
+        if progress is not None:
+            progress.add_total(os.fstat(src.fileno()).st_size)
+
+        with open_writer(raw_out, codec, compresslevel, workers, block_size) as writer:
+            blocks = read_blocks(src, block_size, mapping)
+            return copy_blocks(blocks, writer, mapping is not None, progress)
+
+
+def compress_resumable_file(source, dest, block_size=DEFAULT_BLOCK_SIZE, compresslevel=9, workers=1,
+                            codec=DEFAULT_CODEC, progress=None, on_resume=None, use_mmap=True):
+    """
+    Mengompresi satu file sebagai gabungan stream codec per segmen
+    CHECKPOINT_INTERVAL byte masukan sambil mencatat checkpoint di
+    setiap akhir segmen.
+
+    Setiap segmen ditulis dengan writer yang sama seperti kompresi
+    biasa (open_writer), sehingga dengan satu worker codec tetap
+    memakai jendela/kamus penuhnya dan hanya dipotong di batas
+    checkpoint, bukan per blok. Di akhir segmen writer ditutup dan
+    file di-fsync, sehingga offset keluaran yang dicatat selalu berada
+    di batas member. Jika checkpoint yang cocok sudah ada, file hasil
+    dipotong ke offset keluaran tersebut dan kompresi dilanjutkan dari
+    offset masukan yang tercatat. Checkpoint dihapus setelah kompresi
+    selesai.
+    Mengembalikan jumlah byte sumber yang diproses pada pemanggilan ini.
+    """
+    codec = get_codec(codec)
+
+    with open(source, "rb") as src:
+        size = os.fstat(src.fileno()).st_size
+        state = checkpoint_state(source, size, codec, compresslevel, block_size)
+        resume = load_checkpoint(dest, state)
+        input_offset, output_offset = resume or (0, 0)
+
+        with open(dest, "r+b" if resume else "wb") as raw_out, mapped_file(src, use_mmap) as mapping:
+            raw_out.truncate(output_offset)
+            raw_out.seek(output_offset)
+
+            if resume is not None and on_resume is not None:
+                on_resume(input_offset)
+
+            if progress is not None:
+                progress.add_total(size)
+                progress.advance(input_offset)
+
+            position = input_offset
+            blocks = read_blocks(src, block_size, mapping, input_offset)
+            block = next(blocks, None)
+
+            # Loop berhenti saat block bernilai None, sehingga tidak ada
+            # memoryview mmap yang tersisa ketika mapping ditutup
+            while block is not None:
+                segment_end = position + CHECKPOINT_INTERVAL
+
+                with open_writer(raw_out, codec, compresslevel, workers, block_size) as writer:
+                    write = getattr(writer, "write_stable", writer.write) if mapping is not None else writer.write
+
+                    while block is not None and position < segment_end:
+                        write(block)
+                        position += len(block)
+                        if progress is not None:
+                            progress.advance(len(block))
+                        block = next(blocks, None)
+
+                raw_out.flush()
+                os.fsync(raw_out.fileno())
+                if block is not None:
+                    save_checkpoint(dest, state, position, raw_out.tell())
+
+    clear_checkpoint(dest)
+    return position - input_offset
+
+
+def compress_stream_folder(source, dest, arcname=None, block_size=DEFAULT_BLOCK_SIZE, compresslevel=9,
+                           workers=1, codec=DEFAULT_CODEC, adaptive=False, on_decision=None,
+                           progress=None, use_mmap=True):
+    """
+    Mengarsipkan dan mengompresi folder ke arsip TAR terkompresi
+    (contoh: .tar.gz) dalam satu kali jalan.
+
+    Header dan isi setiap file TAR langsung dialirkan ke kompresor
+    selama penelusuran folder, sehingga tidak ada file .tar sementara
+    yang ditulis ke disk dan memori tetap terbatas pada ukuran blok.
+
+    Jika adaptive bernilai True dan codec mendukung kompresi per blok,
+    level kompresi dipilih ulang untuk setiap file di dalam folder.
+    Setiap keputusan dilaporkan melalui callback
+    on_decision(path, keputusan, level, rasio).
+    Jika progress diisi, byte stream TAR yang ditulis ke kompresor
+    dilaporkan ke progress (total diperkirakan dari ukuran folder).
+    Jika use_mmap bernilai True dan folder berada di disk lokal, isi
+    file besar dibaca melalui mmap tanpa salinan (MappedTarFile).
+    """
+    if block_size <= 0:
+        raise ValueError("block_size must be greater than zero")
+
+    codec = get_codec(codec)
+    adaptive = adaptive and codec.supports_blocks
+    policy = AdaptivePolicy(codec, compresslevel) if adaptive else None
+
+    root_name = os.path.normpath(source if arcname is None else arcname)
+    root_name = root_name.replace(os.sep, "/").lstrip("/")
+
+    if progress is not None:
+        progress.add_total(source_size(source))
+
+    with open(dest, "wb") as raw_out:
+        with open_writer(raw_out, codec, compresslevel, workers, block_size, blocks=adaptive) as writer:
+
+            def choose_level(tarinfo):
+                """
+                Filter tarfile yang mengganti level kompresi writer
+                tepat sebelum header dan isi file ditulis.
+                """
+                if tarinfo.isreg():
+                    relative = os.path.relpath(tarinfo.name, root_name)
+                    path = os.path.normpath(os.path.join(source, relative))
+                    level, decision, ratio = policy.choose_for_file(path)
+                    writer.set_level(level)
+
+                    if on_decision is not None:
+                        on_decision(tarinfo.name, decision, level, ratio)
+
+                return tarinfo
+
+            # Mode "w" dengan fileobj eksternal tidak pernah melakukan seek,
+            # sehingga header dan isi file langsung ditulis ke writer
+            target = writer if progress is None else ProgressWriter(writer, progress)
+            with MappedTarFile.open(fileobj=target, mode="w", copybufsize=block_size) as tar:
+                tar.use_mmap = use_mmap and is_local_path(source)
+                tar.add(source, arcname=arcname, filter=choose_level if adaptive else None)
@@ -0,0 +1,235 @@
+"""
+Helper TarIndex.
+
+Helper ini menyediakan indeks member untuk arsip TAR terkompresi
+(contoh: .tar.gz). Indeks berisi nama, jenis, ukuran, dan offset setiap
+member di dalam stream TAR yang sudah didekompresi. Indeks dibangun
+sekali dengan membaca arsip secara streaming, lalu disimpan di file
+sidecar <arsip>.tidx (JSON) sehingga daftar isi berikutnya tampil
+seketika.
+
+Ekstraksi member terpilih memanfaatkan indeks tersebut: arsip
+gzip-seekable dibaca secara acak sehingga hanya blok yang memuat member
+terpilih yang didekompresi, sedangkan codec lain dibaca berurutan dan
+berhenti tepat setelah member terpilih terakhir.
+"""
+
+import json
+import os
+import tarfile
+from fnmatch import fnmatchcase
+
+from Helper.codecRegistry import codec_for_path
+from Helper.progressReporter import ProgressReader
+from Helper.seekableGzip import SeekableGzipReader, is_seekable_gzip
+
+# Versi format file indeks (versi 2 membedakan jenis hardlink)
+TAR_INDEX_VERSION = 2
+
+# Akhiran file indeks sidecar
+TAR_INDEX_SUFFIX = ".tidx"
+
+
+def tar_index_path(path):
+    """
+    Mengembalikan path file indeks sidecar untuk arsip path.
+    """
+    return path + TAR_INDEX_SUFFIX
+
+
+def member_type(member):
+    """
+    Mengubah jenis TarInfo menjadi nama jenis entri yang sama dengan
+    Indexed Archive (file, dir, symlink), "hardlink", atau "other".
+    """
+    if member.isfile():
+        return "file"
+    if member.isdir():
+        return "dir"
+    if member.issym():
+        return "symlink"
+    if member.islnk():
+        return "hardlink"
+    return "other"
+
+
+def archive_state(path):
+    """
+    Membuat identitas arsip (ukuran dan waktu modifikasi). Indeks
+    hanya dipakai ulang jika arsip tidak berubah sejak indeks dibuat.
+    """
+    info = os.stat(path)
+    return {"size": info.st_size, "mtime_ns": info.st_mtime_ns}
+
+
+def build_tar_index(path, progress=None):
+    """
+    Membaca seluruh arsip secara streaming dan mencatat setiap member.
+    Mengembalikan indeks dalam bentuk dict.
+    """
+    codec = codec_for_path(path)
+    if codec is None:
+        raise ValueError(f"Unsupported compressed archive: {path}")
+
+    members = []
+    with open(path, "rb") as raw_in:
+        if progress is not None:
+            progress.add_total(os.fstat(raw_in.fileno()).st_size)
+            raw_in = ProgressReader(raw_in, progress)
+
+        with codec.open_reader(raw_in) as reader, tarfile.open(fileobj=reader, mode="r|") as tar:
+            for member in tar:
+                members.append({
+                    "name": member.name,
+                    "type": member_type(member),
+                    "size": member.size,
+                    "mode": member.mode,
+                    "mtime": member.mtime,
+                    "linkname": member.linkname,
+                    "offset": member.offset,
+                    "offset_data": member.offset_data,
+                })
+
+    return {
+        "version": TAR_INDEX_VERSION,
+        "archive": archive_state(path),
+        "members": members,
+    }
+
+
+def write_tar_index(path, index):
+    """
+    Menyimpan indeks secara atomik (tulis ke file sementara lalu
+    os.replace) sehingga file indeks tidak pernah setengah jadi.
+    """
+    sidecar = tar_index_path(path)
+    temp_path = sidecar + ".tmp"
+
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+
+    os.replace(temp_path, sidecar)
+
+
+def load_tar_index(path, progress=None):
+    """
+    Membaca indeks dari file sidecar. Indeks dibangun ulang (dan
+    disimpan jika memungkinkan) bila sidecar tidak ada atau arsip
+    sudah berubah. Mengembalikan daftar member (dict).
+    """
+    sidecar = tar_index_path(path)
+    if os.path.exists(sidecar):
+        try:
+            with open(sidecar, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") == TAR_INDEX_VERSION and index.get("archive") == archive_state(path):
+                return index["members"]
+        except (OSError, ValueError):
+            pass
+
+    index = build_tar_index(path, progress=progress)
+    try:
+        write_tar_index(path, index)
+    except OSError:
+        # Folder hanya-baca: indeks tetap dipakai tanpa disimpan
+        pass
+
+    return index["members"]
+
+
+def select_members(entries, patterns):
+    """
+    Memilih entri yang cocok dengan salah satu pola (nama persis atau
+    pola glob seperti *.txt). Memilih folder berarti memilih seluruh
+    isinya. Target setiap hardlink terpilih ikut dipilih karena
+    tarfile membuat hardlink dari file target yang sudah diekstrak.
+    Mengembalikan daftar entri sesuai urutan aslinya.
+    """
+    patterns = [pattern.strip().rstrip("/") for pattern in patterns if pattern.strip()]
+    wanted = set()
+
+    for entry in entries:
+        name = entry["name"]
+        for pattern in patterns:
+            if fnmatchcase(name, pattern) or name.startswith(pattern + "/"):
+                wanted.add(name)
+                break
+
+    by_name = {entry["name"]: entry for entry in entries}
+    pending = [by_name[name] for name in wanted if by_name[name].get("type") == "hardlink"]
+    while pending:
+        target = by_name.get(pending.pop()["linkname"])
+        if target is not None and target["name"] not in wanted:
+            wanted.add(target["name"])
+            if target.get("type") == "hardlink":
+                pending.append(target)
+
+    return [entry for entry in entries if entry["name"] in wanted]
+
+
+def extract_tar_members(path, output, names, progress=None, chunk_size=tarfile.RECORDSIZE):
+    """
+    Mengekstrak member dengan nama pada names dari arsip TAR
+    terkompresi ke folder output. Mengembalikan jumlah member yang
+    diekstrak.
+    """
+    wanted = set(names)
+    if not wanted:
+        return 0
+
+    if is_seekable_gzip(path):
+        return extract_random_access(path, output, wanted, progress, chunk_size)
+
+    return extract_streaming(path, output, wanted, progress, chunk_size)
+
+
+def extract_random_access(path, output, wanted, progress=None, chunk_size=tarfile.RECORDSIZE):
+    """
+    Mengekstrak member dari arsip gzip-seekable dengan melompat
+    langsung ke offset header setiap member berdasarkan indeks.
+    """
+    entries = [entry for entry in load_tar_index(path) if entry["name"] in wanted]
+    if progress is not None:
+        progress.add_total(sum(entry["size"] for entry in entries))
+
+    with SeekableGzipReader(path) as reader:
+        with tarfile.open(fileobj=reader, mode="r:", copybufsize=chunk_size) as tar:
+            for entry in entries:
+                reader.seek(entry["offset"])
+                member = tarfile.TarInfo.fromtarfile(tar)
+                tar.extract(member, path=output)
+
+                if progress is not None:
+                    progress.advance(entry["size"])
+
+    return len(entries)
+
+
+def extract_streaming(path, output, wanted, progress=None, chunk_size=tarfile.RECORDSIZE):
+    """
+    Mengekstrak member dengan membaca arsip berurutan. Pembacaan
+    berhenti setelah seluruh member terpilih diekstrak sehingga sisa
+    arsip tidak perlu didekompresi.
+    """
+    codec = codec_for_path(path)
+    remaining = set(wanted)
+    count = 0
+
+    with open(path, "rb") as raw_in:
+        if progress is not None:
+            progress.add_total(os.fstat(raw_in.fileno()).st_size)
+            raw_in = ProgressReader(raw_in, progress)
+
+        with codec.open_reader(raw_in) as reader:
+            with tarfile.open(fileobj=reader, mode="r|", copybufsize=chunk_size) as tar:
+                for member in tar:
+                    if member.name not in remaining:
+                        continue
+
+                    tar.extract(member, path=output)
+                    remaining.discard(member.name)
+                    count += 1
+                    if not remaining:
+                        break
+
+    return count
@@ -0,0 +1,875 @@
+"""
+Helper TransferCore.
+
+Helper ini berisi mesin pengiriman file ke server penerima
+(Assets/serverReciever.py) melalui socket TCP, tanpa ketergantungan
+pada CustomTkinter sehingga dapat dipakai oleh GUI maupun CLI.
+
+Protokol: nama file diakhiri newline, lalu isi file dalam bentuk
+binary hingga koneksi ditutup.
+
+File yang belum terkompresi dapat dikirim dengan mode pipeline:
+satu thread mengompresi file ke antrian blok berukuran terbatas,
+sementara thread pengirim langsung mengirim blok tersebut ke socket.
+Kompresi dan pengiriman berjalan bersamaan tanpa file sementara,
+sehingga waktu transfer mendekati waktu yang paling lama di antara
+keduanya, bukan jumlah keduanya.
+
+File yang sudah ada di disk dalam bentuk terkompresi dikirim dengan
+socket.sendfile (zero-copy), sehingga isi file disalin langsung oleh
+kernel tanpa melewati buffer Python. Ukuran chunk, SO_SNDBUF,
+SO_RCVBUF, dan TCP_NODELAY dapat diatur melalui dict options.
+
+Mode paralel membagi file menjadi beberapa rentang byte yang dikirim
+bersamaan melalui beberapa koneksi TCP. Setiap koneksi diawali satu
+baris header RANGE_PREFIX + JSON berisi nama file, ukuran total,
+offset, panjang rentang, dan jumlah koneksi, sehingga server dapat
+menulis setiap rentang ke posisinya pada file yang sudah dialokasikan.
+
+Mode resume (send_resumable) mengirim header RESUME_PREFIX + JSON
+berisi nama, ukuran, hash SHA-256, dan ukuran chunk. Server membalas
+offset yang sudah dimilikinya dari unggahan sebelumnya, lalu client
+hanya mengirim sisanya sebagai frame berisi CRC32 per chunk. Chunk
+yang rusak dilaporkan server dan dikirim ulang, dan koneksi yang
+terputus disambung kembali hingga RESUME_RETRIES kali.
+
+Mode folder (send_tree) mengirim seluruh pohon folder atau pilihan
+file melalui satu koneksi. Setelah header TREE_PREFIX + JSON, setiap
+entri dikirim sebagai frame berprefiks panjang (jenis, panjang path,
+mode, mtime, ukuran isi) diikuti path relatif dan isinya. Frame file
+kecil dikumpulkan hingga TREE_BATCH_SIZE byte sebelum dikirim sehingga
+ribuan file kecil tidak membutuhkan satu syscall send per file.
+Symlink (termasuk symlink ke folder dan symlink yang rusak) dikirim
+sebagai frame FRAME_LINK berisi target link, bukan isi yang ditunjuk;
+file khusus lain (FIFO, socket, device) dilewati dan dicatat di log.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import queue
+import shutil
+import socket
+import stat
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from Helper.codecRegistry import DEFAULT_CODEC, DEFAULT_PRESET, codec_for_path, get_codec
+from Helper.logCreate import LogCreate
+from Helper.progressReporter import ProgressReader
+from Helper.streamCompress import copy_stream, open_writer
+
+# Folder file sementara hasil prepare_file; file disimpan hingga
+# berhasil dikirim agar mode resume dapat melanjutkan antar percobaan
+PREPARED_DIR = os.path.join(tempfile.gettempdir(), "transfer-prepared")
+
+# Ukuran potongan data setiap pengiriman pada jalur salin biasa
+SEND_CHUNK_SIZE = 256 * 1024
+
+# Jumlah byte per panggilan socket.sendfile di antara pembaruan progres
+SENDFILE_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Awalan baris header setiap koneksi pada mode paralel
+RANGE_PREFIX = "#RANGE "
+
+# Ukuran rentang minimal per koneksi pada mode paralel
+MIN_RANGE_SIZE = 4 * 1024 * 1024
+
+# Awalan baris header pada mode resume
+RESUME_PREFIX = "#RESUME "
+
+# Ukuran chunk yang masing-masing diberi CRC32 pada mode resume
+RESUME_CHUNK_SIZE = 1024 * 1024
+
+# Header setiap frame mode resume: offset, panjang isi, dan CRC32 isi
+FRAME_HEADER = struct.Struct(">QII")
+
+# Jumlah percobaan menyambung ulang dan jeda antar percobaan (detik)
+RESUME_RETRIES = 5
+RESUME_RETRY_DELAY = 1.0
+
+# Awalan baris header pada mode folder
+TREE_PREFIX = "#TREE "
+
+# Header setiap frame mode folder: jenis, panjang path, mode, mtime, ukuran isi
+TREE_FRAME = struct.Struct(">BHIQQ")
+
+# Jenis frame mode folder
+FRAME_END = 0
+FRAME_FILE = 1
+FRAME_DIR = 2
+FRAME_LINK = 3
+
+# Frame dikumpulkan hingga ukuran ini sebelum dikirim; file yang lebih
+# besar dikirim langsung setelah frame-nya
+TREE_BATCH_SIZE = 256 * 1024
+
+# Pilihan jumlah koneksi paralel pada GUI
+STREAM_CHOICES = ["1", "2", "4", "8"]
+
+# Opsi socket default; None berarti memakai ukuran bawaan sistem operasi
+DEFAULT_SOCKET_OPTIONS = {
+    "chunk_size": SEND_CHUNK_SIZE,
+    "sndbuf": None,
+    "rcvbuf": None,
+    "nodelay": False,
+    "zero_copy": True,
+}
+
+# Ukuran blok terkompresi yang diteruskan ke thread pengirim
+PIPELINE_BLOCK_SIZE = 256 * 1024
+
+# Jumlah blok terkompresi maksimal yang menunggu dikirim
+PIPELINE_DEPTH = 8
+
+
+class QueueWriter:
+    """
+    Objek file-like (hanya tulis) yang mengumpulkan data terkompresi
+    per block_size byte lalu menaruhnya ke antrian berukuran terbatas.
+    write() menunggu selama antrian penuh sehingga memori tetap
+    terbatas, dan berhenti dengan error jika pengirim sudah berhenti.
+    """
+
+    def __init__(self, blocks, stop_event, block_size=PIPELINE_BLOCK_SIZE):
+        self.blocks = blocks
+        self.stop_event = stop_event
+        self.block_size = block_size
+        self.bytes_out = 0
+        self._buffer = bytearray()
+
+    def write(self, data):
+        self._buffer += data
+        if len(self._buffer) >= self.block_size:
+            self._put(bytes(self._buffer))
+            self._buffer.clear()
+
+        return len(data)
+
+    def flush(self):
+        """
+        Disediakan agar kompatibel dengan antarmuka file. Sisa buffer
+        tetap ditahan sampai finish() dipanggil.
+        """
+
+    def finish(self, error=None):
+        """
+        Mengirim sisa buffer lalu penanda akhir stream ke antrian.
+        Jika error diisi, error tersebut diteruskan ke thread pengirim.
+        """
+        if error is None and self._buffer:
+            self._put(bytes(self._buffer))
+            self._buffer.clear()
+
+        self._put(error)
+
+    def _put(self, item):
+        while not self.stop_event.is_set():
+            try:
+                self.blocks.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+
+            if isinstance(item, bytes):
+                self.bytes_out += len(item)
+            return
+
+        raise ConnectionError("Sender stopped before compression finished")
+
+
+def compress_to_queue(filepath, sink, codec, compresslevel, workers=1, progress=None):
+    """
+    Mengompresi file ke QueueWriter. Dijalankan pada thread kompresi;
+    error (termasuk pembatalan) diteruskan ke thread pengirim.
+    """
+    try:
+        with open(filepath, "rb") as src:
+            source = src if progress is None else ProgressReader(src, progress)
+            with open_writer(sink, codec, compresslevel, workers) as writer:
+                copy_stream(source, writer)
+    except BaseException as e:
+        if not sink.stop_event.is_set():
+            sink.finish(e)
+        return
+
+    sink.finish()
+
+
+def socket_options(options=None):
+    """
+    Menggabungkan options dengan DEFAULT_SOCKET_OPTIONS.
+    Mengembalikan dict opsi yang lengkap.
+    """
+    merged = dict(DEFAULT_SOCKET_OPTIONS)
+    if options:
+        merged.update({key: value for key, value in options.items() if value is not None})
+
+    return merged
+
+
+def configure_socket(s, options):
+    """
+    Menerapkan SO_SNDBUF, SO_RCVBUF, dan TCP_NODELAY pada socket.
+    Ukuran buffer harus diatur sebelum connect agar window TCP
+    dapat dinegosiasikan sesuai ukuran tersebut.
+    """
+    if options["sndbuf"]:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, options["sndbuf"])
+    if options["rcvbuf"]:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, options["rcvbuf"])
+    if options["nodelay"]:
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+def connect(host, port, filename, options=None):
+    """
+    Membuka koneksi ke server lalu mengirim nama file.
+    Mengembalikan socket yang sudah terhubung.
+    """
+    LogCreate("TransferModule", f"Connecting to {host}:{port}")
+
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        configure_socket(s, socket_options(options))
+        s.connect((host, port))
+    except BaseException:
+        s.close()
+        raise
+
+    LogCreate(
+        "TransferModule",
+        f"Connected to server. Sending filename: {filename}"
+    )
+
+    # Mengirim nama file terlebih dahulu
+    s.sendall((filename + "\n").encode("utf-8"))
+    return s
+
+
+def close_socket(s):
+    """
+    Menutup socket dan mencatat hasilnya ke log.
+    """
+    try:
+        s.close()
+        LogCreate("TransferModule", "Socket closed")
+    except Exception:
+        LogCreate(
+            "TransferModule",
+            "Socket failed to close",
+            level="ERROR"
+        )
+
+
+def prepared_path(filepath, codec, level):
+    """
+    Mengembalikan path file sementara hasil prepare_file. Nama file
+    diturunkan dari path absolut, ukuran, dan mtime sumber serta codec
+    dan level, sehingga pengiriman ulang file yang sama memakai file
+    sementara yang sama, sedangkan dua file berbeda dengan nama sama
+    tidak saling menimpa.
+    """
+    st = os.stat(filepath)
+    identity = f"{os.path.abspath(filepath)}|{st.st_size}|{st.st_mtime_ns}|{codec.name}|{level}"
+    key = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(PREPARED_DIR, f"{key}-{os.path.basename(filepath)}{codec.extension}")
+
+
+def open_deterministic_writer(codec, raw_out, level, mtime):
+    """
+    Membuka stream kompresi yang hasilnya sama untuk isi yang sama.
+    Header gzip diberi mtime sumber dan tanpa nama file, bukan waktu
+    saat kompresi; codec lain sudah deterministik.
+    """
+    if codec.name == "gzip":
+        return gzip.GzipFile(filename="", fileobj=raw_out, mode="wb", compresslevel=level, mtime=mtime)
+
+    return codec.open_writer(raw_out, level)
+
+
+def prepare_file(filepath, progress=None):
+    """
+    Menyiapkan file yang akan dikirim. File yang belum terkompresi
+    dikompresi terlebih dahulu ke PREPARED_DIR menggunakan codec
+    default secara deterministik, sehingga hash SHA-256-nya tetap sama
+    antar percobaan dan mode resume dapat melanjutkan unggahan
+    sebelumnya. File sementara yang sudah ada dipakai ulang.
+    Mengembalikan tuple (path file yang dikirim, nama file).
+    """
+    existing_codec = codec_for_path(filepath)
+    if existing_codec is not None:
+        LogCreate(
+            "TransferModule",
+            f"File already compressed ({existing_codec.extension}): {filepath}"
+        )
+        return filepath, os.path.basename(filepath)
+
+    codec = get_codec(DEFAULT_CODEC)
+    level = codec.level(DEFAULT_PRESET)
+    filename = os.path.basename(filepath) + codec.extension
+    file_to_send = prepared_path(filepath, codec, level)
+
+    if os.path.exists(file_to_send):
+        LogCreate("TransferModule", f"Reusing prepared {codec.name} file: {file_to_send}")
+        return file_to_send, filename
+
+    LogCreate("TransferModule", f"Compressing file before sending: {filepath}")
+    if progress is not None:
+        progress.reset(os.path.getsize(filepath), "Compressing")
+
+    # Mengompresi ke file .tmp unik lalu memindahkannya secara atomik
+    # agar file yang ada di PREPARED_DIR selalu lengkap
+    os.makedirs(PREPARED_DIR, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=PREPARED_DIR, suffix=".tmp")
+    try:
+        with open(filepath, "rb") as src, os.fdopen(fd, "wb") as raw_out:
+            mtime = int(os.fstat(src.fileno()).st_mtime)
+            with open_deterministic_writer(codec, raw_out, level, mtime) as dst:
+                shutil.copyfileobj(src if progress is None else ProgressReader(src, progress), dst)
+
+        os.replace(temp_path, file_to_send)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    LogCreate("TransferModule", f"Temporary {codec.name} file created: {file_to_send}")
+    return file_to_send, filename
+
+
+def cleanup_prepared(file_to_send, filepath):
+    """
+    Menghapus file sementara hasil prepare_file setelah berhasil
+    dikirim. File asli (yang sudah terkompresi) tidak pernah dihapus.
+    """
+    if file_to_send != filepath and os.path.exists(file_to_send):
+        os.remove(file_to_send)
+        LogCreate("TransferModule", f"Temporary file removed: {file_to_send}")
+
+
+def send_zero_copy(s, f, length, progress=None, offset=0):
+    """
+    Mengirim length byte isi file f mulai dari offset dengan
+    socket.sendfile per SENDFILE_CHUNK_SIZE byte sehingga progres
+    tetap dapat diperbarui. Mengembalikan jumlah byte yang terkirim.
+    """
+    total_sent = 0
+    while total_sent < length:
+        sent = s.sendfile(f, offset + total_sent, min(SENDFILE_CHUNK_SIZE, length - total_sent))
+        if not sent:
+            break
+
+        total_sent += sent
+        if progress is not None:
+            progress.advance(sent)
+
+    return total_sent
+
+
+def send_copy(s, f, chunk_size, progress=None, length=None):
+    """
+    Mengirim isi file f dari posisi saat ini dalam potongan chunk_size
+    byte melalui satu buffer yang dipakai ulang, sebanyak length byte
+    atau hingga akhir file jika length bernilai None.
+    Mengembalikan jumlah byte yang terkirim.
+    """
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    total_sent = 0
+
+    while length is None or total_sent < length:
+        wanted = chunk_size if length is None else min(chunk_size, length - total_sent)
+        size = f.readinto(view[:wanted])
+        if not size:
+            break
+
+        s.sendall(view[:size])
+        total_sent += size
+        if progress is not None:
+            progress.advance(size)
+
+    return total_sent
+
+
+def send_file(host, port, file_to_send, filename, progress=None, options=None):
+    """
+    Mengirim file ke server: nama file terlebih dahulu, lalu isi file
+    dengan socket.sendfile (zero-copy) atau, jika options["zero_copy"]
+    bernilai False, dalam potongan options["chunk_size"] byte.
+    Mengembalikan jumlah byte isi file yang terkirim.
+    """
+    options = socket_options(options)
+    s = connect(host, port, filename, options)
+    try:
+        file_size = os.path.getsize(file_to_send)
+        if progress is not None:
+            progress.reset(file_size, "Sending")
+
+        with open(file_to_send, "rb") as f:
+            if options["zero_copy"]:
+                total_sent = send_zero_copy(s, f, file_size, progress)
+            else:
+                total_sent = send_copy(s, f, options["chunk_size"], progress)
+
+        LogCreate(
+            "TransferModule",
+            f"Transfer completed. Bytes sent: {total_sent}/{file_size}",
+            level="SUCCESS"
+        )
+        return total_sent
+
+    finally:
+        close_socket(s)
+
+
+def split_ranges(size, streams):
+    """
+    Membagi size byte menjadi paling banyak streams rentang yang
+    berurutan, masing-masing minimal MIN_RANGE_SIZE byte.
+    Mengembalikan daftar tuple (offset, panjang).
+    """
+    streams = max(1, min(streams, size // MIN_RANGE_SIZE))
+    step = max(1, -(-size // streams))
+    return [(offset, min(step, size - offset)) for offset in range(0, size, step)] or [(0, 0)]
+
+
+def send_range(host, port, file_to_send, header, progress=None, options=None):
+    """
+    Mengirim satu rentang byte file melalui koneksi tersendiri:
+    baris header rentang terlebih dahulu, lalu isi rentang tersebut.
+    Mengembalikan jumlah byte yang terkirim.
+    """
+    options = socket_options(options)
+    s = connect(host, port, RANGE_PREFIX + json.dumps(header), options)
+    try:
+        with open(file_to_send, "rb") as f:
+            if options["zero_copy"]:
+                return send_zero_copy(s, f, header["length"], progress, offset=header["offset"])
+
+            f.seek(header["offset"])
+            return send_copy(s, f, options["chunk_size"], progress, length=header["length"])
+
+    finally:
+        close_socket(s)
+
+
+def send_parallel(host, port, file_to_send, filename, streams, progress=None, options=None):
+    """
+    Mengirim file ke server melalui beberapa koneksi TCP bersamaan.
+    File dibagi menjadi rentang byte (lihat split_ranges) dan setiap
+    rentang dikirim oleh satu thread melalui send_range.
+    Mengembalikan jumlah byte isi file yang terkirim.
+    """
+    file_size = os.path.getsize(file_to_send)
+    ranges = split_ranges(file_size, streams)
+
+    LogCreate(
+        "TransferModule",
+        f"Sending {filename} to {host}:{port} over {len(ranges)} connections"
+    )
+    if progress is not None:
+        progress.reset(file_size, "Sending")
+
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [
+            executor.submit(
+                send_range, host, port, file_to_send,
+                {"name": filename, "size": file_size, "offset": offset, "length": length,
+                 "count": len(ranges)},
+                progress, options
+            )
+            for offset, length in ranges
+        ]
+        total_sent = sum(future.result() for future in futures)
+
+    LogCreate(
+        "TransferModule",
+        f"Transfer completed. Bytes sent: {total_sent}/{file_size}",
+        level="SUCCESS"
+    )
+    return total_sent
+
+
+def file_sha256(path, progress=None, chunk_size=RESUME_CHUNK_SIZE):
+    """
+    Menghitung hash SHA-256 isi file. Mengembalikan hash dalam hex.
+    """
+    digest = hashlib.sha256()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+
+    if progress is not None:
+        progress.reset(os.path.getsize(path), "Hashing")
+
+    with open(path, "rb") as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                return digest.hexdigest()
+
+            digest.update(view[:size])
+            if progress is not None:
+                progress.advance(size)
+
+
+def read_line(s):
+    """
+    Membaca satu baris balasan server (tanpa newline).
+    Melempar ConnectionError jika koneksi ditutup sebelum newline.
+    """
+    line = bytearray()
+    while True:
+        byte = s.recv(1)
+        if not byte:
+            raise ConnectionError("Connection closed by receiver")
+        if byte == b"\n":
+            return line.decode("utf-8")
+        line += byte
+
+
+def send_chunks(s, f, offsets, file_size, chunk_size, progress=None):
+    """
+    Mengirim chunk pada offsets sebagai frame (offset, panjang, CRC32,
+    isi), lalu frame kosong sebagai penanda akhir.
+    Mengembalikan jumlah byte isi yang terkirim.
+    """
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    total_sent = 0
+
+    for offset in offsets:
+        f.seek(offset)
+        size = f.readinto(view[:min(chunk_size, file_size - offset)])
+        s.sendall(FRAME_HEADER.pack(offset, size, zlib.crc32(view[:size])))
+        s.sendall(view[:size])
+
+        total_sent += size
+        if progress is not None:
+            progress.advance(size)
+
+    s.sendall(FRAME_HEADER.pack(0, 0, 0))
+    return total_sent
+
+
+def resume_session(host, port, file_to_send, header, progress=None, options=None):
+    """
+    Menjalankan satu sesi mode resume: mengirim header, membaca offset
+    dari server, mengirim sisa file, lalu mengirim ulang chunk yang
+    dilaporkan rusak hingga server membalas OK.
+    Mengembalikan jumlah byte isi yang terkirim pada sesi ini.
+    """
+    file_size = header["size"]
+    chunk_size = header["chunk_size"]
+
+    s = connect(host, port, RESUME_PREFIX + json.dumps(header), options)
+    try:
+        reply = read_line(s)
+        if reply.startswith("FAIL"):
+            raise ValueError(f"Receiver rejected {header['name']}: {reply}")
+        if not reply.startswith("OFFSET "):
+            raise ConnectionError(f"Unexpected reply from receiver: {reply}")
+
+        offset = int(reply[len("OFFSET "):])
+        if offset:
+            LogCreate("TransferModule", f"Resuming {header['name']} from offset {offset}/{file_size}")
+        if progress is not None:
+            progress.reset(file_size, "Sending")
+            progress.advance(offset)
+
+        total_sent = 0
+        offsets = range(offset, file_size, chunk_size)
+
+        with open(file_to_send, "rb") as f:
+            while True:
+                total_sent += send_chunks(s, f, offsets, file_size, chunk_size, progress)
+
+                reply = read_line(s)
+                if reply == "OK":
+                    return total_sent
+                if not reply.startswith("BAD "):
+                    raise ValueError(f"Receiver rejected {header['name']}: {reply}")
+
+                offsets = json.loads(reply[len("BAD "):])
+                LogCreate(
+                    "TransferModule",
+                    f"Resending {len(offsets)} corrupted or missing chunks",
+                    level="ERROR"
+                )
+
+    finally:
+        close_socket(s)
+
+
+def send_resumable(host, port, file_to_send, filename, progress=None, options=None, retries=RESUME_RETRIES):
+    """
+    Mengirim file dalam mode resume. Jika koneksi terputus, koneksi
+    disambung kembali hingga retries kali dan pengiriman dilanjutkan
+    dari offset yang sudah diterima server.
+    Mengembalikan jumlah byte isi yang terkirim pada seluruh sesi.
+    """
+    header = {
+        "name": filename,
+        "size": os.path.getsize(file_to_send),
+        "sha256": file_sha256(file_to_send, progress),
+        "chunk_size": RESUME_CHUNK_SIZE,
+    }
+
+    total_sent = 0
+    attempt = 0
+    while True:
+        try:
+            total_sent += resume_session(host, port, file_to_send, header, progress, options)
+            break
+        except OSError as e:
+            attempt += 1
+            if attempt > retries:
+                raise
+
+            LogCreate(
+                "TransferModule",
+                f"Connection lost ({e}). Retrying in {RESUME_RETRY_DELAY}s ({attempt}/{retries})",
+                level="ERROR"
+            )
+            time.sleep(RESUME_RETRY_DELAY)
+
+    LogCreate(
+        "TransferModule",
+        f"Transfer completed. Bytes sent: {total_sent}/{header['size']}",
+        level="SUCCESS"
+    )
+    return total_sent
+
+
+def entry_kind(path, st):
+    """
+    Menentukan jenis frame dari hasil os.lstat sebuah path.
+    Mengembalikan None (dan mencatat ke log) untuk file khusus seperti
+    FIFO, socket, atau device yang tidak dapat dikirim.
+    """
+    if stat.S_ISLNK(st.st_mode):
+        return FRAME_LINK
+    if stat.S_ISREG(st.st_mode):
+        return FRAME_FILE
+
+    LogCreate("TransferModule", f"Skipping special file: {path}")
+    return None
+
+
+def tree_entries(sources):
+    """
+    Menghasilkan entri (jenis frame, path, nama relatif, stat) untuk
+    setiap file dan folder sumber. Nama relatif dihitung dari folder
+    induk sumber sehingga folder "data" dikirim sebagai "data/...".
+    Stat diambil dengan os.lstat sehingga symlink tidak diikuti:
+    symlink ke folder (yang didaftarkan os.walk pada dirs namun tidak
+    dimasuki) dan symlink rusak tetap dikirim sebagai FRAME_LINK.
+    """
+    for source in sources:
+        source = os.path.abspath(source)
+        base = os.path.dirname(source)
+        st = os.lstat(source)
+
+        if not stat.S_ISDIR(st.st_mode):
+            kind = entry_kind(source, st)
+            if kind is not None:
+                yield kind, source, os.path.basename(source), st
+            continue
+
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            yield FRAME_DIR, root, os.path.relpath(root, base).replace(os.sep, "/"), os.lstat(root)
+
+            links = [name for name in dirs if os.path.islink(os.path.join(root, name))]
+            for name in sorted(files + links):
+                path = os.path.join(root, name)
+                st = os.lstat(path)
+                kind = entry_kind(path, st)
+                if kind is not None:
+                    yield kind, path, os.path.relpath(path, base).replace(os.sep, "/"), st
+
+
+def send_tree(host, port, sources, progress=None, options=None):
+    """
+    Mengirim satu atau banyak file/folder melalui satu koneksi dengan
+    protokol frame mode folder. Server membalas "OK <jumlah file>"
+    setelah seluruh file ditulis.
+    Mengembalikan jumlah byte isi file yang terkirim.
+    """
+    options = socket_options(options)
+    entries = list(tree_entries(sources))
+    file_count = sum(1 for entry in entries if entry[0] == FRAME_FILE)
+    total_size = sum(entry[3].st_size for entry in entries if entry[0] == FRAME_FILE)
+
+    LogCreate(
+        "TransferModule",
+        f"Sending {file_count} files ({total_size} bytes) to {host}:{port} over one connection"
+    )
+    s = connect(host, port, TREE_PREFIX + json.dumps({"files": file_count, "bytes": total_size}), options)
+    try:
+        if progress is not None:
+            progress.reset(total_size, "Sending")
+
+        batch = bytearray()
+        for kind, path, name, st in entries:
+            encoded = name.encode("utf-8")
+            mode = stat.S_IMODE(st.st_mode)
+            mtime = int(st.st_mtime)
+
+            if kind == FRAME_DIR:
+                batch += TREE_FRAME.pack(FRAME_DIR, len(encoded), mode, mtime, 0) + encoded
+                continue
+
+            if kind == FRAME_LINK:
+                target = os.readlink(path).replace(os.sep, "/").encode("utf-8")
+                batch += TREE_FRAME.pack(FRAME_LINK, len(encoded), mode, mtime, len(target)) + encoded + target
+                continue
+
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                batch += TREE_FRAME.pack(FRAME_FILE, len(encoded), mode, mtime, size) + encoded
+
+                if size <= TREE_BATCH_SIZE:
+                    data = f.read(size)
+                    batch += data
+                    sent = len(data)
+                    if progress is not None:
+                        progress.advance(sent)
+                else:
+                    s.sendall(batch)
+                    batch.clear()
+                    if options["zero_copy"]:
+                        sent = send_zero_copy(s, f, size, progress)
+                    else:
+                        sent = send_copy(s, f, options["chunk_size"], progress, length=size)
+
+            if sent != size:
+                raise ValueError(f"File changed while sending: {path}")
+
+            if len(batch) >= TREE_BATCH_SIZE:
+                s.sendall(batch)
+                batch.clear()
+
+        batch += TREE_FRAME.pack(FRAME_END, 0, 0, 0, 0)
+        s.sendall(batch)
+
+        reply = read_line(s)
+        if reply != f"OK {file_count}":
+            raise ValueError(f"Receiver rejected folder transfer: {reply}")
+
+        LogCreate(
+            "TransferModule",
+            f"Transfer completed. Files sent: {file_count}, bytes sent: {total_size}",
+            level="SUCCESS"
+        )
+        return total_size
+
+    finally:
+        close_socket(s)
+
+
+def stream_file(host, port, filepath, progress=None, workers=1, codec=DEFAULT_CODEC, preset=DEFAULT_PRESET,
+                options=None):
+    """
+    Mengompresi file sambil mengirimnya ke server (mode pipeline).
+    Thread kompresi mengisi antrian blok berukuran terbatas, sedangkan
+    thread pemanggil mengirim blok tersebut ke socket. Progres dihitung
+    dari byte file asli yang sudah dikompresi.
+    Mengembalikan jumlah byte terkompresi yang terkirim.
+    """
+    codec = get_codec(codec)
+    filename = os.path.basename(filepath) + codec.extension
+    file_size = os.path.getsize(filepath)
+
+    s = connect(host, port, filename, options)
+    blocks = queue.Queue(maxsize=PIPELINE_DEPTH)
+    stop_event = threading.Event()
+    sink = QueueWriter(blocks, stop_event)
+
+    LogCreate(
+        "TransferModule",
+        f"Streaming {codec.name} compression to {host}:{port}: {filepath} "
+        f"(workers {workers})"
+    )
+    if progress is not None:
+        progress.reset(file_size, "Compressing & sending")
+
+    compressor = threading.Thread(
+        target=compress_to_queue,
+        args=(filepath, sink, codec, codec.level(preset), workers, progress),
+        daemon=True
+    )
+    compressor.start()
+
+    try:
+        total_sent = 0
+        while True:
+            block = blocks.get()
+            if block is None:
+                break
+            if isinstance(block, BaseException):
+                raise block
+
+            s.sendall(block)
+            total_sent += len(block)
+
+        LogCreate(
+            "TransferModule",
+            f"Transfer completed. Bytes sent: {total_sent} ({file_size} bytes before compression)",
+            level="SUCCESS"
+        )
+        return total_sent
+
+    finally:
+        stop_event.set()
+        compressor.join()
+        close_socket(s)
+
+
+def transfer_file(host, port, filepath, progress=None, pipelined=True, workers=1, options=None, streams=1,
+                  resumable=False):
+    """
+    Mengirim file ke server. File yang belum terkompresi dikompresi
+    sambil dikirim (pipelined) atau terlebih dahulu ke file sementara
+    yang dihapus setelah berhasil dikirim. Jika streams lebih dari satu, file
+    dikirim melalui beberapa koneksi paralel, dan jika resumable
+    bernilai True, file dikirim dalam mode resume. Kedua mode ini
+    membutuhkan ukuran file yang sudah diketahui sehingga selalu memakai
+    file sementara. Mengembalikan jumlah byte yang terkirim.
+    """
+    if pipelined and streams <= 1 and not resumable and codec_for_path(filepath) is None:
+        return stream_file(host, port, filepath, progress, workers=workers, options=options)
+
+    file_to_send, filename = prepare_file(filepath, progress)
+    if resumable:
+        total_sent = send_resumable(host, port, file_to_send, filename, progress, options)
+    elif streams > 1:
+        total_sent = send_parallel(host, port, file_to_send, filename, streams, progress, options)
+    else:
+        total_sent = send_file(host, port, file_to_send, filename, progress, options)
+
+    # File sementara disimpan jika gagal agar percobaan berikutnya
+    # memakai file (dan hash) yang sama
+    cleanup_prepared(file_to_send, filepath)
+    return total_sent
+
+
+def transfer_sources(host, port, sources, progress=None, pipelined=True, workers=1, options=None, streams=1,
+                     resumable=False):
+    """
+    Titik masuk pengiriman yang dipakai GUI maupun CLI. Folder atau
+    lebih dari satu sumber dikirim melalui satu koneksi (send_tree),
+    sedangkan satu file dikirim melalui transfer_file.
+    Mengembalikan jumlah byte yang terkirim.
+    """
+    if len(sources) > 1 or os.path.isdir(sources[0]):
+        return send_tree(host, port, sources, progress, options)
+
+    return transfer_file(
+        host, port, sources[0], progress, pipelined=pipelined, workers=workers, options=options,
+        streams=streams, resumable=resumable
+    )
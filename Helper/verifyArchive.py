@@ -0,0 +1,335 @@
+"""
+Helper VerifyArchive.
+
+Helper ini memeriksa keutuhan arsip tanpa menulis apa pun ke disk.
+Arsip dibaca secara streaming seperti saat dekompresi, namun hasilnya
+hanya diperiksa lalu dibuang:
+
+- file tunggal terkompresi : CRC/checksum bawaan codec (CRC32 dan ISIZE
+  gzip, CRC bz2, CRC lzma, Adler-32 zlib),
+- arsip TAR terkompresi    : checksum codec serta checksum header dan
+  struktur TAR,
+- Indexed Archive (.iarc)  : CRC32 setiap entri terhadap indeks pusat,
+- manifest inkremental     : setiap arsip dasar dan delta, lalu hash
+  SHA-256 kondisi akhir dibandingkan dengan hash di manifest,
+- snapshot dedup           : hash SHA-256 setiap chunk yang dirujuk.
+
+Jika diminta, hash SHA-256 isi setiap file dihitung sehingga dapat
+dibandingkan dengan daftar hash (format sha256sum atau manifest
+inkremental).
+"""
+
+import hashlib
+import json
+import os
+import tarfile
+import zlib
+
+from Helper.codecRegistry import codec_for_path, is_tar_archive, strip_extension
+from Helper.dedupStore import DedupStore, is_snapshot
+from Helper.incrementalArchive import TOMBSTONE_MEMBER, is_manifest, load_manifest
+from Helper.indexedArchive import COPY_SIZE, is_indexed_archive, open_entry, read_index
+from Helper.parallelDecompress import ParallelGzipReader
+from Helper.progressReporter import ProgressReader
+from Helper.streamCompress import DEFAULT_BLOCK_SIZE
+
+# Akhiran daftar hash sidecar yang otomatis dipakai saat verifikasi
+HASH_LIST_SUFFIX = ".sha256"
+
+
+def hash_list_path(path):
+    """
+    Mengembalikan path daftar hash sidecar untuk arsip path.
+    """
+    return path + HASH_LIST_SUFFIX
+
+
+def load_hash_list(path):
+    """
+    Membaca daftar hash yang diharapkan. Mendukung format sha256sum
+    ("<hash>  <nama>" per baris) dan manifest inkremental (JSON).
+    Mengembalikan dict nama -> hash SHA-256.
+    """
+    if is_manifest(path):
+        entries = load_manifest(path)["entries"]
+        return {name: entry["sha256"] for name, entry in entries.items() if "sha256" in entry}
+
+    hashes = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line.strip() or line.startswith("#"):
+                continue
+
+            digest, _, name = line.partition("  ")
+            if not name:
+                raise ValueError(f"Invalid hash list line: {line}")
+            hashes[name.lstrip("*")] = digest.lower()
+
+    return hashes
+
+
+def write_hash_list(path, hashes):
+    """
+    Menyimpan daftar hash dalam format sha256sum secara atomik.
+    """
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        for name in sorted(hashes):
+            f.write(f"{hashes[name]}  {name}\n")
+
+    os.replace(temp_path, path)
+
+
+def compare_hashes(hashes, expected):
+    """
+    Membandingkan hash hasil verifikasi dengan daftar hash yang
+    diharapkan. Mengembalikan daftar pesan masalah (kosong jika cocok).
+    """
+    problems = []
+    for name in sorted(expected):
+        if name not in hashes:
+            problems.append(f"missing: {name}")
+        elif hashes[name] != expected[name]:
+            problems.append(f"hash mismatch: {name}")
+
+    return problems
+
+
+def drain(reader, chunk_size, digest=None):
+    """
+    Membaca stream sampai habis dengan satu buffer yang dipakai ulang.
+    Mengembalikan jumlah byte yang dibaca.
+    """
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    total = 0
+
+    while True:
+        size = reader.readinto(buffer)
+        if not size:
+            return total
+
+        if digest is not None:
+            digest.update(view[:size])
+        total += size
+
+
+def open_archive(path, workers=1, progress=None):
+    """
+    Membuka stream data hasil dekompresi path. File gzip dibaca paralel
+    jika workers lebih dari satu. Mengembalikan tuple (file mentah atau
+    None, reader).
+    """
+    codec = codec_for_path(path)
+    if codec is None:
+        raise ValueError(f"Unsupported compressed file: {path}")
+
+    if workers > 1 and codec.name == "gzip":
+        return None, ParallelGzipReader(path, workers, progress=progress)
+
+    raw_in = open(path, "rb")
+    if progress is not None:
+        progress.add_total(os.fstat(raw_in.fileno()).st_size)
+        return raw_in, codec.open_reader(ProgressReader(raw_in, progress))
+
+    return raw_in, codec.open_reader(raw_in)
+
+
+def verify_file(path, workers=1, progress=None, chunk_size=DEFAULT_BLOCK_SIZE, compute_hashes=False):
+    """
+    Memverifikasi satu file terkompresi. Mengembalikan hasil verifikasi
+    dengan nama file asli sebagai nama entri.
+    """
+    raw_in, reader = open_archive(path, workers, progress)
+    digest = hashlib.sha256() if compute_hashes else None
+
+    try:
+        with reader:
+            size = drain(reader, chunk_size, digest)
+    finally:
+        if raw_in is not None:
+            raw_in.close()
+
+    name = strip_extension(os.path.basename(path))
+    return {
+        "entries": 1,
+        "bytes": size,
+        "hashes": {name: digest.hexdigest()} if digest is not None else {},
+    }
+
+
+def verify_tar(path, workers=1, progress=None, chunk_size=DEFAULT_BLOCK_SIZE, compute_hashes=False):
+    """
+    Memverifikasi arsip TAR terkompresi dengan membaca seluruh member.
+    Member yang tidak perlu di-hash dilewati oleh tarfile tanpa disalin.
+    """
+    raw_in, reader = open_archive(path, workers, progress)
+    entries = 0
+    size = 0
+    hashes = {}
+
+    try:
+        with reader, tarfile.open(fileobj=reader, mode="r|", copybufsize=chunk_size) as tar:
+            for member in tar:
+                entries += 1
+                size += member.size
+                if compute_hashes and member.isfile():
+                    digest = hashlib.sha256()
+                    drain(tar.extractfile(member), chunk_size, digest)
+                    hashes[member.name] = digest.hexdigest()
+
+            # Membaca sisa stream agar CRC dan ISIZE trailer codec ikut diperiksa
+            drain(reader, chunk_size)
+    except tarfile.TarError as e:
+        raise ValueError(f"Corrupted TAR structure in {path}: {e}") from None
+    finally:
+        if raw_in is not None:
+            raw_in.close()
+
+    return {"entries": entries, "bytes": size, "hashes": hashes}
+
+
+def verify_indexed(path, progress=None, compute_hashes=False):
+    """
+    Memverifikasi setiap entri file Indexed Archive terhadap CRC32
+    yang tercatat di indeks pusat.
+    """
+    entries = read_index(path)
+    files = [entry for entry in entries if entry["type"] == "file"]
+    hashes = {}
+
+    if progress is not None:
+        progress.add_total(sum(entry["size"] for entry in files))
+
+    with open(path, "rb") as archive:
+        for entry in files:
+            reader = open_entry(archive, entry)
+            digest = hashlib.sha256() if compute_hashes else None
+            crc = 0
+
+            while True:
+                chunk = reader.read(COPY_SIZE)
+                if not chunk:
+                    break
+
+                crc = zlib.crc32(chunk, crc)
+                if digest is not None:
+                    digest.update(chunk)
+                if progress is not None:
+                    progress.advance(len(chunk))
+
+            if crc != entry["crc32"]:
+                raise ValueError(f"CRC mismatch for entry: {entry['name']}")
+            if digest is not None:
+                hashes[entry["name"]] = digest.hexdigest()
+
+    return {
+        "entries": len(entries),
+        "bytes": sum(entry["size"] for entry in files),
+        "hashes": hashes,
+    }
+
+
+def verify_incremental(path, workers=1, progress=None, chunk_size=DEFAULT_BLOCK_SIZE):
+    """
+    Memverifikasi arsip dasar dan seluruh arsip delta dari manifest
+    inkremental, lalu membandingkan hash kondisi akhir setiap file
+    dengan hash yang tercatat di manifest.
+    """
+    manifest = load_manifest(path)
+    archive_dir = os.path.dirname(os.path.abspath(path))
+    state = {}
+    entries = 0
+    size = 0
+
+    for archive in manifest["archives"]:
+        archive_path = os.path.join(archive_dir, archive["file"])
+        raw_in, reader = open_archive(archive_path, workers, progress)
+
+        try:
+            with reader, tarfile.open(fileobj=reader, mode="r|", copybufsize=chunk_size) as tar:
+                for member in tar:
+                    entries += 1
+                    size += member.size
+
+                    if member.name == TOMBSTONE_MEMBER:
+                        for name in json.loads(tar.extractfile(member).read().decode("utf-8")):
+                            prefix = name + "/"
+                            state = {key: value for key, value in state.items()
+                                     if key != name and not key.startswith(prefix)}
+                    elif member.isfile():
+                        digest = hashlib.sha256()
+                        drain(tar.extractfile(member), chunk_size, digest)
+                        state[member.name] = digest.hexdigest()
+
+                # Membaca sisa stream agar CRC dan ISIZE trailer codec ikut diperiksa
+                drain(reader, chunk_size)
+        except tarfile.TarError as e:
+            raise ValueError(f"Corrupted TAR structure in {archive_path}: {e}") from None
+        finally:
+            if raw_in is not None:
+                raw_in.close()
+
+    expected = {name: entry["sha256"] for name, entry in manifest["entries"].items() if "sha256" in entry}
+    problems = compare_hashes(state, expected)
+    if problems:
+        raise ValueError(f"Incremental archive does not match its manifest: {'; '.join(problems[:10])}")
+
+    return {"entries": entries, "bytes": size, "hashes": state}
+
+
+def verify_snapshot(path, progress=None, compute_hashes=False):
+    """
+    Memverifikasi seluruh chunk yang dirujuk snapshot dedup.
+    Setiap chunk diperiksa hash SHA-256-nya saat dibaca dari store.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        snapshot = json.load(f)
+
+    store = DedupStore(os.path.dirname(os.path.dirname(os.path.abspath(path))))
+    files = [entry for entry in snapshot["entries"] if entry["type"] == "file"]
+    hashes = {}
+
+    if progress is not None:
+        progress.add_total(sum(entry.get("size", 0) for entry in files))
+
+    for entry in files:
+        digest = hashlib.sha256() if compute_hashes else None
+        for chunk_digest in entry["chunks"]:
+            chunk = store.get_chunk(chunk_digest)
+            if digest is not None:
+                digest.update(chunk)
+            if progress is not None:
+                progress.advance(len(chunk))
+
+        if digest is not None:
+            hashes[entry["name"]] = digest.hexdigest()
+
+    return {
+        "entries": len(snapshot["entries"]),
+        "bytes": sum(entry.get("size", 0) for entry in files),
+        "hashes": hashes,
+    }
+
+
+def verify_archive(path, workers=1, progress=None, chunk_size=DEFAULT_BLOCK_SIZE, compute_hashes=False):
+    """
+    Menentukan jenis arsip lalu menjalankan verifikasi yang sesuai.
+    Melempar ValueError (atau error codec) jika arsip rusak.
+    Mengembalikan dict berisi jumlah entri, jumlah byte asli, dan hash
+    SHA-256 setiap file (jika compute_hashes bernilai True).
+    """
+    if is_manifest(path):
+        return verify_incremental(path, workers, progress, chunk_size)
+
+    if is_snapshot(path):
+        return verify_snapshot(path, progress, compute_hashes)
+
+    if is_indexed_archive(path):
+        return verify_indexed(path, progress, compute_hashes)
+
+    if is_tar_archive(path):
+        return verify_tar(path, workers, progress, chunk_size, compute_hashes)
+
+    return verify_file(path, workers, progress, chunk_size, compute_hashes)
@@ -2,18 +2,27 @@
 Modul Compress.
 
 Modul ini menyediakan GUI dan logika utama untuk
-melakukan kompresi file maupun folder menggunakan library gzip.
-Folder akan dikemas terlebih dahulu ke dalam format TAR sebelum
-dikompresi.
+melakukan kompresi file maupun folder menggunakan codec yang dipilih
+pengguna (gzip, bz2, lzma, zlib, atau gzip-seekable yang dapat
+dibaca acak) dari CodecRegistry.
+Folder dikemas ke dalam format TAR yang langsung dialirkan ke
+kompresor dalam satu kali jalan, atau disimpan ke dedup store
+berbasis chunk sehingga data duplikat hanya disimpan sekali.
+Mesin kompresi berada di Helper.compressCore sehingga dapat
+dipakai juga tanpa GUI melalui cli.py.
 """
 
 import customtkinter as ctk
 from tkinter import filedialog
-import gzip
-import tarfile
 import os
 import threading
 from Helper.logCreate import LogCreate
+from Helper.streamCompress import BLOCK_SIZE_CHOICES, DEFAULT_BLOCK_SIZE
+from Helper.parallelCompress import WORKER_CHOICES, parse_workers
+from Helper.compressCore import FOLDER_FORMATS, compress_source
+from Helper.jobQueue import JobQueue, format_summary, load_source_list
+from Helper.progressReporter import JobCancelled, POLL_INTERVAL_MS, ProgressReporter, format_progress
+from Helper.codecRegistry import CODECS, DEFAULT_CODEC, DEFAULT_PRESET, PRESET_NAMES
 
 
 class Compress(ctk.CTkFrame):
@@ -43,6 +52,17 @@ class Compress(ctk.CTkFrame):
         self.combo_switch = ctk.CTkComboBox(self, values=["File", "Folder"])
         self.combo_switch.grid(row=1, column=0, sticky="ew", padx=(0, 10), pady=5)
 
+        # FORMAT ARSIP FOLDER (TAR atau Indexed Archive)
+        ctk.CTkLabel(self, text="Folder Format", font=("Arial", 15, "bold")).grid(
+            row=0, column=1, sticky="w", pady=(0, 5)
+        )
+        self.combo_format = ctk.CTkComboBox(
+            self,
+            values=FOLDER_FORMATS,
+            width=140
+        )
+        self.combo_format.grid(row=1, column=1, sticky="w", pady=5)
+
         # SOURCE INPUT
         ctk.CTkLabel(self, text="Source File", font=("Arial", 15, "bold")).grid(
             row=2, column=0, sticky="w", pady=(0, 5)
@@ -69,6 +89,91 @@ class Compress(ctk.CTkFrame):
             command=self.browse_output
         ).grid(row=5, column=1, sticky="w", pady=5)
 
+        # OPTIONS
+        ctk.CTkLabel(self, text="Options", font=("Arial", 15, "bold")).grid(
+            row=6, column=0, sticky="w", pady=(20, 5)
+        )
+        self.options_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.options_frame.grid(row=7, column=0, columnspan=2, sticky="ew", pady=5)
+
+        ctk.CTkLabel(self.options_frame, text="Block Size").pack(side="left", padx=(0, 5))
+        self.combo_block_size = ctk.CTkComboBox(
+            self.options_frame,
+            values=list(BLOCK_SIZE_CHOICES),
+            width=110
+        )
+        self.combo_block_size.set("1 MB")
+        self.combo_block_size.pack(side="left", padx=(0, 15))
+
+        ctk.CTkLabel(self.options_frame, text="Workers").pack(side="left", padx=(0, 5))
+        self.combo_workers = ctk.CTkComboBox(
+            self.options_frame,
+            values=WORKER_CHOICES,
+            width=90
+        )
+        self.combo_workers.set("Auto")
+        self.combo_workers.pack(side="left", padx=(0, 15))
+
+        ctk.CTkLabel(self.options_frame, text="Codec").pack(side="left", padx=(0, 5))
+        self.combo_codec = ctk.CTkComboBox(
+            self.options_frame,
+            values=list(CODECS),
+            width=130
+        )
+        self.combo_codec.set(DEFAULT_CODEC)
+        self.combo_codec.pack(side="left", padx=(0, 15))
+
+        ctk.CTkLabel(self.options_frame, text="Preset").pack(side="left", padx=(0, 5))
+        self.combo_preset = ctk.CTkComboBox(
+            self.options_frame,
+            values=PRESET_NAMES,
+            width=100
+        )
+        self.combo_preset.set(DEFAULT_PRESET)
+        self.combo_preset.pack(side="left", padx=(0, 15))
+
+        # Mode adaptif: level dipilih per file berdasarkan sampel isi
+        self.check_adaptive = ctk.CTkCheckBox(self.options_frame, text="Adaptive")
+        self.check_adaptive.pack(side="left")
+
+        # BATCH QUEUE
+        self.sources = []
+        self.progress = None
+        self.queue = None
+        self.batch_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.batch_frame.grid(row=8, column=0, columnspan=2, sticky="ew", pady=(15, 5))
+
+        ctk.CTkButton(
+            self.batch_frame,
+            text="Add Sources",
+            width=110,
+            command=self.add_sources
+        ).pack(side="left", padx=(0, 5))
+        ctk.CTkButton(
+            self.batch_frame,
+            text="Load List File",
+            width=110,
+            command=self.load_sources
+        ).pack(side="left", padx=5)
+        ctk.CTkButton(
+            self.batch_frame,
+            text="Clear",
+            width=70,
+            command=self.clear_sources
+        ).pack(side="left", padx=5)
+
+        ctk.CTkLabel(self.batch_frame, text="Jobs").pack(side="left", padx=(15, 5))
+        self.combo_jobs = ctk.CTkComboBox(
+            self.batch_frame,
+            values=WORKER_CHOICES,
+            width=90
+        )
+        self.combo_jobs.set("1")
+        self.combo_jobs.pack(side="left", padx=(0, 15))
+
+        self.label_queue = ctk.CTkLabel(self.batch_frame, text="Queue: 0 sources")
+        self.label_queue.pack(side="left")
+
         # Tombol utama untuk memulai proses kompresi
         ctk.CTkButton(
             self,
@@ -103,31 +208,181 @@ class Compress(ctk.CTkFrame):
             self.entry_output.delete(0, "end")
             self.entry_output.insert(0, path)
 
+    # BATCH SOURCES
+
+    def add_sources(self):
+        """
+        Menambahkan beberapa sumber ke antrian batch. Pada mode File
+        beberapa file dapat dipilih sekaligus, sedangkan pada mode
+        Folder satu folder ditambahkan setiap kali dialog dibuka.
+        """
+        if self.combo_switch.get() == "File":
+            paths = filedialog.askopenfilenames()
+        else:
+            paths = [filedialog.askdirectory()]
+
+        self.sources.extend(path for path in paths if path)
+        self.update_queue_label()
+
+    def load_sources(self):
+        """
+        Menambahkan sumber ke antrian batch dari file daftar
+        (satu path per baris).
+        """
+        path = filedialog.askopenfilename(
+            filetypes=[("Text", ".txt"), ("Semua File", "*.*")]
+        )
+        if path:
+            self.sources.extend(load_source_list(path))
+            self.update_queue_label()
+
+    def clear_sources(self):
+        """
+        Mengosongkan antrian batch.
+        """
+        self.sources = []
+        self.update_queue_label()
+
+    def update_queue_label(self):
+        """
+        Memperbarui label jumlah sumber di dalam antrian batch.
+        """
+        self.label_queue.configure(text=f"Queue: {len(self.sources)} sources")
+
     # POPUP WINDOWS
 
+    def show_job_window(self):
+        """
+        Menampilkan jendela status antrian batch yang berisi
+        status setiap job dan ringkasan throughput di akhir proses.
+        """
+        self.popup = ctk.CTkToplevel(self)
+        self.popup.title("Batch Compression")
+        self.popup.geometry("700x400")
+        self.popup.grid_rowconfigure(0, weight=1)
+        self.popup.grid_columnconfigure(0, weight=1)
+
+        self.job_text = ctk.CTkTextbox(self.popup, wrap="none", font=("Consolas", 12))
+        self.job_text.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+
+        self.progress_bar = ctk.CTkProgressBar(self.popup)
+        self.progress_bar.set(0)
+        self.progress_bar.grid(row=1, column=0, sticky="ew", padx=10)
+
+        self.job_summary = ctk.CTkLabel(self.popup, text="Running...", font=("Arial", 14))
+        self.job_summary.grid(row=2, column=0, pady=(5, 10))
+        self.progress_label = self.job_summary
+
+        self.cancel_button = ctk.CTkButton(self.popup, text="Cancel", command=self.cancel_job)
+        self.cancel_button.grid(row=3, column=0, pady=(0, 10))
+
+        # Menutup jendela saat antrian berjalan berarti membatalkan antrian
+        self.popup.protocol("WM_DELETE_WINDOW", self.cancel_job)
+
+    def refresh_job_window(self, text):
+        """
+        Mengganti isi textbox status job dengan teks terbaru.
+        """
+        self.job_text.configure(state="normal")
+        self.job_text.delete("1.0", "end")
+        self.job_text.insert("1.0", text)
+        self.job_text.configure(state="disabled")
+
+    def finish_job_window(self, text, summary):
+        """
+        Menampilkan ringkasan akhir antrian dan mengizinkan
+        jendela status ditutup.
+        """
+        self.progress = None
+        self.queue = None
+        self.cancel_button.destroy()
+        self.refresh_job_window(text)
+        self.progress_bar.set(1)
+        self.job_summary.configure(text=summary)
+        self.popup.protocol("WM_DELETE_WINDOW", self.popup.destroy)
+        ctk.CTkButton(self.popup, text="OK", command=self.popup.destroy).grid(
+            row=3, column=0, pady=(0, 10)
+        )
+
     def show_wait_popup(self):
         """
         Menampilkan popup informasi bahwa proses kompresi sedang berjalan.
-        Popup ini bersifat non-interaktif untuk mencegah gangguan proses.
+        Satu-satunya interaksi adalah tombol Cancel untuk membatalkan proses.
         """
         self.popup = ctk.CTkToplevel(self)
         self.popup.title("Please Wait")
-        self.popup.geometry("300x120")
+        self.popup.geometry("340x220")
         self.popup.resizable(False, False)
 
         ctk.CTkLabel(
             self.popup,
             text="Compressing...\nPlease wait.",
             font=("Arial", 16)
-        ).pack(pady=20)
+        ).pack(pady=(20, 10))
+
+        # Progres, kecepatan, dan ETA diperbarui oleh poll_progress
+        self.progress_bar = ctk.CTkProgressBar(self.popup)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(fill="x", padx=20)
+
+        self.progress_label = ctk.CTkLabel(self.popup, text="", font=("Arial", 12))
+        self.progress_label.pack(pady=5)
+
+        self.cancel_button = ctk.CTkButton(self.popup, text="Cancel", command=self.cancel_job)
+        self.cancel_button.pack(pady=(5, 10))
+
+        # Menutup popup saat proses berjalan berarti membatalkan proses
+        self.popup.protocol("WM_DELETE_WINDOW", self.cancel_job)
+
+    def poll_progress(self):
+        """
+        Membaca progres terbaru dari ProgressReporter lalu memperbarui
+        progress bar dan label. Dijadwalkan ulang setiap
+        POLL_INTERVAL_MS selama proses masih berjalan.
+        """
+        if self.progress is None or not self.popup.winfo_exists():
+            return
 
-        # Mencegah popup ditutup saat proses berjalan
-        self.popup.protocol("WM_DELETE_WINDOW", lambda: None)
+        snapshot = self.progress.poll()
+        self.progress_bar.set(snapshot["fraction"])
+        self.progress_label.configure(text=format_progress(snapshot))
+        self.after(POLL_INTERVAL_MS, self.poll_progress)
+
+    def cancel_job(self):
+        """
+        Meminta proses yang sedang berjalan berhenti. Pembatalan bersifat
+        kooperatif: mesin kompresi berhenti pada laporan progres
+        berikutnya, dan job batch yang belum berjalan tidak dijalankan.
+        File besar yang sedang dikompresi dapat dilanjutkan dari
+        checkpoint terakhir dengan menjalankan kompresi yang sama lagi.
+        """
+        if self.progress is not None:
+            self.progress.cancel()
+        if self.queue is not None:
+            self.queue.cancel()
+
+        self.cancel_button.configure(text="Cancelling...", state="disabled")
+
+    def show_cancelled_popup(self):
+        """
+        Menampilkan popup ketika proses kompresi dibatalkan pengguna.
+        """
+        self.progress = None
+        if hasattr(self, "popup"):
+            self.popup.destroy()
+
+        cancelled = ctk.CTkToplevel(self)
+        cancelled.title("Cancelled")
+        cancelled.geometry("300x140")
+
+        ctk.CTkLabel(cancelled, text="Compression cancelled.\nRun it again to resume large files.", font=("Arial", 14)).pack(pady=20)
+        ctk.CTkButton(cancelled, text="OK", command=cancelled.destroy).pack(pady=10)
 
     def show_finish_popup(self):
         """
         Menampilkan popup ketika proses kompresi berhasil diselesaikan.
         """
+        self.progress = None
         if hasattr(self, "popup"):
             self.popup.destroy()
 
@@ -143,6 +398,7 @@ class Compress(ctk.CTkFrame):
         Menampilkan popup kesalahan apabila terjadi error
         selama proses kompresi.
         """
+        self.progress = None
         if hasattr(self, "popup"):
             self.popup.destroy()
 
@@ -154,62 +410,22 @@ class Compress(ctk.CTkFrame):
         ctk.CTkLabel(err, text=error, wraplength=250).pack(pady=10)
         ctk.CTkButton(err, text="OK", command=err.destroy).pack(pady=10)
 
-    # MAIN COMPRESSION LOGIC
-
-    def compress_file(self, source, output):
-        """
-        Mengompresi satu file menggunakan algoritma gzip.
-
-        File hasil kompresi akan disimpan dalam format .gz
-        pada folder output yang ditentukan.
-        """
-        filename = os.path.basename(source)
-        dest = os.path.join(output, filename + ".gz")
-
-        LogCreate("CompressModule", f"Compressing file: {source} → {dest}")
-
-        # Membaca file sumber dan menuliskannya ke file gzip
-        with gzip.open(dest, "wb", compresslevel=9) as gz_out:
-            with open(source, "rb") as src:
-                gz_out.write(src.read())
-
-        LogCreate("CompressModule", f"File compression completed: {dest}")
+    # THREAD PROCESS
 
-    def compress_folder(self, source, output):
+    def read_options(self):
         """
-        Mengompresi folder dengan dua tahap, yaitu:
-        1. Mengarsipkan folder ke format TAR
-        2. Mengompresi hasil TAR ke format GZ
-
-        Pendekatan ini digunakan untuk menjaga struktur folder.
+        Membaca pilihan kompresi dari GUI dan mengembalikannya
+        dalam bentuk dict yang dapat diteruskan ke compress_source.
         """
-        folder_name = os.path.basename(source)
-        tar_path = os.path.join(output, folder_name + ".tar")
-        gz_path = tar_path + ".gz"
-
-        LogCreate("CompressModule", f"Creating TAR archive: {tar_path}")
-
-        # Tahap pertama: membuat arsip TAR
-        with tarfile.open(tar_path, "w") as tar:
-            tar.add(source, arcname=folder_name)
-
-        LogCreate("CompressModule", f"TAR created. Compressing to GZ: {gz_path}")
-
-        # Tahap kedua: mengompresi TAR menjadi GZ
-        with open(tar_path, "rb") as tar_file:
-            with gzip.open(gz_path, "wb", compresslevel=9) as gz_out:
-                gz_out.write(tar_file.read())
-
-        # Menghapus file TAR sementara
-        os.remove(tar_path)
-
-        LogCreate(
-            "CompressModule",
-            f"Folder compression completed: {gz_path}",
-            level="SUCCESS"
-        )
-
-    # THREAD PROCESS
+        return {
+            "block_size": BLOCK_SIZE_CHOICES.get(
+                self.combo_block_size.get(), DEFAULT_BLOCK_SIZE
+            ),
+            "workers": parse_workers(self.combo_workers.get()),
+            "codec": self.combo_codec.get(),
+            "preset": self.combo_preset.get(),
+            "adaptive": bool(self.check_adaptive.get()),
+        }
 
     def compress_process(self):
         """
@@ -221,17 +437,17 @@ class Compress(ctk.CTkFrame):
         source = self.entry_source.get()
         output = self.entry_output.get()
         mode = self.combo_switch.get()
+        archive_format = self.combo_format.get()
 
         LogCreate(
             "CompressModule",
-            f"Compression started. Mode={mode}, Source={source}, Output={output}"
+            f"Compression started. Mode={mode}, Format={archive_format}, "
+            f"Source={source}, Output={output}"
         )
 
         try:
-            if mode == "File":
-                self.compress_file(source, output)
-            else:
-                self.compress_folder(source, output)
+            options = self.read_options()
+            compress_source(source, output, mode, archive_format, options, self.progress)
 
             LogCreate(
                 "CompressModule",
@@ -241,14 +457,79 @@ class Compress(ctk.CTkFrame):
 
             self.after(0, self.show_finish_popup)
 
+        except JobCancelled:
+            LogCreate("CompressModule", "Compression cancelled by user")
+            self.after(0, self.show_cancelled_popup)
+
+        except Exception as e:
+            LogCreate("CompressModule", f"Error: {str(e)}", level="ERROR")
+            self.after(0, lambda: self.show_error_popup(str(e)))
+
+    def batch_process(self, sources):
+        """
+        Menjalankan kompresi untuk banyak sumber menggunakan JobQueue.
+
+        Mode File/Folder ditentukan otomatis untuk setiap sumber,
+        dan status setiap job ditampilkan pada jendela batch.
+        """
+        output = self.entry_output.get()
+        archive_format = self.combo_format.get()
+
+        try:
+            options = self.read_options()
+            job_workers = parse_workers(self.combo_jobs.get())
         except Exception as e:
             LogCreate("CompressModule", f"Error: {str(e)}", level="ERROR")
             self.after(0, lambda: self.show_error_popup(str(e)))
+            return
+
+        LogCreate(
+            "CompressModule",
+            f"Batch compression started. Jobs={len(sources)}, "
+            f"Job workers={job_workers}, Output={output}"
+        )
+
+        progress = self.progress
+        queue = JobQueue(workers=job_workers)
+        self.queue = queue
+        queue.on_update = lambda job: self.after(
+            0, self.refresh_job_window, queue.status_text()
+        )
+
+        for source in sources:
+            mode = "Folder" if os.path.isdir(source) else "File"
+            queue.add(
+                source,
+                lambda src, mode=mode: compress_source(
+                    src, output, mode, archive_format, options, progress
+                )
+            )
+
+        summary = format_summary(queue.run())
+
+        for job in queue.jobs:
+            if job.error:
+                LogCreate("CompressModule", f"Job failed: {job.source}: {job.error}", level="ERROR")
+
+        LogCreate("CompressModule", f"Batch compression finished: {summary}", level="SUCCESS")
+        self.after(0, lambda: self.finish_job_window(queue.status_text(), summary))
 
     def start_compression(self):
         """
         Memulai proses kompresi dengan menjalankan thread baru
         untuk mencegah GUI menjadi tidak responsif.
+
+        Jika antrian batch berisi sumber, seluruh sumber diproses
+        melalui JobQueue; jika tidak, sumber tunggal yang diproses.
+        Progres dibaca berkala oleh poll_progress selama proses berjalan.
         """
-        self.show_wait_popup()
-        threading.Thread(target=self.compress_process).start()
+        self.progress = ProgressReporter(label="Compressing")
+
+        if self.sources:
+            self.show_job_window()
+            threading.Thread(target=self.batch_process, args=(list(self.sources),)).start()
+        else:
+            self.show_wait_popup()
+            threading.Thread(target=self.compress_process).start()
+
+        self.poll_progress()
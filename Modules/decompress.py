@@ -1,20 +1,32 @@
 """
 Modul Decompress.
 
-Modul ini menangani proses dekompresi file menggunakan modul gzip.
-Mendukung dekompresi file tunggal (.gz) maupun arsip folder (.tar.gz)
-yang sebelumnya dikompresi oleh modul Compress.
+Modul ini menyediakan GUI untuk proses dekompresi file menggunakan
+codec dari CodecRegistry yang dipilih berdasarkan ekstensi file.
+Mendukung dekompresi file tunggal (.gz, .bz2, .xz, .zz) maupun arsip
+folder (.tar.gz, .tar.bz2, .tar.xz, .tar.zz) yang sebelumnya
+dikompresi oleh modul Compress, termasuk Indexed Archive (.iarc)
+yang dapat dilihat isinya seketika dan diekstrak secara paralel,
+daftar isi dan ekstraksi member terpilih dari arsip TAR melalui
+indeks member yang di-cache di samping arsip, verifikasi keutuhan
+arsip tanpa menulis ke disk, serta pemulihan arsip inkremental dari file manifest dan pemulihan
+snapshot dedup store dari file .snapshot.json.
+Mesin dekompresi berada di Helper.decompressCore sehingga dapat
+dipakai juga tanpa GUI melalui cli.py.
 """
 
 import customtkinter as ctk
 from tkinter import filedialog
-import gzip
-import tarfile
 import os
 import threading
 
 # Import modul logging aplikasi
 from Helper.logCreate import LogCreate
+from Helper.parallelCompress import WORKER_CHOICES, parse_workers
+from Helper.decompressCore import decompress_source, extract_selected, list_contents, verify_source
+from Helper.jobQueue import JobQueue, format_summary, load_source_list
+from Helper.streamCompress import BLOCK_SIZE_CHOICES, DEFAULT_BLOCK_SIZE
+from Helper.progressReporter import JobCancelled, POLL_INTERVAL_MS, ProgressReporter, format_progress
 
 
 class Decompress(ctk.CTkFrame):
@@ -63,20 +75,104 @@ class Decompress(ctk.CTkFrame):
             command=self.browse_output
         ).grid(row=5, column=1, sticky="w", pady=5)
 
+        # OPTIONS
+        ctk.CTkLabel(self, text="Options", font=("Arial", 15, "bold")).grid(
+            row=6, column=0, sticky="w", pady=(20, 5)
+        )
+        self.options_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.options_frame.grid(row=7, column=0, columnspan=2, sticky="ew", pady=5)
+
+        ctk.CTkLabel(self.options_frame, text="Workers").pack(side="left", padx=(0, 5))
+        self.combo_workers = ctk.CTkComboBox(
+            self.options_frame,
+            values=WORKER_CHOICES,
+            width=90
+        )
+        self.combo_workers.set("Auto")
+        self.combo_workers.pack(side="left", padx=(0, 15))
+
+        # Ukuran buffer dekompresi file tunggal dan arsip TAR
+        ctk.CTkLabel(self.options_frame, text="Chunk Size").pack(side="left", padx=(0, 5))
+        self.combo_chunk_size = ctk.CTkComboBox(
+            self.options_frame,
+            values=list(BLOCK_SIZE_CHOICES),
+            width=110
+        )
+        self.combo_chunk_size.set("1 MB")
+        self.combo_chunk_size.pack(side="left", padx=(0, 15))
+
+        # BATCH QUEUE
+        self.sources = []
+        self.progress = None
+        self.queue = None
+        self.batch_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.batch_frame.grid(row=8, column=0, columnspan=2, sticky="ew", pady=(15, 5))
+
+        ctk.CTkButton(
+            self.batch_frame,
+            text="Add Sources",
+            width=110,
+            command=self.add_sources
+        ).pack(side="left", padx=(0, 5))
+        ctk.CTkButton(
+            self.batch_frame,
+            text="Load List File",
+            width=110,
+            command=self.load_sources
+        ).pack(side="left", padx=5)
+        ctk.CTkButton(
+            self.batch_frame,
+            text="Clear",
+            width=70,
+            command=self.clear_sources
+        ).pack(side="left", padx=5)
+
+        ctk.CTkLabel(self.batch_frame, text="Jobs").pack(side="left", padx=(15, 5))
+        self.combo_jobs = ctk.CTkComboBox(
+            self.batch_frame,
+            values=WORKER_CHOICES,
+            width=90
+        )
+        self.combo_jobs.set("1")
+        self.combo_jobs.pack(side="left", padx=(0, 15))
+
+        self.label_queue = ctk.CTkLabel(self.batch_frame, text="Queue: 0 sources")
+        self.label_queue.pack(side="left")
+
+        # ACTION BUTTONS
+        self.action_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.action_frame.grid(row=10, column=0, columnspan=2, pady=40)
+
         # Tombol untuk memulai proses dekompresi
         ctk.CTkButton(
-            self,
+            self.action_frame,
             text="Start Decompression",
             width=160,
             command=self.start_decompression
-        ).grid(row=10, column=0, columnspan=2, pady=40)
+        ).pack(side="left", padx=10)
+
+        # Tombol untuk melihat daftar isi arsip
+        ctk.CTkButton(
+            self.action_frame,
+            text="List Contents",
+            width=160,
+            command=self.list_contents
+        ).pack(side="left", padx=10)
+
+        # Tombol untuk memeriksa keutuhan arsip tanpa mengekstrak
+        ctk.CTkButton(
+            self.action_frame,
+            text="Verify",
+            width=160,
+            command=self.start_verification
+        ).pack(side="left", padx=10)
 
     # BROWSE METHODS
 
     def browse_source(self):
         """
-        Membuka dialog pemilihan file terkompresi (.gz atau .tar.gz)
-        yang akan didekompresi.
+        Membuka dialog pemilihan file terkompresi (contoh: .gz atau
+        .tar.gz) yang akan didekompresi.
         """
         path = filedialog.askopenfilename()
         if path:
@@ -92,32 +188,174 @@ class Decompress(ctk.CTkFrame):
             self.entry_output.delete(0, "end")
             self.entry_output.insert(0, path)
 
+    # BATCH SOURCES
+
+    def add_sources(self):
+        """
+        Menambahkan beberapa file terkompresi sekaligus ke antrian batch.
+        """
+        paths = filedialog.askopenfilenames()
+        self.sources.extend(path for path in paths if path)
+        self.update_queue_label()
+
+    def load_sources(self):
+        """
+        Menambahkan sumber ke antrian batch dari file daftar
+        (satu path per baris).
+        """
+        path = filedialog.askopenfilename(
+            filetypes=[("Text", ".txt"), ("Semua File", "*.*")]
+        )
+        if path:
+            self.sources.extend(load_source_list(path))
+            self.update_queue_label()
+
+    def clear_sources(self):
+        """
+        Mengosongkan antrian batch.
+        """
+        self.sources = []
+        self.update_queue_label()
+
+    def update_queue_label(self):
+        """
+        Memperbarui label jumlah sumber di dalam antrian batch.
+        """
+        self.label_queue.configure(text=f"Queue: {len(self.sources)} sources")
+
     # NOTIFICATION METHOD
 
-    def show_wait_popup(self):
+    def show_job_window(self):
+        """
+        Menampilkan jendela status antrian batch yang berisi
+        status setiap job dan ringkasan throughput di akhir proses.
+        """
+        self.popup = ctk.CTkToplevel(self)
+        self.popup.title("Batch Decompression")
+        self.popup.geometry("700x400")
+        self.popup.grid_rowconfigure(0, weight=1)
+        self.popup.grid_columnconfigure(0, weight=1)
+
+        self.job_text = ctk.CTkTextbox(self.popup, wrap="none", font=("Consolas", 12))
+        self.job_text.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+
+        self.progress_bar = ctk.CTkProgressBar(self.popup)
+        self.progress_bar.set(0)
+        self.progress_bar.grid(row=1, column=0, sticky="ew", padx=10)
+
+        self.job_summary = ctk.CTkLabel(self.popup, text="Running...", font=("Arial", 14))
+        self.job_summary.grid(row=2, column=0, pady=(5, 10))
+        self.progress_label = self.job_summary
+
+        self.cancel_button = ctk.CTkButton(self.popup, text="Cancel", command=self.cancel_job)
+        self.cancel_button.grid(row=3, column=0, pady=(0, 10))
+
+        # Menutup jendela saat antrian berjalan berarti membatalkan antrian
+        self.popup.protocol("WM_DELETE_WINDOW", self.cancel_job)
+
+    def refresh_job_window(self, text):
+        """
+        Mengganti isi textbox status job dengan teks terbaru.
+        """
+        self.job_text.configure(state="normal")
+        self.job_text.delete("1.0", "end")
+        self.job_text.insert("1.0", text)
+        self.job_text.configure(state="disabled")
+
+    def finish_job_window(self, text, summary):
+        """
+        Menampilkan ringkasan akhir antrian dan mengizinkan
+        jendela status ditutup.
+        """
+        self.progress = None
+        self.queue = None
+        self.cancel_button.destroy()
+        self.refresh_job_window(text)
+        self.progress_bar.set(1)
+        self.job_summary.configure(text=summary)
+        self.popup.protocol("WM_DELETE_WINDOW", self.popup.destroy)
+        ctk.CTkButton(self.popup, text="OK", command=self.popup.destroy).grid(
+            row=3, column=0, pady=(0, 10)
+        )
+
+    def show_wait_popup(self, message="Decompressing...\nPlease wait."):
         """
         Menampilkan popup informasi bahwa proses dekompresi
-        sedang berlangsung dan mencegah interaksi pengguna.
+        sedang berlangsung beserta tombol Cancel untuk membatalkannya.
         """
         self.popup = ctk.CTkToplevel(self)
         self.popup.title("Please Wait")
-        self.popup.geometry("300x120")
+        self.popup.geometry("340x220")
         self.popup.resizable(False, False)
 
         ctk.CTkLabel(
             self.popup,
-            text="Decompressing...\nPlease wait.",
+            text=message,
             font=("Arial", 16)
-        ).pack(pady=20)
+        ).pack(pady=(20, 10))
+
+        # Progres, kecepatan, dan ETA diperbarui oleh poll_progress
+        self.progress_bar = ctk.CTkProgressBar(self.popup)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(fill="x", padx=20)
+
+        self.progress_label = ctk.CTkLabel(self.popup, text="", font=("Arial", 12))
+        self.progress_label.pack(pady=5)
+
+        self.cancel_button = ctk.CTkButton(self.popup, text="Cancel", command=self.cancel_job)
+        self.cancel_button.pack(pady=(5, 10))
+
+        # Menutup popup saat proses berjalan berarti membatalkan proses
+        self.popup.protocol("WM_DELETE_WINDOW", self.cancel_job)
 
-        # Mencegah popup ditutup selama proses berjalan
-        self.popup.protocol("WM_DELETE_WINDOW", lambda: None)
+    def poll_progress(self):
+        """
+        Membaca progres terbaru dari ProgressReporter lalu memperbarui
+        progress bar dan label. Dijadwalkan ulang setiap
+        POLL_INTERVAL_MS selama proses masih berjalan.
+        """
+        if self.progress is None or not self.popup.winfo_exists():
+            return
+
+        snapshot = self.progress.poll()
+        self.progress_bar.set(snapshot["fraction"])
+        self.progress_label.configure(text=format_progress(snapshot))
+        self.after(POLL_INTERVAL_MS, self.poll_progress)
 
-    def show_finish_popup(self):
+    def cancel_job(self):
+        """
+        Meminta proses yang sedang berjalan berhenti. Pembatalan bersifat
+        kooperatif: mesin dekompresi berhenti pada laporan progres
+        berikutnya, dan job batch yang belum berjalan tidak dijalankan.
+        """
+        if self.progress is not None:
+            self.progress.cancel()
+        if self.queue is not None:
+            self.queue.cancel()
+
+        self.cancel_button.configure(text="Cancelling...", state="disabled")
+
+    def show_cancelled_popup(self):
+        """
+        Menampilkan popup ketika proses dekompresi dibatalkan pengguna.
+        """
+        self.progress = None
+        if hasattr(self, "popup"):
+            self.popup.destroy()
+
+        cancelled = ctk.CTkToplevel(self)
+        cancelled.title("Cancelled")
+        cancelled.geometry("300x140")
+
+        ctk.CTkLabel(cancelled, text="Decompression cancelled.", font=("Arial", 14)).pack(pady=20)
+        ctk.CTkButton(cancelled, text="OK", command=cancelled.destroy).pack(pady=10)
+
+    def show_finish_popup(self, message="Decompression Finished!"):
         """
         Menampilkan popup ketika proses dekompresi
         berhasil diselesaikan.
         """
+        self.progress = None
         if hasattr(self, "popup"):
             self.popup.destroy()
 
@@ -125,7 +363,7 @@ class Decompress(ctk.CTkFrame):
         done.title("Finished")
         done.geometry("300x120")
 
-        ctk.CTkLabel(done, text="Decompression Finished!", font=("Arial", 16)).pack(pady=20)
+        ctk.CTkLabel(done, text=message, font=("Arial", 16)).pack(pady=20)
         ctk.CTkButton(done, text="OK", command=done.destroy).pack(pady=10)
 
     def show_error_popup(self, error):
@@ -133,6 +371,7 @@ class Decompress(ctk.CTkFrame):
         Menampilkan popup kesalahan apabila terjadi error
         selama proses dekompresi.
         """
+        self.progress = None
         if hasattr(self, "popup"):
             self.popup.destroy()
 
@@ -144,61 +383,129 @@ class Decompress(ctk.CTkFrame):
         ctk.CTkLabel(err, text=error, wraplength=250).pack(pady=10)
         ctk.CTkButton(err, text="OK", command=err.destroy).pack(pady=10)
 
-    # MAIN DECOMPRESSION LOGIC
-
-    def decompress_file(self, source, output):
+    def show_contents_window(self, title, content):
         """
-        Mendekompresi satu file berformat .gz
-        dan mengembalikannya ke bentuk file asli.
+        Menampilkan daftar isi arsip dalam jendela baru
+        menggunakan komponen textbox read-only, beserta kolom
+        pemilihan member untuk diekstrak.
         """
-        filename = os.path.basename(source)
-        dest = os.path.join(output, filename[:-3])
+        self.progress = None
+        if hasattr(self, "popup"):
+            self.popup.destroy()
 
-        LogCreate(
-            "DecompressModule",
-            f"Decompressing single file: {source} → {dest}"
-        )
+        viewer = ctk.CTkToplevel(self)
+        viewer.title(f"Contents - {os.path.basename(title)}")
+        viewer.geometry("700x450")
+        viewer.grid_rowconfigure(0, weight=1)
+        viewer.grid_columnconfigure(0, weight=1)
 
-        # Membaca isi file gzip dan menuliskannya ke file output
-        with gzip.open(source, "rb") as gz_in:
-            with open(dest, "wb") as dest_file:
-                dest_file.write(gz_in.read())
+        textbox = ctk.CTkTextbox(viewer, wrap="none", font=("Consolas", 12))
+        textbox.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
 
-        LogCreate(
-            "DecompressModule",
-            f"File decompression completed: {dest}",
-            level="SUCCESS"
+        textbox.insert("1.0", content)
+        textbox.configure(state="disabled")
+
+        # Nama member, pola glob, atau nama folder dipisah koma
+        select_frame = ctk.CTkFrame(viewer, fg_color="transparent")
+        select_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=(0, 10))
+        select_frame.grid_columnconfigure(0, weight=1)
+
+        entry_members = ctk.CTkEntry(
+            select_frame,
+            placeholder_text="Members to extract (e.g. data/report.txt, *.log)"
         )
+        entry_members.grid(row=0, column=0, sticky="ew", padx=(0, 10))
 
-    def decompress_folder(self, source, output):
+        ctk.CTkButton(
+            select_frame,
+            text="Extract Selected",
+            width=140,
+            command=lambda: self.start_extract_selected(title, entry_members.get())
+        ).grid(row=0, column=1)
+
+    # ARCHIVE LISTING
+
+    def list_contents(self):
         """
-        Mendekompresi arsip .tar.gz dan mengekstraknya
-        menjadi folder pada direktori tujuan.
+        Menampilkan daftar isi arsip yang dipilih.
+
+        Indexed Archive dibaca langsung dari indeks pusat di akhir
+        file. Arsip TAR dibaca sekali untuk membangun indeks member
+        yang di-cache di samping arsip, sehingga daftar isi berikutnya
+        tampil seketika. Proses berjalan pada thread terpisah.
         """
-        folder_name = os.path.basename(source)
-        tar_path = os.path.join(output, folder_name[:-7])
+        source = self.entry_source.get()
 
-        LogCreate(
-            "DecompressModule",
-            f"Extracting TAR.GZ: {source} → {tar_path}"
-        )
+        self.progress = ProgressReporter(label="Indexing")
+        self.show_wait_popup("Reading archive...\nPlease wait.")
+        threading.Thread(target=self.list_process, args=(source,)).start()
+        self.poll_progress()
+
+    def list_process(self, source):
+        """
+        Membaca daftar isi arsip pada thread terpisah.
+        """
+        try:
+            lines = list_contents(source, progress=self.progress)
+            self.after(0, lambda: self.show_contents_window(source, "\n".join(lines)))
+
+        except JobCancelled:
+            LogCreate("DecompressModule", "Archive listing cancelled by user")
+            self.after(0, self.show_cancelled_popup)
+
+        except Exception as e:
+            LogCreate("DecompressModule", f"Error: {str(e)}", level="ERROR")
+            self.after(0, lambda: self.show_error_popup(str(e)))
 
-        # Mengekstrak arsip TAR.GZ ke folder tujuan
-        with tarfile.open(source, "r:gz") as tar:
-            tar.extractall(path=tar_path)
+    def start_extract_selected(self, source, selection):
+        """
+        Memulai ekstraksi member terpilih pada thread terpisah.
+        """
+        patterns = [pattern.strip() for pattern in selection.split(",") if pattern.strip()]
+        if not patterns:
+            self.show_error_popup("Enter at least one member name or pattern")
+            return
+
+        self.progress = ProgressReporter(label="Extracting")
+        self.show_wait_popup("Extracting...\nPlease wait.")
+        threading.Thread(target=self.extract_selected_process, args=(source, patterns)).start()
+        self.poll_progress()
+
+    def extract_selected_process(self, source, patterns):
+        """
+        Mengekstrak member arsip yang cocok dengan patterns
+        ke folder output.
+        """
+        output = self.entry_output.get()
 
         LogCreate(
             "DecompressModule",
-            f"Folder extracted successfully: {tar_path}",
-            level="SUCCESS"
+            f"Selective extraction started. Source={source}, Members={', '.join(patterns)}, Output={output}"
         )
 
+        try:
+            workers = parse_workers(self.combo_workers.get())
+            chunk_size = BLOCK_SIZE_CHOICES.get(self.combo_chunk_size.get(), DEFAULT_BLOCK_SIZE)
+            extract_selected(
+                source, output, patterns, workers=workers, progress=self.progress, chunk_size=chunk_size
+            )
+
+            self.after(0, self.show_finish_popup)
+
+        except JobCancelled:
+            LogCreate("DecompressModule", "Selective extraction cancelled by user")
+            self.after(0, self.show_cancelled_popup)
+
+        except Exception as e:
+            LogCreate("DecompressModule", f"Error: {str(e)}", level="ERROR")
+            self.after(0, lambda: self.show_error_popup(str(e)))
+
     # THREAD PROCESS
 
     def decompress_process(self):
         """
-        Menentukan jenis file terkompresi dan menjalankan
-        proses dekompresi yang sesuai pada thread terpisah.
+        Menjalankan proses dekompresi sumber tunggal
+        pada thread terpisah.
         """
         source = self.entry_source.get()
         output = self.entry_output.get()
@@ -209,12 +516,11 @@ class Decompress(ctk.CTkFrame):
         )
 
         try:
-            if source.endswith(".tar.gz"):
-                LogCreate("DecompressModule", "Mode: TAR.GZ Folder Decompression")
-                self.decompress_folder(source, output)
-            else:
-                LogCreate("DecompressModule", "Mode: Single .GZ File Decompression")
-                self.decompress_file(source, output)
+            workers = parse_workers(self.combo_workers.get())
+            chunk_size = BLOCK_SIZE_CHOICES.get(self.combo_chunk_size.get(), DEFAULT_BLOCK_SIZE)
+            decompress_source(
+                source, output, workers=workers, progress=self.progress, chunk_size=chunk_size
+            )
 
             LogCreate(
                 "DecompressModule",
@@ -224,14 +530,128 @@ class Decompress(ctk.CTkFrame):
 
             self.after(0, self.show_finish_popup)
 
+        except JobCancelled:
+            LogCreate("DecompressModule", "Decompression cancelled by user")
+            self.after(0, self.show_cancelled_popup)
+
+        except Exception as e:
+            LogCreate("DecompressModule", f"Error: {str(e)}", level="ERROR")
+            self.after(0, lambda: self.show_error_popup(str(e)))
+
+    def verify_process(self):
+        """
+        Memeriksa keutuhan arsip sumber tunggal pada thread terpisah
+        tanpa menulis hasil dekompresi ke disk.
+        """
+        source = self.entry_source.get()
+
+        LogCreate("DecompressModule", f"Verification started. Source={source}")
+
+        try:
+            workers = parse_workers(self.combo_workers.get())
+            chunk_size = BLOCK_SIZE_CHOICES.get(self.combo_chunk_size.get(), DEFAULT_BLOCK_SIZE)
+            result = verify_source(source, workers=workers, progress=self.progress, chunk_size=chunk_size)
+
+            self.after(0, lambda: self.show_finish_popup(f"Archive OK ({result['entries']} entries)"))
+
+        except JobCancelled:
+            LogCreate("DecompressModule", "Verification cancelled by user")
+            self.after(0, self.show_cancelled_popup)
+
+        except Exception as e:
+            LogCreate("DecompressModule", f"Error: {str(e)}", level="ERROR")
+            self.after(0, lambda: self.show_error_popup(str(e)))
+
+    def batch_process(self, sources, verify=False):
+        """
+        Menjalankan dekompresi (atau verifikasi jika verify bernilai
+        True) untuk banyak sumber menggunakan JobQueue dan menampilkan
+        status setiap job pada jendela batch.
+        """
+        output = self.entry_output.get()
+
+        try:
+            workers = parse_workers(self.combo_workers.get())
+            job_workers = parse_workers(self.combo_jobs.get())
+            chunk_size = BLOCK_SIZE_CHOICES.get(self.combo_chunk_size.get(), DEFAULT_BLOCK_SIZE)
         except Exception as e:
             LogCreate("DecompressModule", f"Error: {str(e)}", level="ERROR")
             self.after(0, lambda: self.show_error_popup(str(e)))
+            return
+
+        action = "verification" if verify else "decompression"
+        LogCreate(
+            "DecompressModule",
+            f"Batch {action} started. Jobs={len(sources)}, "
+            f"Job workers={job_workers}, Output={output}"
+        )
+
+        progress = self.progress
+        queue = JobQueue(workers=job_workers)
+        self.queue = queue
+        queue.on_update = lambda job: self.after(
+            0, self.refresh_job_window, queue.status_text()
+        )
+
+        for source in sources:
+            if verify:
+                queue.add(
+                    source,
+                    lambda src: verify_source(
+                        src, workers=workers, progress=progress, chunk_size=chunk_size
+                    )["entries"]
+                )
+                continue
+
+            queue.add(
+                source,
+                lambda src: decompress_source(
+                    src, output, workers=workers, progress=progress, chunk_size=chunk_size
+                )
+            )
+
+        summary = format_summary(queue.run())
+
+        for job in queue.jobs:
+            if job.error:
+                LogCreate("DecompressModule", f"Job failed: {job.source}: {job.error}", level="ERROR")
+
+        LogCreate("DecompressModule", f"Batch {action} finished: {summary}", level="SUCCESS")
+        self.after(0, lambda: self.finish_job_window(queue.status_text(), summary))
 
     def start_decompression(self):
         """
         Memulai proses dekompresi dengan menjalankan
         thread baru agar antarmuka tetap responsif.
+
+        Jika antrian batch berisi sumber, seluruh sumber diproses
+        melalui JobQueue; jika tidak, sumber tunggal yang diproses.
+        Progres dibaca berkala oleh poll_progress selama proses berjalan.
         """
-        self.show_wait_popup()
-        threading.Thread(target=self.decompress_process).start()
+        self.progress = ProgressReporter(label="Decompressing")
+
+        if self.sources:
+            self.show_job_window()
+            threading.Thread(target=self.batch_process, args=(list(self.sources),)).start()
+        else:
+            self.show_wait_popup()
+            threading.Thread(target=self.decompress_process).start()
+
+        self.poll_progress()
+
+    def start_verification(self):
+        """
+        Memulai verifikasi arsip pada thread baru. Sama seperti
+        dekompresi, seluruh sumber di antrian batch diverifikasi
+        melalui JobQueue sehingga beberapa arsip diperiksa bersamaan.
+        """
+        self.progress = ProgressReporter(label="Verifying")
+
+        if self.sources:
+            self.show_job_window()
+            threading.Thread(target=self.batch_process, args=(list(self.sources), True)).start()
+        else:
+            self.show_wait_popup("Verifying...\nPlease wait.")
+            threading.Thread(target=self.verify_process).start()
+
+        self.poll_progress()
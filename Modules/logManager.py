@@ -2,19 +2,26 @@
 Modul LogManager.
 
 Modul ini menyediakan fitur untuk melihat file log aplikasi
-dalam format .log maupun .gz, serta melakukan kompresi otomatis
-terhadap file log secara periodik menggunakan modul gzip.
+dalam format .log maupun terkompresi (.gz, .bz2, .xz, .zz), serta
+melakukan kompresi otomatis terhadap file log secara periodik
+menggunakan codec dari CodecRegistry.
+Penampil log hanya membaca bagian awal file (VIEW_LIMIT) melalui
+dekompresi streaming, sehingga file log berukuran sangat besar tidak
+dimuat seluruhnya ke memori.
 """
 
 import customtkinter as ctk
 from pathlib import Path
-import gzip
 import os
+import shutil
 import threading
 import time
 import traceback
 from datetime import datetime
 
+from Helper.codecRegistry import DEFAULT_CODEC, DEFAULT_PRESET, codec_for_path, get_codec
+from Helper.decompressCore import VIEW_LIMIT, read_head
+
 
 class LogManager(ctk.CTkFrame):
     """
@@ -31,6 +38,9 @@ class LogManager(ctk.CTkFrame):
         super().__init__(parent)
         self.pack(fill="both", expand=True, padx=40, pady=40)
 
+        # Codec yang digunakan untuk kompresi otomatis file log
+        self.codec = get_codec(DEFAULT_CODEC)
+
         # Status kompresi otomatis
         self.compression_running = False
         self.compression_thread = None
@@ -94,7 +104,7 @@ class LogManager(ctk.CTkFrame):
     def viewLog(self):
         """
         Menampilkan isi file log yang dipilih pengguna.
-        Mendukung file log biasa (.log) dan terkompresi (.gz).
+        Mendukung file log biasa (.log) dan terkompresi (.gz, .bz2, dll).
         """
         selected_log = self.log_switch.get()
         if not selected_log:
@@ -105,7 +115,7 @@ class LogManager(ctk.CTkFrame):
 
             if ext == ".log":
                 content = self.read_log_file(selected_log)
-            elif ext == ".gz":
+            elif codec_for_path(selected_log) is not None:
                 content = self.read_gz_file(selected_log)
             else:
                 content = f"Unsupported file type: {ext}"
@@ -125,17 +135,27 @@ class LogManager(ctk.CTkFrame):
         Membaca isi file log teks (.log) dan
         mengembalikannya sebagai string.
         """
-        with open(path, "r", encoding="utf-8", errors="replace") as f:
-            return f.read()
+        return self.read_limited(path)
 
     def read_gz_file(self, path):
         """
-        Membaca dan mendekompresi file log berformat .gz
+        Membaca dan mendekompresi file log terkompresi (contoh: .gz)
         untuk ditampilkan dalam bentuk teks.
         """
-        with gzip.open(path, "rb") as gz_file:
-            raw_bytes = gz_file.read()
-            return raw_bytes.decode("utf-8", errors="replace")
+        return self.read_limited(path)
+
+    def read_limited(self, path):
+        """
+        Membaca paling banyak VIEW_LIMIT byte pertama file log
+        secara streaming. Jika file lebih besar, keterangan bahwa
+        isi log dipotong ditambahkan di akhir teks.
+        """
+        data, truncated = read_head(path, VIEW_LIMIT)
+        content = data.decode("utf-8", errors="replace")
+
+        if truncated:
+            content += f"\n\n... [truncated: showing first {VIEW_LIMIT // 1048576} MB]"
+        return content
 
     def open_log_viewer(self, title: str, content: str):
         """
@@ -198,7 +218,7 @@ class LogManager(ctk.CTkFrame):
         Menghapus file log terkompresi lama berdasarkan
         kebijakan retensi untuk membatasi jumlah file.
         """
-        compressed_logs = list(log_dir.glob("app-*.log.gz"))
+        compressed_logs = list(log_dir.glob(f"app-*.log{self.codec.extension}"))
         if len(compressed_logs) <= max_files:
             return
 
@@ -226,12 +246,12 @@ class LogManager(ctk.CTkFrame):
             try:
                 if log_path.exists():
                     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                    output_file = log_dir / f"app-{timestamp}.log.gz"
+                    output_file = log_dir / f"app-{timestamp}.log{self.codec.extension}"
 
                     # Mengompresi file log utama
-                    with open(log_path, "rb") as f_in:
-                        with gzip.open(output_file, "wb") as f_out:
-                            f_out.writelines(f_in)
+                    with open(log_path, "rb") as f_in, open(output_file, "wb") as raw_out:
+                        with self.codec.open_writer(raw_out, self.codec.level(DEFAULT_PRESET)) as f_out:
+                            shutil.copyfileobj(f_in, f_out)
 
                     # Menjaga jumlah file log terkompresi
                     self.cleanup_old_compressed_logs(log_dir, max_files=2)
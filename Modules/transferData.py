@@ -2,23 +2,31 @@
 Modul TransferData.
 
 Modul ini menangani proses pengiriman file ke server tujuan
-menggunakan socket TCP. File akan dikompresi terlebih dahulu
-menggunakan gzip jika belum dalam format .gz untuk efisiensi
-pengiriman data.
+menggunakan socket TCP. File akan dikompresi menggunakan codec
+default dari CodecRegistry (gzip) jika belum dalam format terkompresi
+untuk efisiensi pengiriman data. Secara default kompresi berjalan
+sambil mengirim (pipeline) tanpa file sementara; jika dimatikan, file
+dikompresi ke folder sementara lebih dulu lalu dihapus setelah dikirim.
+File berukuran besar dapat dikirim melalui beberapa koneksi paralel
+(pilihan Streams) yang masing-masing membawa satu rentang byte. Mode
+Resumable melanjutkan pengiriman yang terputus dari offset yang sudah
+diterima server dan mengirim ulang chunk yang rusak. Folder dikirim
+utuh (tanpa kompresi) melalui satu koneksi dengan protokol frame
+mode folder.
+Mesin pengiriman berada di Helper.transferCore sehingga dapat
+dipakai juga tanpa GUI melalui cli.py.
 """
 
 import customtkinter as ctk
 from tkinter import filedialog
 import Helper.configServer as cs
-import socket
 import os
-import gzip
-import shutil
-import tempfile
 import threading
 
 # Import modul logging aplikasi
 from Helper.logCreate import LogCreate
+from Helper.progressReporter import POLL_INTERVAL_MS, ProgressReporter, format_progress
+from Helper.transferCore import STREAM_CHOICES, transfer_sources
 
 
 class TransferData(ctk.CTkFrame):
@@ -83,11 +91,18 @@ class TransferData(ctk.CTkFrame):
             anchor="w"
         ).grid(row=6, column=0, sticky="w", pady=(20, 5))
 
-        self.entry_file = ctk.CTkEntry(self, placeholder_text="Select File")
+        self.entry_file = ctk.CTkEntry(self, placeholder_text="Select File or Folder")
         self.entry_file.grid(
-            row=7, column=0, columnspan=3, sticky="ew", padx=(0, 10), pady=5
+            row=7, column=0, columnspan=2, sticky="ew", padx=(0, 10), pady=5
         )
 
+        ctk.CTkButton(
+            self,
+            text="Browse Folder",
+            width=140,
+            command=self.search_folder
+        ).grid(row=7, column=2, sticky="ew", padx=(0, 10), pady=5)
+
         ctk.CTkButton(
             self,
             text="Browse File",
@@ -95,6 +110,29 @@ class TransferData(ctk.CTkFrame):
             command=self.search_file
         ).grid(row=7, column=3, sticky="ew", pady=5)
 
+        # OPTIONS
+        self.options_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.options_frame.grid(row=8, column=0, columnspan=4, sticky="ew", pady=(15, 0))
+
+        # Kompresi sambil mengirim tanpa file sementara
+        self.check_stream = ctk.CTkCheckBox(self.options_frame, text="Compress while sending (no temp file)")
+        self.check_stream.select()
+        self.check_stream.pack(side="left", padx=(0, 15))
+
+        # Pengiriman yang dapat dilanjutkan jika koneksi terputus
+        self.check_resume = ctk.CTkCheckBox(self.options_frame, text="Resumable")
+        self.check_resume.pack(side="left", padx=(0, 15))
+
+        # Jumlah koneksi paralel untuk satu file
+        ctk.CTkLabel(self.options_frame, text="Streams").pack(side="left", padx=(0, 5))
+        self.combo_streams = ctk.CTkComboBox(
+            self.options_frame,
+            values=STREAM_CHOICES,
+            width=80
+        )
+        self.combo_streams.set("1")
+        self.combo_streams.pack(side="left")
+
         # ACTION BUTTONS
         ctk.CTkButton(
             self,
@@ -121,6 +159,15 @@ class TransferData(ctk.CTkFrame):
             self.entry_file.delete(0, "end")
             self.entry_file.insert(0, path)
 
+    def search_folder(self):
+        """
+        Membuka dialog pemilihan folder yang akan dikirim ke server.
+        """
+        path = filedialog.askdirectory()
+        if path:
+            self.entry_file.delete(0, "end")
+            self.entry_file.insert(0, path)
+
     # NOTIFICATION WINDOWS
 
     def show_processing_window(self):
@@ -130,16 +177,39 @@ class TransferData(ctk.CTkFrame):
         """
         self.win_processing = ctk.CTkToplevel(self)
         self.win_processing.title("Processing")
-        self.win_processing.geometry("300x120")
+        self.win_processing.geometry("340x170")
         self.win_processing.resizable(False, False)
 
         ctk.CTkLabel(
             self.win_processing,
             text="Mengirim data...\nHarap tunggu...",
             font=("Arial", 14)
-        ).pack(pady=20)
+        ).pack(pady=(20, 10))
+
+        # Progres kompresi dan pengiriman, diperbarui oleh poll_progress
+        self.progress_bar = ctk.CTkProgressBar(self.win_processing)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(fill="x", padx=20)
+
+        self.progress_label = ctk.CTkLabel(self.win_processing, text="", font=("Arial", 12))
+        self.progress_label.pack(pady=5)
 
         self.win_processing.attributes("-topmost", True)
+        self.poll_progress()
+
+    def poll_progress(self):
+        """
+        Membaca progres terbaru dari ProgressReporter lalu memperbarui
+        progress bar dan label. Dijadwalkan ulang setiap
+        POLL_INTERVAL_MS selama popup proses masih terbuka.
+        """
+        if not self.win_processing.winfo_exists():
+            return
+
+        snapshot = self.progress.poll()
+        self.progress_bar.set(snapshot["fraction"])
+        self.progress_label.configure(text=format_progress(snapshot))
+        self.after(POLL_INTERVAL_MS, self.poll_progress)
 
     def show_success_window(self):
         """
@@ -205,6 +275,7 @@ class TransferData(ctk.CTkFrame):
         Menjalankan proses pengiriman data pada thread terpisah
         agar antarmuka tetap responsif.
         """
+        self.progress = ProgressReporter()
         threading.Thread(target=self.send_process).start()
 
     def send_process(self):
@@ -249,74 +320,26 @@ class TransferData(ctk.CTkFrame):
             )
             return
 
-        # Menampilkan popup proses di thread utama
-        self.after(0, self.show_processing_window)
-
-        # CHECK IF FILE ALREADY COMPRESSED
-        if FILEPATH.lower().endswith(".gz"):
-            LogCreate("TransferModule", f"File already compressed (.gz): {FILEPATH}")
-            file_to_send = FILEPATH
-            nama_file = os.path.basename(FILEPATH)
-        else:
-            LogCreate("TransferModule", f"Compressing file before sending: {FILEPATH}")
-            temp_dir = tempfile.gettempdir()
-            nama_file = os.path.basename(FILEPATH) + ".gz"
-            file_to_send = os.path.join(temp_dir, nama_file)
-
-            try:
-                # Mengompresi file sementara sebelum dikirim
-                with open(FILEPATH, "rb") as src, gzip.open(file_to_send, "wb") as dst:
-                    shutil.copyfileobj(src, dst)
-
-                LogCreate(
-                    "TransferModule",
-                    f"Temporary gz file created: {file_to_send}"
-                )
-
-            except Exception as e:
-                self.after(
-                    0,
-                    lambda: self.show_error_window(f"Gagal mengkompres file:\n{e}")
-                )
-                LogCreate(
-                    "TransferModule",
-                    f"Compression failed: {e}",
-                    level="ERROR"
-                )
-                return
-
-        # BEGIN TRANSFER PROCESS
         try:
-            LogCreate("TransferModule", f"Connecting to {HOST}:{PORT}")
-
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.connect((HOST, PORT))
-
+            streams = max(1, int(self.combo_streams.get()))
+        except ValueError:
+            self.after(0, lambda: self.show_error_window("Streams harus berupa angka!"))
             LogCreate(
                 "TransferModule",
-                f"Connected to server. Sending filename: {nama_file}"
+                f"Invalid stream count: {self.combo_streams.get()}",
+                level="ERROR"
             )
+            return
 
-            # Mengirim nama file terlebih dahulu
-            s.sendall((nama_file + "\n").encode("utf-8"))
-
-            total_sent = 0
-            file_size = os.path.getsize(file_to_send)
-
-            # Mengirim file dalam bentuk potongan data (chunk)
-            with open(file_to_send, "rb") as f:
-                while True:
-                    chunk = f.read(1024)
-                    if not chunk:
-                        break
-
-                    s.sendall(chunk)
-                    total_sent += len(chunk)
+        # Menampilkan popup proses di thread utama
+        self.after(0, self.show_processing_window)
 
-            LogCreate(
-                "TransferModule",
-                f"Transfer completed. Bytes sent: {total_sent}/{file_size}",
-                level="SUCCESS"
+        # BEGIN TRANSFER PROCESS
+        try:
+            transfer_sources(
+                HOST, PORT, [FILEPATH], self.progress,
+                pipelined=bool(self.check_stream.get()), streams=streams,
+                resumable=bool(self.check_resume.get())
             )
 
             # Menutup popup proses dan menampilkan notifikasi sukses
@@ -330,14 +353,3 @@ class TransferData(ctk.CTkFrame):
                 0,
                 lambda: self.show_error_window(f"Gagal mengirim data:\n{e}")
             )
-
-        finally:
-            try:
-                s.close()
-                LogCreate("TransferModule", "Socket closed")
-            except Exception:
-                LogCreate(
-                    "TransferModule",
-                    "Socket failed to close",
-                    level="ERROR"
-                )
@@ -0,0 +1,543 @@
+"""
+Benchmark suite aplikasi Project Algoritma dan Pemrograman.
+
+Script ini membuat korpus uji yang dapat direproduksi (log teks,
+data biner acak, banyak file kecil, dan satu file besar), lalu
+mengukur setiap mode kompresi, dekompresi, dan transfer loopback ke
+Assets/serverReciever.py. Hasil ditulis sebagai JSON (MB/s, puncak
+RSS, rasio) sehingga hasil antar commit dapat dibandingkan.
+
+Setiap kasus dijalankan pada proses Python terpisah agar puncak RSS
+yang tercatat hanya milik kasus tersebut.
+
+Contoh penggunaan:
+    python benchmark.py --work-dir /tmp/bench --output bench.json
+    python benchmark.py --scale 0.1 --filter compress/folder
+    python benchmark.py --output new.json --compare old.json
+    python benchmark.py --huge-mb 65536 --filter compress/file/gzip
+
+Kasus berakhiran /read memakai jalur baca buffer biasa (tanpa mmap)
+sebagai pembanding jalur mmap. Untuk mengukur file yang lebih besar
+dari RAM, atur --huge-mb melebihi kapasitas RAM mesin uji.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:
+    # Modul resource tidak tersedia di Windows; puncak RSS tidak dicatat
+    resource = None
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+SERVER_SCRIPT = os.path.join(ROOT_DIR, "Assets", "serverReciever.py")
+
+# Seed korpus; korpus yang sama selalu dihasilkan untuk seed yang sama
+CORPUS_SEED = 20240101
+
+# Ukuran korpus pada scale 1.0
+LOG_SIZE = 64 * 1024 * 1024
+RANDOM_SIZE = 64 * 1024 * 1024
+SMALL_FILE_COUNT = 2000
+HUGE_SIZE = 256 * 1024 * 1024
+
+# Ukuran blok saat menulis korpus
+CORPUS_BLOCK_SIZE = 1024 * 1024
+
+LOG_LEVELS = ["INFO", "INFO", "INFO", "SUCCESS", "ERROR"]
+LOG_PROCESSES = ["CompressModule", "DecompressModule", "TransferModule"]
+LOG_WORDS = [
+    "archive", "block", "bytes", "chunk", "client", "completed", "compressing",
+    "connected", "entries", "file", "folder", "manifest", "output", "server",
+    "source", "started", "stream", "workers",
+]
+
+
+# KORPUS
+
+def log_text(rng, size):
+    """
+    Membuat teks log sintetis dengan format yang sama seperti app.log.
+    """
+    lines = []
+    total = 0
+    while total < size:
+        line = (
+            f"[2024-01-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:"
+            f"{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}] "
+            f"[{rng.choice(LOG_LEVELS)}] {rng.choice(LOG_PROCESSES)} - "
+            + " ".join(rng.choice(LOG_WORDS) for _ in range(rng.randint(4, 12)))
+            + f" {rng.randint(0, 1 << 32)}\n"
+        )
+        lines.append(line)
+        total += len(line)
+
+    return "".join(lines).encode("utf-8")[:size]
+
+
+def write_blocks(path, size, make_block):
+    """
+    Menulis file berukuran size dari blok-blok hasil make_block(n).
+    """
+    with open(path, "wb") as f:
+        written = 0
+        while written < size:
+            block = make_block(min(CORPUS_BLOCK_SIZE, size - written))
+            f.write(block)
+            written += len(block)
+
+
+def build_corpus(corpus_dir, scale, huge_size=None):
+    """
+    Membuat korpus uji di corpus_dir. Korpus yang sudah ada dengan
+    parameter yang sama dipakai ulang. Ukuran file besar dapat diatur
+    terpisah melalui huge_size (byte). Mengembalikan deskripsi korpus.
+    """
+    spec = {
+        "seed": CORPUS_SEED,
+        "scale": scale,
+        "log_size": int(LOG_SIZE * scale),
+        "random_size": int(RANDOM_SIZE * scale),
+        "small_files": max(1, int(SMALL_FILE_COUNT * scale)),
+        "huge_size": huge_size if huge_size is not None else int(HUGE_SIZE * scale),
+    }
+
+    spec_path = os.path.join(corpus_dir, "corpus.json")
+    if os.path.exists(spec_path):
+        with open(spec_path, "r", encoding="utf-8") as f:
+            if json.load(f) == spec:
+                return spec
+
+        shutil.rmtree(corpus_dir)
+
+    rng = random.Random(CORPUS_SEED)
+    folder = os.path.join(corpus_dir, "folder")
+    os.makedirs(os.path.join(folder, "logs"))
+    os.makedirs(os.path.join(folder, "small"))
+
+    # Log teks (mudah dikompresi)
+    write_blocks(os.path.join(folder, "logs", "app.log"), spec["log_size"], lambda n: log_text(rng, n))
+
+    # Data biner acak (tidak dapat dikompresi)
+    write_blocks(os.path.join(folder, "random.bin"), spec["random_size"], rng.randbytes)
+
+    # Banyak file kecil berisi teks dan biner
+    for index in range(spec["small_files"]):
+        size = rng.randint(512, 8192)
+        data = log_text(rng, size) if index % 4 else rng.randbytes(size)
+        with open(os.path.join(folder, "small", f"file_{index:05d}.dat"), "wb") as f:
+            f.write(data)
+
+    # Satu file besar: campuran blok teks dan blok acak
+    text_pool = [log_text(rng, CORPUS_BLOCK_SIZE) for _ in range(8)]
+    random_pool = [rng.randbytes(CORPUS_BLOCK_SIZE) for _ in range(8)]
+    write_blocks(
+        os.path.join(corpus_dir, "huge.bin"),
+        spec["huge_size"],
+        lambda n: rng.choice(random_pool if rng.random() < 0.25 else text_pool)[:n]
+    )
+
+    with open(spec_path, "w", encoding="utf-8") as f:
+        json.dump(spec, f)
+
+    return spec
+
+
+# KASUS BENCHMARK
+
+def path_size(path):
+    """
+    Menghitung ukuran file, atau total ukuran file di dalam folder.
+    """
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            file_path = os.path.join(root, name)
+            if not os.path.islink(file_path):
+                total += os.path.getsize(file_path)
+
+    return total
+
+
+def build_cases(corpus_dir, preset):
+    """
+    Menyusun daftar kasus benchmark. Kasus dekompresi merujuk hasil
+    kasus kompresi melalui field "after".
+    """
+    huge = os.path.join(corpus_dir, "huge.bin")
+    folder = os.path.join(corpus_dir, "folder")
+    cases = []
+
+    for codec in ["gzip", "bz2", "lzma", "zlib"]:
+        worker_choices = ["1", "Auto"] if codec != "zlib" else ["1"]
+        for workers in worker_choices:
+            name = f"compress/file/{codec}/w{workers.lower()}"
+            cases.append({
+                "name": name, "kind": "compress", "source": huge, "mode": "File",
+                "format": "tar", "codec": codec, "preset": preset, "workers": workers,
+                "adaptive": False,
+            })
+            cases.append({"name": name.replace("compress/", "decompress/"), "kind": "decompress",
+                          "after": name, "workers": workers})
+
+            if codec == "gzip":
+                # Pembanding: jalur baca buffer biasa tanpa mmap
+                cases.append({
+                    "name": name + "/read", "kind": "compress", "source": huge, "mode": "File",
+                    "format": "tar", "codec": codec, "preset": preset, "workers": workers,
+                    "adaptive": False, "use_mmap": False,
+                })
+
+    for archive_format in ["tar", "indexed", "incremental", "dedup"]:
+        for adaptive in ([False, True] if archive_format in ("tar", "indexed") else [False]):
+            name = f"compress/folder/{archive_format}" + ("/adaptive" if adaptive else "")
+            cases.append({
+                "name": name, "kind": "compress", "source": folder, "mode": "Folder",
+                "format": archive_format, "codec": "gzip", "preset": preset, "workers": "Auto",
+                "adaptive": adaptive,
+            })
+            cases.append({"name": name.replace("compress/", "decompress/"), "kind": "decompress",
+                          "after": name, "workers": "Auto"})
+
+    cases.append({
+        "name": "compress/folder/tar/read", "kind": "compress", "source": folder, "mode": "Folder",
+        "format": "tar", "codec": "gzip", "preset": preset, "workers": "Auto",
+        "adaptive": False, "use_mmap": False,
+    })
+
+    # Transfer file yang sudah terkompresi (sendfile zero-copy, salinan
+    # buffer, dan salinan 1 KiB seperti jalur lama), dan transfer dengan kompresi
+    cases.append({"name": "transfer/send", "kind": "transfer", "after": "compress/file/gzip/w1"})
+    cases.append({"name": "transfer/send/copy", "kind": "transfer", "after": "compress/file/gzip/w1",
+                  "options": {"zero_copy": False}})
+    cases.append({"name": "transfer/send/copy-1k", "kind": "transfer", "after": "compress/file/gzip/w1",
+                  "options": {"zero_copy": False, "chunk_size": 1024}})
+    cases.append({"name": "transfer/send/streams4", "kind": "transfer", "after": "compress/file/gzip/w1",
+                  "streams": 4})
+    cases.append({"name": "transfer/send/resumable", "kind": "transfer", "after": "compress/file/gzip/w1",
+                  "resumable": True})
+
+    # Folder berisi banyak file kecil melalui satu koneksi (mode folder)
+    cases.append({"name": "transfer/tree", "kind": "transfer", "source": folder, "tree": True})
+    cases.append({"name": "transfer/compress+send", "kind": "transfer", "source": huge})
+    cases.append({"name": "transfer/stream", "kind": "transfer", "source": huge, "stream": True})
+    return cases
+
+
+def free_port():
+    """
+    Mencari port TCP lokal yang sedang tidak dipakai.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("localhost", 0))
+        return s.getsockname()[1]
+
+
+def run_transfer(case, work_dir):
+    """
+    Menjalankan serverReciever sebagai proses terpisah lalu mengirim
+    file ke server tersebut melalui loopback. Kasus "stream" mengompresi
+    sambil mengirim tanpa file sementara, kasus "streams" mengirim
+    melalui beberapa koneksi paralel, dan kasus "resumable" memakai
+    mode resume (hash SHA-256 dan CRC32 per chunk). Kasus "tree"
+    mengirim seluruh folder melalui satu koneksi (mode folder).
+    Mengembalikan tuple (byte logis, byte terkirim).
+    """
+    from Helper.transferCore import (
+        cleanup_prepared, prepare_file, send_file, send_parallel, send_resumable, send_tree, stream_file
+    )
+
+    inbox = os.path.join(work_dir, "inbox")
+    os.makedirs(inbox, exist_ok=True)
+    port = free_port()
+
+    server = subprocess.Popen(
+        [sys.executable, SERVER_SCRIPT, "--port", str(port), "--dir", inbox],
+        stdout=subprocess.DEVNULL
+    )
+
+    file_to_send = None
+    try:
+        if not case.get("stream") and not case.get("tree"):
+            file_to_send, filename = prepare_file(case["source"])
+
+        # Menunggu server siap menerima koneksi
+        for _ in range(100):
+            try:
+                if case.get("tree"):
+                    sent = send_tree("localhost", port, [case["source"]], options=case.get("options"))
+                elif case.get("stream"):
+                    sent = stream_file("localhost", port, case["source"], options=case.get("options"))
+                elif case.get("resumable"):
+                    # Tanpa percobaan ulang internal agar loop ini yang menunggu server
+                    sent = send_resumable(
+                        "localhost", port, file_to_send, filename, options=case.get("options"), retries=0
+                    )
+                elif case.get("streams", 1) > 1:
+                    sent = send_parallel(
+                        "localhost", port, file_to_send, filename, case["streams"], options=case.get("options")
+                    )
+                else:
+                    sent = send_file("localhost", port, file_to_send, filename, options=case.get("options"))
+                break
+            except ConnectionRefusedError:
+                time.sleep(0.05)
+        else:
+            raise RuntimeError("Receiver server did not start")
+
+        server.wait(timeout=60)
+
+    finally:
+        if server.poll() is None:
+            server.kill()
+        if file_to_send is not None:
+            cleanup_prepared(file_to_send, case["source"])
+
+    return path_size(case["source"]), sent
+
+
+def run_case(case):
+    """
+    Menjalankan satu kasus di proses saat ini dan mengembalikan
+    hasil mentah (waktu, ukuran, artefak, dan puncak RSS).
+    """
+    from Helper.compressCore import compress_source
+    from Helper.decompressCore import decompress_source
+    from Helper.incrementalArchive import manifest_path
+    from Helper.parallelCompress import parse_workers
+
+    work_dir = case["work_dir"]
+    os.makedirs(work_dir, exist_ok=True)
+    started = time.perf_counter()
+    result = {}
+
+    if case["kind"] == "compress":
+        options = {
+            "workers": parse_workers(case["workers"]),
+            "codec": case["codec"],
+            "preset": case["preset"],
+            "adaptive": case["adaptive"],
+        }
+        if "use_mmap" in case:
+            options["use_mmap"] = case["use_mmap"]
+        output = compress_source(case["source"], work_dir, case["mode"], case["format"], options)
+        elapsed = time.perf_counter() - started
+
+        if isinstance(output, dict):
+            # Inkremental mengembalikan info arsip, dedup mengembalikan statistik
+            name = os.path.basename(os.path.normpath(case["source"]))
+            artifact = output.get("snapshot") or manifest_path(work_dir, name)
+        else:
+            artifact = output
+
+        result.update({
+            "logical_bytes": path_size(case["source"]),
+            "output_bytes": path_size(work_dir),
+            "artifact": artifact,
+        })
+
+    elif case["kind"] == "decompress":
+        output_dir = os.path.join(work_dir, "out")
+        os.makedirs(output_dir, exist_ok=True)
+        decompress_source(case["artifact"], output_dir, workers=parse_workers(case["workers"]))
+        elapsed = time.perf_counter() - started
+
+        result.update({
+            "logical_bytes": path_size(output_dir),
+            "output_bytes": path_size(output_dir),
+            "input_bytes": case["input_bytes"],
+        })
+        shutil.rmtree(output_dir)
+
+    else:
+        logical, sent = run_transfer(case, work_dir)
+        elapsed = time.perf_counter() - started
+        result.update({"logical_bytes": logical, "output_bytes": sent})
+
+    result["seconds"] = elapsed
+    if resource is not None:
+        # ru_maxrss dalam KiB di Linux dan dalam byte di macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        result["peak_rss_mb"] = peak / (1048576 if sys.platform == "darwin" else 1024)
+    else:
+        result["peak_rss_mb"] = None
+
+    return result
+
+
+def run_case_subprocess(case):
+    """
+    Menjalankan satu kasus pada proses Python baru dan membaca
+    hasilnya dari stdout dalam bentuk JSON. Folder kerja proses
+    adalah folder runs sehingga Logs/ tidak ikut terukur.
+    """
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--run-case", json.dumps(case)],
+        cwd=os.path.dirname(case["work_dir"]),
+        capture_output=True,
+        text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr else "failed")
+
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def summarize(case, raw):
+    """
+    Mengubah hasil mentah menjadi baris hasil akhir: MB/s dihitung
+    dari byte logis (data asli), rasio dari byte terkompresi.
+    """
+    logical = raw["logical_bytes"]
+    row = {
+        "name": case["name"],
+        "kind": case["kind"],
+        "seconds": round(raw["seconds"], 4),
+        "logical_bytes": logical,
+        "mb_per_s": round(logical / 1048576 / raw["seconds"], 2) if raw["seconds"] > 0 else None,
+        "peak_rss_mb": round(raw["peak_rss_mb"], 1) if raw["peak_rss_mb"] is not None else None,
+    }
+
+    if case["kind"] == "compress":
+        row["output_bytes"] = raw["output_bytes"]
+        row["ratio"] = round(raw["output_bytes"] / logical, 4) if logical else None
+    elif case["kind"] == "decompress":
+        row["ratio"] = round(raw["input_bytes"] / logical, 4) if logical else None
+    else:
+        row["sent_bytes"] = raw["output_bytes"]
+        row["ratio"] = round(raw["output_bytes"] / logical, 4) if logical else None
+
+    return row
+
+
+def git_commit():
+    """
+    Mengembalikan hash commit git saat ini, atau None jika tidak tersedia.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    """
+    Mencetak perbandingan MB/s dan puncak RSS terhadap hasil sebelumnya.
+    """
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {row["name"]: row for row in json.load(f)["results"]}
+
+    print(f"\n{'case':<40} {'MB/s':>10} {'before':>10} {'change':>8} {'RSS MB':>8} {'before':>8}")
+    for row in results:
+        old = baseline.get(row["name"])
+        if old is None or not old.get("mb_per_s") or row.get("mb_per_s") is None:
+            continue
+
+        change = (row["mb_per_s"] / old["mb_per_s"] - 1) * 100
+        print(
+            f"{row['name']:<40} {row['mb_per_s']:>10.1f} {old['mb_per_s']:>10.1f} {change:>+7.1f}% "
+            f"{row['peak_rss_mb'] or 0:>8.1f} {old.get('peak_rss_mb') or 0:>8.1f}"
+        )
+
+
+def main(argv=None):
+    """
+    Fungsi utama benchmark. Mengembalikan kode keluar proses.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark compression, decompression and transfer")
+    parser.add_argument("--work-dir", default=os.path.join(ROOT_DIR, ".benchmark"),
+                        help="Folder korpus dan hasil sementara")
+    parser.add_argument("--output", "-o", default="benchmark.json", help="File hasil JSON")
+    parser.add_argument("--scale", type=float, default=1.0, help="Pengali ukuran korpus")
+    parser.add_argument("--huge-mb", type=int, help="Ukuran file besar dalam MB (default: 256 x scale)")
+    parser.add_argument("--preset", default="balanced", help="Preset kompresi (default: balanced)")
+    parser.add_argument("--filter", default="", help="Hanya jalankan kasus yang namanya memuat teks ini")
+    parser.add_argument("--compare", help="File JSON hasil sebelumnya untuk dibandingkan")
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_case:
+        print(json.dumps(run_case(json.loads(args.run_case))))
+        return 0
+
+    work_dir = os.path.abspath(args.work_dir)
+    corpus_dir = os.path.join(work_dir, "corpus")
+    runs_dir = os.path.join(work_dir, "runs")
+
+    print(f"Building corpus in {corpus_dir} (scale {args.scale})...")
+    huge_size = args.huge_mb * 1024 * 1024 if args.huge_mb else None
+    corpus = build_corpus(corpus_dir, args.scale, huge_size)
+
+    if os.path.exists(runs_dir):
+        shutil.rmtree(runs_dir)
+
+    artifacts = {}
+    results = []
+    for case in build_cases(corpus_dir, args.preset):
+        needed = case.get("after")
+        if args.filter not in case["name"]:
+            continue
+        if needed is not None and needed not in artifacts:
+            # Kasus kompresi yang dibutuhkan tidak dijalankan atau gagal
+            print(f"{case['name']:<40} SKIPPED: needs {needed}")
+            continue
+
+        case["work_dir"] = os.path.join(runs_dir, case["name"].replace("/", "_"))
+        os.makedirs(case["work_dir"], exist_ok=True)
+        if needed is not None:
+            case["artifact"], case["input_bytes"] = artifacts[needed]
+            case.setdefault("source", case["artifact"])
+
+        try:
+            raw = run_case_subprocess(case)
+        except Exception as e:
+            print(f"{case['name']:<40} FAILED: {e}")
+            continue
+
+        if case["kind"] == "compress":
+            artifacts[case["name"]] = (raw["artifact"], raw["output_bytes"])
+
+        row = summarize(case, raw)
+        results.append(row)
+        print(
+            f"{row['name']:<40} {row['mb_per_s'] or 0:>9.1f} MB/s  "
+            f"ratio {row['ratio'] or 0:.3f}  RSS {row['peak_rss_mb'] or 0:.0f} MB"
+        )
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "preset": args.preset,
+        "corpus": corpus,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1)
+
+    print(f"\nResults written to {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
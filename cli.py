@@ -0,0 +1,382 @@
+"""
+Command line interface (CLI) aplikasi Project Algoritma dan Pemrograman.
+
+CLI ini menjalankan mesin yang sama dengan GUI (Helper.compressCore,
+Helper.decompressCore, dan Helper.transferCore) tanpa memuat
+CustomTkinter, sehingga dapat dipakai pada mesin tanpa layar seperti
+cron job atau batch node.
+
+Contoh penggunaan:
+    python cli.py compress data/ -o backup/ --format indexed --codec lzma
+    python cli.py decompress backup/data.iarc -o restore/
+    python cli.py decompress backup/data.tar.gz -o restore/ -m "data/logs/*.log"
+    python cli.py verify backup/*.tar.gz -j 4
+    python cli.py range backup/big.log.gz --offset 1000000 --length 4096
+    python cli.py send backup/data.tar.gz --host 192.168.1.10 --port 5000
+    python cli.py send backup/big.tar.gz --host 203.0.113.5 --port 5000 --streams 4
+    python cli.py send photos/ notes.txt --host 192.168.1.10 --port 5000
+    python cli.py serve --host 0.0.0.0 --port 5000 --dir inbox/
+"""
+
+import argparse
+import os
+import sys
+import threading
+
+from Helper.codecRegistry import CODECS, DEFAULT_CODEC, DEFAULT_PRESET, PRESET_NAMES
+from Helper.compressCore import FOLDER_FORMATS, compress_source
+from Helper.decompressCore import decompress_source, extract_selected, list_contents, verify_source
+from Helper.jobQueue import JobQueue, format_summary
+from Helper.parallelCompress import parse_workers
+from Helper.progressReporter import POLL_INTERVAL_MS, ProgressReporter, format_progress
+from Helper.seekableGzip import read_range
+from Helper.streamCompress import DEFAULT_BLOCK_SIZE
+from Helper.transferCore import SEND_CHUNK_SIZE, transfer_sources
+
+
+def run_with_progress(label, func, show):
+    """
+    Menjalankan func(progress) sambil menampilkan progres ke stderr
+    setiap POLL_INTERVAL_MS jika show bernilai True.
+    Mengembalikan hasil func.
+    """
+    if not show:
+        return func(None)
+
+    progress = ProgressReporter(label=label)
+    stop = threading.Event()
+
+    def report():
+        """
+        Mencetak satu baris progres yang ditimpa setiap interval.
+        """
+        while not stop.wait(POLL_INTERVAL_MS / 1000):
+            line = format_progress(progress.poll()).replace("\n", ", ")
+            print(f"\r{line}\033[K", end="", file=sys.stderr, flush=True)
+
+    reporter = threading.Thread(target=report, daemon=True)
+    reporter.start()
+
+    try:
+        return func(progress)
+    finally:
+        stop.set()
+        reporter.join()
+        line = format_progress(progress.poll()).replace("\n", ", ")
+        print(f"\r{line}\033[K", file=sys.stderr, flush=True)
+
+
+def run_sources(sources, label, func, jobs, show_progress):
+    """
+    Menjalankan func(source, progress) untuk setiap sumber. Satu
+    sumber dijalankan langsung, sedangkan banyak sumber dijalankan
+    melalui JobQueue dengan jobs pekerjaan bersamaan.
+    Mengembalikan kode keluar (0 berhasil, 1 ada yang gagal).
+    """
+    if len(sources) == 1:
+        result = run_with_progress(label, lambda progress: func(sources[0], progress), show_progress)
+        print(result)
+        return 0
+
+    def run_queue(progress):
+        queue = JobQueue(workers=jobs)
+        for source in sources:
+            queue.add(source, lambda src: func(src, progress))
+
+        summary = queue.run()
+        return queue, summary
+
+    queue, summary = run_with_progress(label, run_queue, show_progress)
+
+    print(queue.status_text())
+    print(format_summary(summary))
+    return 1 if summary["failed"] else 0
+
+
+def command_compress(args):
+    """
+    Perintah compress: mengompresi satu atau banyak file/folder.
+    """
+    options = {
+        "block_size": args.block_size,
+        "workers": parse_workers(args.workers),
+        "codec": args.codec,
+        "preset": args.preset,
+        "adaptive": args.adaptive,
+    }
+    os.makedirs(args.output, exist_ok=True)
+
+    return run_sources(
+        args.sources,
+        "Compressing",
+        lambda source, progress: compress_source(
+            source, args.output, None, args.format, options, progress
+        ),
+        parse_workers(args.jobs),
+        args.progress
+    )
+
+
+def command_decompress(args):
+    """
+    Perintah decompress: mendekompresi atau memulihkan satu atau
+    banyak arsip, menampilkan daftar isi arsip (--list), atau hanya
+    mengekstrak member tertentu (--member).
+    """
+    if args.list:
+        for source in args.sources:
+            print("\n".join(list_contents(source)))
+        return 0
+
+    workers = parse_workers(args.workers)
+    os.makedirs(args.output, exist_ok=True)
+
+    if args.member:
+        return run_sources(
+            args.sources,
+            "Extracting",
+            lambda source, progress: extract_selected(
+                source, args.output, args.member, workers=workers, progress=progress,
+                chunk_size=args.chunk_size
+            ),
+            parse_workers(args.jobs),
+            args.progress
+        )
+
+    return run_sources(
+        args.sources,
+        "Decompressing",
+        lambda source, progress: decompress_source(
+            source, args.output, workers=workers, progress=progress, chunk_size=args.chunk_size
+        ),
+        parse_workers(args.jobs),
+        args.progress
+    )
+
+
+def command_verify(args):
+    """
+    Perintah verify: memeriksa keutuhan satu atau banyak arsip tanpa
+    menulis hasil dekompresi ke disk.
+    """
+    workers = parse_workers(args.workers)
+
+    return run_sources(
+        args.sources,
+        "Verifying",
+        lambda source, progress: verify_source(
+            source, workers=workers, progress=progress, chunk_size=args.chunk_size,
+            hash_list=args.hashes, save_hashes=args.write_hashes
+        )["entries"],
+        parse_workers(args.jobs),
+        args.progress
+    )
+
+
+def command_range(args):
+    """
+    Perintah range: membaca rentang byte dari file gzip-seekable
+    tanpa mendekompresi seluruh file.
+    """
+    data = read_range(args.file, args.offset, args.length)
+
+    if args.output:
+        with open(args.output, "wb") as f:
+            f.write(data)
+    else:
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+
+    return 0
+
+
+def command_send(args):
+    """
+    Perintah send: mengirim file ke server penerima. Folder atau lebih
+    dari satu sumber dikirim bersama melalui satu koneksi (mode folder).
+    """
+    options = {
+        "chunk_size": args.chunk_size,
+        "sndbuf": args.sndbuf,
+        "rcvbuf": args.rcvbuf,
+        "nodelay": args.nodelay,
+        "zero_copy": not args.no_sendfile,
+    }
+
+    total = run_with_progress(
+        "Sending",
+        lambda progress: transfer_sources(
+            args.host, args.port, args.sources, progress,
+            pipelined=not args.buffered, workers=parse_workers(args.workers), options=options,
+            streams=args.streams, resumable=args.resumable
+        ),
+        args.progress
+    )
+    print(f"{total} bytes sent to {args.host}:{args.port}")
+    return 0
+
+
+def command_serve(args):
+    """
+    Perintah serve: menjalankan server penerima untuk satu file
+    atau satu pengiriman folder.
+    """
+    # Diimpor di sini karena serverReciever dapat berdiri sendiri
+    # dan hanya dibutuhkan oleh perintah serve
+    from Assets.serverReciever import RECV_CHUNK_SIZE, receive_file
+
+    os.makedirs(args.dir, exist_ok=True)
+    receive_file(
+        args.host, args.port, args.dir,
+        chunk_size=args.chunk_size or RECV_CHUNK_SIZE, rcvbuf=args.rcvbuf, sndbuf=args.sndbuf, nodelay=args.nodelay
+    )
+    return 0
+
+
+def build_parser():
+    """
+    Membuat parser argumen beserta seluruh sub-perintah CLI.
+    """
+    parser = argparse.ArgumentParser(
+        description="Compression, decompression and transfer tools without the GUI"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # compress
+    compress = subparsers.add_parser("compress", help="Compress files or folders")
+    compress.add_argument("sources", nargs="+", help="File atau folder sumber")
+    compress.add_argument("--output", "-o", required=True, help="Folder output")
+    compress.add_argument(
+        "--format", "-f", choices=FOLDER_FORMATS, default="tar",
+        help="Format arsip untuk folder (default: tar)"
+    )
+    compress.add_argument("--codec", "-c", choices=list(CODECS), default=DEFAULT_CODEC)
+    compress.add_argument("--preset", "-p", choices=PRESET_NAMES, default=DEFAULT_PRESET)
+    compress.add_argument(
+        "--block-size", type=int, default=DEFAULT_BLOCK_SIZE,
+        help="Ukuran blok dalam byte (default: 1 MiB)"
+    )
+    compress.add_argument("--workers", "-w", default="Auto", help="Jumlah worker kompresi")
+    compress.add_argument("--adaptive", action="store_true", help="Pilih level per file")
+    compress.add_argument("--jobs", "-j", default="1", help="Jumlah sumber yang diproses bersamaan")
+    compress.add_argument("--progress", action="store_true", help="Tampilkan progres di stderr")
+    compress.set_defaults(func=command_compress)
+
+    # decompress
+    decompress = subparsers.add_parser("decompress", help="Decompress or restore archives")
+    decompress.add_argument("sources", nargs="+", help="Arsip, manifest, atau snapshot")
+    decompress.add_argument("--output", "-o", default=".", help="Folder output (default: .)")
+    decompress.add_argument("--workers", "-w", default="Auto", help="Jumlah worker ekstraksi dan dekompresi gzip")
+    decompress.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_BLOCK_SIZE,
+        help="Ukuran buffer dekompresi dalam byte (default: 1 MiB)"
+    )
+    decompress.add_argument("--jobs", "-j", default="1", help="Jumlah arsip yang diproses bersamaan")
+    decompress.add_argument("--list", "-l", action="store_true", help="Tampilkan daftar isi arsip")
+    decompress.add_argument(
+        "--member", "-m", action="append",
+        help="Ekstrak hanya member dengan nama atau pola glob ini (dapat diulang)"
+    )
+    decompress.add_argument("--progress", action="store_true", help="Tampilkan progres di stderr")
+    decompress.set_defaults(func=command_decompress)
+
+    # verify
+    verify = subparsers.add_parser("verify", help="Check archive integrity without extracting")
+    verify.add_argument("sources", nargs="+", help="Arsip, manifest, atau snapshot")
+    verify.add_argument("--workers", "-w", default="Auto", help="Jumlah worker dekompresi gzip")
+    verify.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_BLOCK_SIZE,
+        help="Ukuran buffer dekompresi dalam byte (default: 1 MiB)"
+    )
+    verify.add_argument("--jobs", "-j", default="1", help="Jumlah arsip yang diverifikasi bersamaan")
+    verify.add_argument(
+        "--hashes",
+        help="Daftar hash SHA-256 (format sha256sum atau manifest inkremental) "
+             "(default: <arsip>.sha256 jika ada)"
+    )
+    verify.add_argument(
+        "--write-hashes", action="store_true",
+        help="Simpan hash isi arsip ke <arsip>.sha256 untuk verifikasi berikutnya"
+    )
+    verify.add_argument("--progress", action="store_true", help="Tampilkan progres di stderr")
+    verify.set_defaults(func=command_verify)
+
+    # range
+    range_parser = subparsers.add_parser("range", help="Read a byte range from a gzip-seekable file")
+    range_parser.add_argument("file", help="File hasil codec gzip-seekable")
+    range_parser.add_argument("--offset", type=int, required=True, help="Offset awal data asli")
+    range_parser.add_argument("--length", type=int, required=True, help="Jumlah byte yang dibaca")
+    range_parser.add_argument("--output", "-o", help="File tujuan (default: stdout)")
+    range_parser.set_defaults(func=command_range)
+
+    # send
+    send = subparsers.add_parser("send", help="Send files or folders to a receiver server")
+    send.add_argument(
+        "sources", nargs="+",
+        help="File yang dikirim; folder atau banyak file dikirim melalui satu koneksi"
+    )
+    send.add_argument("--host", "-H", required=True)
+    send.add_argument("--port", "-P", type=int, required=True)
+    send.add_argument("--workers", "-w", default="Auto", help="Jumlah worker kompresi saat mengirim")
+    send.add_argument(
+        "--buffered", action="store_true",
+        help="Kompresi ke file sementara dulu, baru dikirim (tanpa pipeline)"
+    )
+    send.add_argument(
+        "--streams", "-s", type=int, default=1,
+        help="Jumlah koneksi paralel, masing-masing membawa satu rentang byte (default: 1)"
+    )
+    send.add_argument(
+        "--resumable", "-r", action="store_true",
+        help="Lanjutkan dari offset yang sudah diterima server dan kirim ulang chunk yang rusak"
+    )
+    send.add_argument(
+        "--chunk-size", type=int, default=SEND_CHUNK_SIZE,
+        help="Ukuran potongan pengiriman tanpa sendfile dalam byte (default: 256 KiB)"
+    )
+    send.add_argument("--sndbuf", type=int, help="Ukuran SO_SNDBUF dalam byte")
+    send.add_argument("--rcvbuf", type=int, help="Ukuran SO_RCVBUF dalam byte")
+    send.add_argument("--nodelay", action="store_true", help="Aktifkan TCP_NODELAY")
+    send.add_argument(
+        "--no-sendfile", action="store_true",
+        help="Kirim dengan salinan buffer biasa, bukan socket.sendfile (zero-copy)"
+    )
+    send.add_argument("--progress", action="store_true", help="Tampilkan progres di stderr")
+    send.set_defaults(func=command_send)
+
+    # serve
+    serve = subparsers.add_parser("serve", help="Receive one file or folder transfer from a sender")
+    serve.add_argument("--host", "-H", default="localhost")
+    serve.add_argument("--port", "-P", type=int, default=5000)
+    serve.add_argument("--dir", "-D", default=".", help="Folder penyimpanan (default: .)")
+    serve.add_argument(
+        "--chunk-size", type=int,
+        help="Ukuran buffer penerimaan dalam byte (default: 256 KiB)"
+    )
+    serve.add_argument("--rcvbuf", type=int, help="Ukuran SO_RCVBUF dalam byte")
+    serve.add_argument("--sndbuf", type=int, help="Ukuran SO_SNDBUF dalam byte")
+    serve.add_argument("--nodelay", action="store_true", help="Aktifkan TCP_NODELAY")
+    serve.set_defaults(func=command_serve)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    Fungsi utama CLI. Mengembalikan kode keluar proses.
+    """
+    args = build_parser().parse_args(argv)
+
+    try:
+        return args.func(args)
+    except KeyboardInterrupt:
+        # Kompresi file besar dapat dilanjutkan dari checkpoint terakhir
+        print("Cancelled", file=sys.stderr)
+        return 130
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
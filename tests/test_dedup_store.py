@@ -0,0 +1,95 @@
+"""
+Test DedupStore: batas chunk harus mengikuti isi data (rolling hash
+Gear), sehingga sisipan beberapa byte pada teks atau log hanya
+mengubah chunk di sekitarnya.
+"""
+
+import io
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Helper.dedupStore import GEAR, HASH_BITS, MAX_CHUNK_SIZE, chunk_masks, find_boundary, iter_chunks
+
+WORDS = ["data", "folder", "arsip", "kompresi", "file", "server", "client", "blok", "hash", "chunk",
+         "the", "and", "of", "to", "is", "in", "that", "backup", "restore", "snapshot"]
+
+
+def log_lines(size, seed=1):
+    """
+    Membuat teks log sintetis dengan format baris yang berulang.
+    """
+    rng = random.Random(seed)
+    lines = []
+    total = 0
+    index = 0
+    while total < size:
+        line = (
+            f"2026-10-18 09:{index // 60 % 60:02d}:{index % 60:02d} [INFO] worker-{rng.randint(1, 8)} "
+            f"GET /api/v1/items/{rng.randint(1, 500)} status={rng.choice([200, 200, 404, 500])} "
+            f"took={rng.random():.3f}ms\n"
+        )
+        lines.append(line)
+        total += len(line)
+        index += 1
+    return "".join(lines).encode("ascii")
+
+
+def prose(size, seed=2):
+    """
+    Membuat teks ASCII dari kosakata kecil.
+    """
+    rng = random.Random(seed)
+    words = []
+    total = 0
+    while total < size:
+        word = rng.choice(WORDS)
+        words.append(word)
+        total += len(word) + 1
+    return " ".join(words).encode("ascii")
+
+
+def reference_boundary(data, start, stop, mask):
+    """
+    Gear hash per byte sebagai acuan find_boundary.
+    """
+    limit = (1 << HASH_BITS) - 1
+    h = 0
+    for position in range(max(0, start - HASH_BITS + 1), stop):
+        h = ((h << 1) ^ GEAR[data[position]]) & limit
+        if position >= start and not h & mask:
+            return position + 1
+    return 0
+
+
+def chunks(data):
+    return list(iter_chunks(io.BytesIO(data)))
+
+
+@pytest.mark.parametrize("mask", [0b111 << 61, 0b1111111 << 57, chunk_masks(64 * 1024)[1]])
+def test_find_boundary_matches_rolling_hash(mask):
+    data = random.Random(3).randbytes(200000) + log_lines(100000)
+    for start, stop in ((0, 1000), (100, 5000), (16384, 50000), (150000, len(data))):
+        assert find_boundary(data, start, stop, mask) == reference_boundary(data, start, stop, mask)
+
+
+@pytest.mark.parametrize("make_data", [log_lines, prose])
+def test_insertion_keeps_most_chunks(make_data):
+    data = make_data(8 * 1024 * 1024)
+    before = chunks(data)
+    assert b"".join(before) == data
+
+    # Hampir semua batas harus ditentukan isi, bukan MAX_CHUNK_SIZE
+    assert sum(len(chunk) == MAX_CHUNK_SIZE for chunk in before) <= len(before) // 10
+
+    middle = len(data) // 2
+    edited = b"X" + data[:middle] + b"abc" + data[middle:]
+    after = chunks(edited)
+    assert b"".join(after) == edited
+
+    shared = len(set(before) & set(after))
+    assert shared >= len(before) - 4
@@ -0,0 +1,83 @@
+"""
+Test kompresi dengan checkpoint: file hanya dipotong menjadi member
+baru di batas checkpoint, sehingga codec berjendela besar (lzma)
+tidak kehilangan rasio kompresi, dan proses yang terhenti dapat
+dilanjutkan.
+"""
+
+import lzma
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Helper import streamCompress
+from Helper.streamCompress import compress_stream_file
+
+BASE_SIZE = 1024 * 1024
+REPEATS = 8
+
+
+class StopAfter:
+    """
+    Progress palsu yang menghentikan kompresi setelah limit byte.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.done = 0
+
+    def add_total(self, size):
+        pass
+
+    def advance(self, size):
+        self.done += size
+        if self.done > self.limit:
+            raise KeyboardInterrupt
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    # Ambang diperkecil agar jalur checkpoint dipakai pada file kecil
+    monkeypatch.setattr(streamCompress, "RESUME_MIN_SIZE", BASE_SIZE)
+    monkeypatch.setattr(streamCompress, "CHECKPOINT_INTERVAL", 4 * BASE_SIZE)
+
+    path = tmp_path / "data.bin"
+    path.write_bytes(random.Random(5).randbytes(BASE_SIZE) * REPEATS)
+    return path
+
+
+def test_lzma_keeps_window_between_blocks(tmp_path, source):
+    resumable = str(tmp_path / "resumable.xz")
+    plain = str(tmp_path / "plain.xz")
+
+    compress_stream_file(str(source), resumable, block_size=256 * 1024, compresslevel=1, codec="lzma")
+    compress_stream_file(str(source), plain, block_size=256 * 1024, compresslevel=1, codec="lzma",
+                         resumable=False)
+
+    with lzma.open(resumable) as f:
+        assert f.read() == source.read_bytes()
+
+    # Satu member per checkpoint (dua segmen), bukan satu per blok 256 KiB
+    assert os.path.getsize(resumable) < 2.5 * os.path.getsize(plain)
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_resume_after_interruption(tmp_path, source, use_mmap):
+    dest = str(tmp_path / "data.bin.xz")
+
+    with pytest.raises(KeyboardInterrupt):
+        compress_stream_file(str(source), dest, compresslevel=1, codec="lzma",
+                             progress=StopAfter(5 * BASE_SIZE), use_mmap=use_mmap)
+
+    resumed = []
+    processed = compress_stream_file(str(source), dest, compresslevel=1, codec="lzma",
+                                     on_resume=resumed.append, use_mmap=use_mmap)
+
+    assert resumed == [4 * BASE_SIZE]
+    assert processed == (REPEATS - 4) * BASE_SIZE
+    with lzma.open(dest) as f:
+        assert f.read() == source.read_bytes()
@@ -0,0 +1,31 @@
+"""
+Test server penerima: header mode resume dengan chunk_size tidak
+valid harus ditolak dengan "FAIL" sebelum buffer dialokasikan.
+"""
+
+import os
+import socket
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Assets"))
+
+from serverReciever import MAX_RESUME_CHUNK_SIZE, receive_resume_session
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1, MAX_RESUME_CHUNK_SIZE + 1, 1 << 40, "1024"])
+def test_invalid_resume_chunk_size_is_rejected(tmp_path, chunk_size):
+    server, client = socket.socketpair()
+    header = {"name": "data.bin", "size": 10, "sha256": "0" * 64, "chunk_size": chunk_size}
+    filepath = str(tmp_path / "data.bin")
+
+    try:
+        with pytest.raises(ValueError):
+            receive_resume_session(server, header, filepath)
+        assert client.recv(100).startswith(b"FAIL")
+    finally:
+        server.close()
+        client.close()
+
+    assert not os.path.exists(filepath + ".part")
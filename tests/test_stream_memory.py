@@ -0,0 +1,59 @@
+"""
+Test regresi memori StreamCompress: mengompresi file sparse berukuran
+beberapa GB harus tetap memakai puncak RSS yang konstan (tidak
+sebanding dengan ukuran file).
+
+Kompresi dijalankan pada proses Python terpisah agar ru_maxrss yang
+diukur hanya milik proses kompresi tersebut.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+resource = pytest.importorskip("resource")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Ukuran file sparse yang dikompresi
+SPARSE_SIZE = 2 * 1024 * 1024 * 1024
+
+# Batas puncak RSS proses kompresi (jauh di bawah ukuran file)
+MAX_RSS_MB = 256
+
+CHILD_SCRIPT = """
+import json, resource, sys
+sys.path.insert(0, sys.argv[1])
+from Helper.streamCompress import compress_stream_file
+processed = compress_stream_file(sys.argv[2], sys.argv[3], compresslevel=1)
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"processed": processed, "peak_kb": peak}))
+"""
+
+
+def test_sparse_file_compresses_with_bounded_rss(tmp_path):
+    source = str(tmp_path / "sparse.bin")
+    dest = str(tmp_path / "sparse.bin.gz")
+
+    # File sparse: ukuran logis besar tanpa memakai ruang disk
+    with open(source, "wb") as f:
+        f.truncate(SPARSE_SIZE)
+
+    completed = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT, ROOT_DIR, source, dest],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    # ru_maxrss dalam KiB di Linux dan dalam byte di macOS
+    peak_mb = result["peak_kb"] / (1048576 if sys.platform == "darwin" else 1024)
+
+    assert result["processed"] == SPARSE_SIZE
+    assert os.path.getsize(dest) < SPARSE_SIZE // 100
+    assert peak_mb < MAX_RSS_MB, f"peak RSS {peak_mb:.0f} MB for a {SPARSE_SIZE >> 20} MB file"
@@ -0,0 +1,40 @@
+"""
+Test TarIndex: ekstraksi member terpilih harus tetap berhasil untuk
+hardlink yang targetnya tidak ikut dipilih.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Helper.streamCompress import compress_stream_folder
+from Helper.tarIndex import extract_tar_members, load_tar_index, select_members
+
+
+@pytest.mark.skipif(not hasattr(os, "link"), reason="hardlink tidak didukung")
+@pytest.mark.parametrize("codec", ["gzip", "gzip-seekable"])
+def test_extract_hardlink_without_target(tmp_path, codec):
+    source = tmp_path / "src"
+    (source / "d").mkdir(parents=True)
+    (source / "a.txt").write_bytes(b"shared content\n" * 100)
+    (source / "b.txt").write_bytes(b"other\n")
+    os.link(source / "a.txt", source / "d" / "hard.txt")
+
+    archive = str(tmp_path / "src.tar.gz")
+    compress_stream_folder(str(source), archive, arcname="src", codec=codec)
+
+    entries = load_tar_index(archive)
+    assert {entry["name"]: entry["type"] for entry in entries}["src/d/hard.txt"] == "hardlink"
+
+    selected = select_members(entries, ["src/d/hard.txt"])
+    assert [entry["name"] for entry in selected] == ["src/a.txt", "src/d/hard.txt"]
+
+    output = tmp_path / "out"
+    count = extract_tar_members(archive, str(output), [entry["name"] for entry in selected])
+
+    assert count == 2
+    assert (output / "src" / "d" / "hard.txt").read_bytes() == b"shared content\n" * 100
+    assert not (output / "src" / "b.txt").exists()
@@ -0,0 +1,57 @@
+"""
+Test VerifyArchive: verifikasi arsip TAR terkompresi harus memeriksa
+trailer codec (CRC32 dan ISIZE gzip), bukan hanya struktur TAR.
+"""
+
+import io
+import os
+import sys
+import tarfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Helper.verifyArchive import verify_archive
+
+
+def make_tar_gz(path):
+    """
+    Membuat arsip .tar.gz kecil berisi dua file.
+    """
+    with tarfile.open(path, "w:gz") as tar:
+        for name, data in (("data/a.txt", b"hello " * 1000), ("data/b.bin", os.urandom(4096))):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+
+def corrupt_trailer_crc(path):
+    """
+    Membalik satu byte CRC32 pada trailer gzip (8 byte terakhir).
+    """
+    with open(path, "r+b") as f:
+        f.seek(-8, os.SEEK_END)
+        byte = f.read(1)
+        f.seek(-8, os.SEEK_END)
+        f.write(bytes([byte[0] ^ 0xFF]))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_intact_tar_gz_passes(tmp_path, workers):
+    path = str(tmp_path / "data.tar.gz")
+    make_tar_gz(path)
+
+    result = verify_archive(path, workers=workers)
+
+    assert result["entries"] == 2
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_corrupted_trailer_crc_fails(tmp_path, workers):
+    path = str(tmp_path / "data.tar.gz")
+    make_tar_gz(path)
+    corrupt_trailer_crc(path)
+
+    with pytest.raises((OSError, ValueError)):
+        verify_archive(path, workers=workers)